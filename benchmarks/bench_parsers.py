@@ -0,0 +1,141 @@
+"""Benchmark the current VTT/SRT parsers against the regex parsers they replaced.
+
+Usage:
+    python benchmarks/bench_parsers.py [--cues 100000] [--repeat 3]
+
+Generates synthetic subtitle content in memory (WebVTT with cue settings
+and inline tags, numbered SRT) and reports the best wall time of each
+parser, plus two malformed inputs that make the old regexes quadratic: a
+long run of digits (SRT) and a cue full of unclosed ``<`` (VTT tags).
+"""
+
+import argparse
+import re
+import time
+
+from study.core.models import TranscriptSegment
+from study.transcript.parser import parse_srt_text, parse_vtt_text
+
+
+# The pre-rewrite parsers, kept verbatim as the baseline
+def legacy_parse_vtt_text(content: str) -> list[TranscriptSegment]:
+    segments = []
+    pattern = re.compile(
+        r"(\d{1,2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{1,2}:\d{2}:\d{2}\.\d{3})[^\n]*\n((?:(?!\d{1,2}:\d{2}:\d{2}\.\d{3}\s*-->).+\n?)*)",
+    )
+    for match in pattern.finditer(content):
+        start_ts, end_ts, text_block = match.group(1), match.group(2), match.group(3)
+        text = re.sub(r"<[^>]+>", "", text_block).strip()
+        if not text:
+            continue
+        start = _legacy_timestamp(start_ts)
+        end = _legacy_timestamp(end_ts)
+        segments.append(
+            TranscriptSegment(text=text, start=round(start, 3), duration=round(end - start, 3))
+        )
+    return segments
+
+
+def legacy_parse_srt_text(content: str) -> list[TranscriptSegment]:
+    segments = []
+    pattern = re.compile(
+        r"\d+\s*\n(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n((?:(?!\d+\s*\n\d{2}:\d{2}:\d{2}).+\n?)*)",
+    )
+    for match in pattern.finditer(content):
+        start_ts, end_ts, text_block = match.group(1), match.group(2), match.group(3)
+        text = text_block.strip()
+        if not text:
+            continue
+        start = _legacy_timestamp(start_ts.replace(",", "."))
+        end = _legacy_timestamp(end_ts.replace(",", "."))
+        segments.append(
+            TranscriptSegment(text=text, start=round(start, 3), duration=round(end - start, 3))
+        )
+    return segments
+
+
+def _legacy_timestamp(ts: str) -> float:
+    h, m, s = ts.strip().split(":")
+    return int(h) * 3600 + int(m) * 60 + float(s)
+
+
+def _timestamp(seconds: float, sep: str) -> str:
+    ms = round(seconds * 1000)
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{sep}{ms:03d}"
+
+
+def make_vtt(cues: int) -> str:
+    lines = ["WEBVTT", "Kind: captions", "Language: en", ""]
+    for i in range(cues):
+        start, end = i * 2.0, i * 2.0 + 2.0
+        lines.append(f"{_timestamp(start, '.')} --> {_timestamp(end, '.')} align:start position:0%")
+        lines.append(f"word {i}<00:00:00.500><c> next</c><c> words</c>")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def make_srt(cues: int) -> str:
+    lines = []
+    for i in range(cues):
+        start, end = i * 2.0, i * 2.0 + 2.0
+        lines.append(str(i + 1))
+        lines.append(f"{_timestamp(start, ',')} --> {_timestamp(end, ',')}")
+        lines.append(f"line {i} of the transcript")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def best_of(repeat: int, parse, content: str) -> tuple[float, int]:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = len(parse(content))
+        best = min(best, time.perf_counter() - started)
+    return best, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--malformed", type=int, default=20_000,
+        help="size of the malformed inputs (0 to skip them)",
+    )
+    args = parser.parse_args()
+
+    # (name, content, legacy parser, current parser, legacy repeats)
+    cases = [
+        (f"vtt, {args.cues} cues", make_vtt(args.cues),
+         legacy_parse_vtt_text, parse_vtt_text, args.repeat),
+        (f"srt, {args.cues} cues", make_srt(args.cues),
+         legacy_parse_srt_text, parse_srt_text, args.repeat),
+    ]
+    if args.malformed:
+        # Too slow to repeat on the regex parsers
+        cases += [
+            (f"srt, {args.malformed}-digit line", "1" * args.malformed + "\n",
+             legacy_parse_srt_text, parse_srt_text, 1),
+            (f"vtt, {args.malformed} unclosed tags",
+             "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\n" + "<" * args.malformed + "\n",
+             legacy_parse_vtt_text, parse_vtt_text, 1),
+        ]
+
+    print(f"{'case':<28} {'regex':>10} {'current':>12} {'speedup':>8}")
+    for name, content, legacy, current, legacy_repeat in cases:
+        legacy_time, legacy_count = best_of(legacy_repeat, legacy, content)
+        current_time, current_count = best_of(args.repeat, current, content)
+        if legacy_count != current_count:
+            raise SystemExit(f"{name}: parsers disagree ({legacy_count} vs {current_count} cues)")
+        print(
+            f"{name:<28} {legacy_time:>9.3f}s {current_time:>11.3f}s "
+            f"{legacy_time / current_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
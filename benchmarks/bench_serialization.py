@@ -0,0 +1,136 @@
+"""Benchmark transcript save/load through study.core.serialization.
+
+Usage:
+    python benchmarks/bench_serialization.py [--count 500] [--segments 1500] [--repeat 3]
+
+Writes ``--count`` synthetic transcripts to a temp dir and loads them back,
+comparing the code path before the serialization layer (``asdict`` plus
+``json`` on save, a TranscriptSegment per item on load) with the current
+one on every codec available here (``json`` always; ``orjson`` and
+``msgspec`` when installed). Reports the best wall time of each.
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from study.core import serialization
+from study.core.models import TranscriptResult, TranscriptSegment
+from study.core.serialization import read_json, transcript_from_dict, transcript_to_dict, write_json
+
+
+# The models and storage code before the serialization layer, as the baseline
+@dataclass
+class LegacySegment:
+    text: str
+    start: float
+    duration: float
+
+
+@dataclass
+class LegacyResult:
+    id: str
+    title: str
+    channel: str
+    upload_date: str
+    webpage_url: str
+    transcript: list[LegacySegment] = field(default_factory=list)
+    language: str = ""
+    alt_transcripts: dict = field(default_factory=dict)
+    chapters: list = field(default_factory=list)
+
+    @property
+    def full_text(self) -> str:
+        return " ".join(seg.text for seg in self.transcript)
+
+
+def legacy_save(path: Path, result: LegacyResult) -> None:
+    data = asdict(result)
+    data["full_text"] = result.full_text
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def legacy_load(path: Path) -> LegacyResult:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return LegacyResult(
+        id=data["id"],
+        title=data["title"],
+        channel=data["channel"],
+        upload_date=data["upload_date"],
+        webpage_url=data["webpage_url"],
+        transcript=[
+            LegacySegment(text=seg["text"], start=seg["start"], duration=seg["duration"])
+            for seg in data.get("transcript", [])
+        ],
+        language=data.get("language", ""),
+    )
+
+
+def make_segments(rng: random.Random, count: int) -> list[tuple[str, float, float]]:
+    words = "the graph node edge memory cache parser value function table ação".split()
+    return [
+        (" ".join(rng.choices(words, k=rng.randint(3, 12))), round(i * 2.4, 3), 2.4)
+        for i in range(count)
+    ]
+
+
+def timed(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500, help="transcripts")
+    parser.add_argument("--segments", type=int, default=1500, help="segments per transcript")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    rows = [make_segments(rng, args.segments) for _ in range(args.count)]
+    meta = dict(title="Lecture", channel="Channel", upload_date="20240101",
+                webpage_url="https://www.youtube.com/watch?v=x")
+    legacy = [
+        LegacyResult(id=f"v{i:05d}", transcript=[LegacySegment(*row) for row in segs], **meta)
+        for i, segs in enumerate(rows)
+    ]
+    current = [
+        TranscriptResult(id=f"v{i:05d}", transcript=[TranscriptSegment(*row) for row in segs], **meta)
+        for i, segs in enumerate(rows)
+    ]
+
+    codecs = [name for name in serialization.CODECS if name == "json" or getattr(serialization, name)]
+    print(f"{args.count} transcripts x {args.segments} segments")
+    print(f"{'path':<22} {'save':>9} {'load':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"{result.id}.json" for result in legacy]
+
+        save = timed(args.repeat, lambda: [legacy_save(p, r) for p, r in zip(paths, legacy)])
+        load = timed(args.repeat, lambda: [legacy_load(p) for p in paths])
+        print(f"{'before (asdict/json)':<22} {save:>8.3f}s {load:>8.3f}s")
+
+        default = serialization.CODEC
+        try:
+            for codec in codecs:
+                serialization.CODEC = codec
+                save = timed(args.repeat, lambda: [
+                    write_json(p, transcript_to_dict(r)) for p, r in zip(paths, current)
+                ])
+                load = timed(args.repeat, lambda: [
+                    transcript_from_dict(read_json(p)) for p in paths
+                ])
+                print(f"{'serialization/' + codec:<22} {save:>8.3f}s {load:>8.3f}s")
+        finally:
+            serialization.CODEC = default
+
+
+if __name__ == "__main__":
+    main()
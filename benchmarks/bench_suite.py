@@ -0,0 +1,164 @@
+"""Subtitle parser benchmark suite on deterministic synthetic files.
+
+Usage:
+    python benchmarks/bench_suite.py [--lengths 1m,10m,1h,10h] [--formats json3,vtt,srt]
+        [--styles clean,rolling,malformed] [--repeat 3] [--output results.json]
+        [--compare previous.json] [--threshold 0.2] [--min-time 0.005]
+
+For every format x length x style it writes a file with ``synthetic.py``,
+times ``parse_subtitle_file`` (best of ``--repeat`` runs), then parses it
+once more under tracemalloc for the peak memory. Results go to a JSON file
+keyed by case, so runs on different commits can be compared with
+``--compare``: cases that got slower or hungrier by more than
+``--threshold`` are listed and the script exits with status 1. Timings
+under ``--min-time`` seconds are too noisy to flag.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from synthetic import FORMATS, STYLES, write
+
+from study.transcript.parser import dedupe_segments, parse_subtitle_file
+
+LENGTHS = {"1m": 60, "10m": 600, "1h": 3600, "10h": 36000}
+
+
+def _case_key(result: dict) -> str:
+    return f"{result['format']}/{result['length']}/{result['style']}"
+
+
+def run_case(path: Path, fmt: str, repeat: int) -> dict:
+    best = float("inf")
+    segments = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        segments = parse_subtitle_file(path, fmt)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    parse_subtitle_file(path, fmt)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    _, stats = dedupe_segments(segments)
+    size = path.stat().st_size
+    return {
+        "file_bytes": size,
+        "segments": len(segments),
+        "seconds": round(best, 6),
+        "mb_per_s": round(size / best / 1e6, 2) if best else None,
+        "peak_bytes": peak,
+        "dedup_ratio": round(stats.ratio, 4),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    current: list[dict], previous_path: Path, threshold: float, min_time: float
+) -> list[str]:
+    """Print time/memory ratios against a previous run; return the regressions."""
+    previous = {_case_key(r): r for r in json.loads(previous_path.read_text())["results"]}
+    regressions = []
+    print(f"\nagainst {previous_path}:")
+    print(f"{'case':<26} {'time':>8} {'memory':>8}")
+    for result in current:
+        key = _case_key(result)
+        before = previous.get(key)
+        if before is None:
+            continue
+        time_ratio = result["seconds"] / before["seconds"] if before["seconds"] else 1.0
+        memory_ratio = result["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else 1.0
+        slower = time_ratio > 1 + threshold and max(result["seconds"], before["seconds"]) >= min_time
+        flag = ""
+        if slower or memory_ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"{key:<26} {time_ratio:>7.2f}x {memory_ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def _choices(value: str, allowed) -> list[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown: {', '.join(unknown)}")
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", default="1m,10m,1h,10h",
+                        type=lambda v: _choices(v, LENGTHS))
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        type=lambda v: _choices(v, FORMATS))
+    parser.add_argument("--styles", default=",".join(STYLES),
+                        type=lambda v: _choices(v, STYLES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("bench-results.json"))
+    parser.add_argument("--compare", type=Path, help="previous results file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown or memory growth reported as a regression")
+    parser.add_argument("--min-time", type=float, default=0.005,
+                        help="ignore slowdowns of cases faster than this many seconds")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'case':<26} {'size':>9} {'segments':>9} {'time':>9} {'MB/s':>7} {'peak':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.formats:
+            for length in args.lengths:
+                for style in args.styles:
+                    path = write(Path(tmp), fmt, LENGTHS[length], style, args.seed)
+                    result = {"format": fmt, "length": length, "style": style}
+                    result.update(run_case(path, fmt, args.repeat))
+                    path.unlink()
+                    results.append(result)
+                    print(
+                        f"{_case_key(result):<26} {result['file_bytes'] / 1e6:>7.2f}MB "
+                        f"{result['segments']:>9} {result['seconds']:>8.3f}s "
+                        f"{result['mb_per_s'] or 0:>7.1f} {result['peak_bytes'] / 1e6:>7.2f}MB"
+                    )
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold, args.min_time)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Deterministic synthetic subtitle files for parser benchmarks.
+
+Every file is a function of (format, length, style, seed), so two runs of
+the suite parse byte-identical input and their timings can be compared.
+
+Styles:
+
+- ``clean`` -- manual subtitles: one or two lines per cue, no overlap
+- ``rolling`` -- YouTube auto-captions: word-level timing, and in VTT/SRT
+  each line shown twice as the caption scrolls, with 10 ms hold cues
+- ``malformed`` -- clean captions with broken timestamps, garbage lines,
+  missing blank lines, unclosed tags and odd json3 events mixed in
+"""
+
+import json
+import random
+from pathlib import Path
+
+FORMATS = ("json3", "vtt", "srt")
+STYLES = ("clean", "rolling", "malformed")
+
+WORDS = (
+    "the of and to in is that we graph node edge memory cache request parser "
+    "so now this will look at how why it matters here next example value "
+    "function list table index time first second number result data model"
+).split()
+
+
+def _rng(fmt: str, seconds: int, style: str, seed: int) -> random.Random:
+    return random.Random(f"{fmt}:{seconds}:{style}:{seed}")
+
+
+def _timestamp(ms: int, sep: str = ".") -> str:
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{sep}{ms:03d}"
+
+
+def _phrases(rng: random.Random, seconds: int):
+    """Yield ``(start_ms, end_ms, words)`` for consecutive spoken phrases."""
+    ms = 0
+    end_of_video = seconds * 1000
+    while ms < end_of_video:
+        words = rng.choices(WORDS, k=rng.randint(3, 9))
+        duration = 300 * len(words) + rng.randint(0, 600)
+        yield ms, min(ms + duration, end_of_video), words
+        ms += duration + rng.choice((0, 0, 0, 200, 1500))
+
+
+def generate(fmt: str, seconds: int, style: str = "clean", seed: int = 0) -> str:
+    """Build the content of a subtitle file covering ``seconds`` of video."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported subtitle format: {fmt}")
+    if style not in STYLES:
+        raise ValueError(f"Unknown style: {style}")
+    rng = _rng(fmt, seconds, style, seed)
+    phrases = _phrases(rng, seconds)
+    if fmt == "json3":
+        return _json3(rng, phrases, style)
+    if style == "rolling":
+        return _rolling_cues(phrases, fmt)
+    return _cues(rng, phrases, fmt, malformed=style == "malformed")
+
+
+def write(
+    directory: Path, fmt: str, seconds: int, style: str = "clean", seed: int = 0
+) -> Path:
+    """Write a generated file as ``{style}-{seconds}s.{fmt}`` and return its path."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{style}-{seconds}s.{fmt}"
+    path.write_text(generate(fmt, seconds, style, seed), encoding="utf-8")
+    return path
+
+
+def _json3(rng: random.Random, phrases, style: str) -> str:
+    events: list = []
+    for start, end, words in phrases:
+        if style == "rolling":
+            # Auto-caption events: one seg per word, offsets within the event,
+            # and a newline event whenever the window scrolls
+            step = (end - start) // len(words)
+            segs = [{"utf8": words[0], "acAsrConf": 0}]
+            segs += [
+                {"utf8": f" {word}", "tOffsetMs": i * step, "acAsrConf": 0}
+                for i, word in enumerate(words[1:], 1)
+            ]
+            events.append({"tStartMs": start, "dDurationMs": end - start + 2000,
+                           "wWinId": 1, "segs": segs})
+            events.append({"tStartMs": end, "dDurationMs": 2000, "wWinId": 1,
+                           "aAppend": 1, "segs": [{"utf8": "\n"}]})
+            continue
+        events.append({"tStartMs": start, "dDurationMs": end - start,
+                       "segs": [{"utf8": " ".join(words)}]})
+        if style == "malformed" and rng.random() < 0.2:
+            events.append(rng.choice((
+                {"tStartMs": start},
+                {"segs": [{"acAsrConf": 0}]},
+                {"tStartMs": start, "dDurationMs": 0, "segs": [{"utf8": ""}, {}]},
+                {"tStartMs": start, "segs": [{"utf8": "[Music]"}]},
+            )))
+    document = {
+        "wireMagic": "pb3",
+        "pens": [{}],
+        "wsWinStyles": [{}, {"mhModeHint": 2, "juJustifCode": 0}],
+        "wpWinPositions": [{}, {"apPoint": 6, "ahHorPos": 20, "avVerPos": 100}],
+        "events": events,
+    }
+    return json.dumps(document, separators=(",", ":"))
+
+
+def _cues(rng: random.Random, phrases, fmt: str, malformed: bool) -> str:
+    sep = "," if fmt == "srt" else "."
+    lines = ["WEBVTT", "Kind: captions", "Language: en", ""] if fmt == "vtt" else []
+    for number, (start, end, words) in enumerate(phrases, 1):
+        timing = f"{_timestamp(start, sep)} --> {_timestamp(end, sep)}"
+        text = " ".join(words)
+        if len(words) > 6:
+            text = " ".join(words[:4]) + "\n" + " ".join(words[4:])
+        if fmt == "srt":
+            lines.append(str(number))
+        elif rng.random() < 0.3:
+            timing += " align:start position:0%"
+        lines += [timing, text, ""]
+        if malformed and rng.random() < 0.2:
+            lines += rng.choice((
+                ["99:99 --> garbage", "lost text", ""],
+                ["1" * rng.randint(100, 2000), ""],
+                [f"{_timestamp(end, sep)} --> ", "no end timestamp", ""],
+                ["<" * rng.randint(10, 500) + " unclosed", ""],
+                ["NOTE stray block --> not a cue", ""],
+            ))
+            if rng.random() < 0.5:
+                # Next cue follows without a blank line
+                lines.pop()
+    return "\n".join(lines) + "\n"
+
+
+def _rolling_cues(phrases, fmt: str) -> str:
+    """Auto-caption layout: the previous line stays on screen above the new one."""
+    sep = "," if fmt == "srt" else "."
+    lines = ["WEBVTT", "Kind: captions", "Language: en", ""] if fmt == "vtt" else []
+    number = 0
+    previous = ""
+    for start, end, words in phrases:
+        step = (end - start) // len(words)
+        if fmt == "vtt":
+            current = words[0] + "".join(
+                f"<{_timestamp(start + i * step)}><c> {word}</c>"
+                for i, word in enumerate(words[1:], 1)
+            )
+            settings = " align:start position:0%"
+        else:
+            current = " ".join(words)
+            settings = ""
+        plain = " ".join(words)
+        for cue_start, cue_end, text in (
+            (start, end - 10, f"{previous or ' '}\n{current}"),
+            (end - 10, end, f"{plain}\n "),
+        ):
+            number += 1
+            if fmt == "srt":
+                lines.append(str(number))
+            lines += [
+                f"{_timestamp(cue_start, sep)} --> {_timestamp(cue_end, sep)}{settings}",
+                text,
+                "",
+            ]
+        previous = plain
+    return "\n".join(lines) + "\n"
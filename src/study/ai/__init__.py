@@ -9,7 +9,9 @@ from study.core.config import Settings
 def create_backend(settings: Settings) -> AIBackend:
     """Create the appropriate AI backend based on settings."""
     if settings.claude_backend == "api":
-        return AnthropicAPIBackend(settings.anthropic_api_key, settings.claude_model)
+        return AnthropicAPIBackend(
+            settings.anthropic_api_key, settings.claude_model, settings.content_lang
+        )
     elif settings.claude_backend == "cli":
-        return ClaudeCliBackend()
+        return ClaudeCliBackend(settings.content_lang)
     raise ValueError(f"Unknown backend: {settings.claude_backend}")
@@ -2,16 +2,20 @@
 
 import logging
 import time
+from collections.abc import Callable
+from typing import TypeVar
 
 import anthropic
 
 from study.ai.base import AIBackend
-from study.ai.prompts import SYSTEM_PROMPT
-from study.ai.schemas import parse_ai_response
+from study.ai.prompts import DEFAULT_CONTENT_LANG
+from study.ai.schemas import parse_ai_response, parse_text_response
 from study.core.models import AIResponse
 
 logger = logging.getLogger("study")
 
+T = TypeVar("T")
+
 MAX_RETRIES = 3
 RETRY_DELAY = 2
 
@@ -19,26 +23,42 @@ RETRY_DELAY = 2
 class AnthropicAPIBackend(AIBackend):
     """AI backend using the Anthropic Python SDK."""
 
-    def __init__(self, api_key: str, model: str):
+    def __init__(self, api_key: str, model: str, content_lang: str = DEFAULT_CONTENT_LANG):
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
+        self.content_lang = content_lang
 
     def process_transcript(self, transcript_text: str, video_title: str) -> AIResponse:
         """Send transcript to Anthropic API and return structured response."""
         prompt = self._build_prompt(transcript_text, video_title)
+        return self._call(self._system_prompt(), prompt, video_title, parse_ai_response)
+
+    def summarize_chapter(
+        self, chapter_text: str, video_title: str, chapter_title: str
+    ) -> str:
+        """Send one chapter to Anthropic API and return its summary."""
+        prompt = self._build_chapter_prompt(chapter_text, video_title, chapter_title)
+        return self._call(
+            self._chapter_system_prompt(),
+            prompt,
+            f"{video_title} / {chapter_title}",
+            parse_text_response,
+        )
 
+    def _call(self, system: str, prompt: str, label: str, parse: Callable[[str], T]) -> T:
+        """Send a prompt with retries, parsing the reply with ``parse``."""
         last_error = None
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                logger.info("API call attempt %d/%d for '%s'", attempt, MAX_RETRIES, video_title)
+                logger.info("API call attempt %d/%d for '%s'", attempt, MAX_RETRIES, label)
                 message = self.client.messages.create(
                     model=self.model,
                     max_tokens=4096,
-                    system=SYSTEM_PROMPT,
+                    system=system,
                     messages=[{"role": "user", "content": prompt}],
                 )
                 raw_text = message.content[0].text
-                return parse_ai_response(raw_text)
+                return parse(raw_text)
             except (anthropic.APIError, ValueError) as e:
                 last_error = e
                 logger.warning("Attempt %d failed: %s", attempt, e)
@@ -2,20 +2,58 @@
 
 from abc import ABC, abstractmethod
 
-from study.ai.prompts import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from study.ai.prompts import (
+    CHAPTER_PROMPT_TEMPLATE,
+    CHAPTER_SYSTEM_PROMPT_TEMPLATE,
+    DEFAULT_CONTENT_LANG,
+    SYSTEM_PROMPT_TEMPLATE,
+    USER_PROMPT_TEMPLATE,
+    language_name,
+)
 from study.core.models import AIResponse
 
 
 class AIBackend(ABC):
-    """Abstract interface for AI processing backends."""
+    """Abstract interface for AI processing backends.
+
+    Responses are written in ``content_lang``.
+    """
+
+    content_lang: str = DEFAULT_CONTENT_LANG
 
     @abstractmethod
     def process_transcript(self, transcript_text: str, video_title: str) -> AIResponse:
         """Send transcript to AI and return structured response."""
 
+    @abstractmethod
+    def summarize_chapter(
+        self, chapter_text: str, video_title: str, chapter_title: str
+    ) -> str:
+        """Send one chapter's transcript to AI and return its Markdown summary."""
+
     def _build_prompt(self, transcript_text: str, video_title: str) -> str:
         """Build the user prompt for the AI."""
         return USER_PROMPT_TEMPLATE.format(
             title=video_title,
             transcript=transcript_text,
+            language=language_name(self.content_lang),
+        )
+
+    def _system_prompt(self) -> str:
+        """System prompt for full-transcript requests."""
+        return SYSTEM_PROMPT_TEMPLATE.format(language=language_name(self.content_lang))
+
+    def _chapter_system_prompt(self) -> str:
+        """System prompt for chapter summary requests."""
+        return CHAPTER_SYSTEM_PROMPT_TEMPLATE.format(language=language_name(self.content_lang))
+
+    def _build_chapter_prompt(
+        self, chapter_text: str, video_title: str, chapter_title: str
+    ) -> str:
+        """Build the user prompt for a chapter summary."""
+        return CHAPTER_PROMPT_TEMPLATE.format(
+            title=video_title,
+            chapter=chapter_title,
+            transcript=chapter_text,
+            language=language_name(self.content_lang),
         )
@@ -0,0 +1,51 @@
+"""Independent, parallel summaries of a video's chapters."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from study.ai.base import AIBackend
+from study.core.config import Settings
+from study.core.models import TranscriptResult
+
+logger = logging.getLogger("study")
+
+
+def summarize_chapters(
+    backend: AIBackend, result: TranscriptResult, settings: Settings
+) -> list[str]:
+    """Summarize each chapter of a long video in its own request.
+
+    Runs only for videos with chapters that last at least
+    ``settings.chapter_summary_min_duration`` seconds (0 disables it), with
+    up to ``settings.ai_workers`` requests in flight. Returns one summary per
+    chapter, in chapter order; chapters that fail or have no transcript get
+    an empty summary.
+    """
+    min_duration = settings.chapter_summary_min_duration
+    if min_duration <= 0 or not result.chapters or result.chapters[-1].end < min_duration:
+        return []
+
+    sections = result.chapter_segments()
+    with ThreadPoolExecutor(max_workers=settings.ai_workers) as pool:
+        futures = [
+            pool.submit(
+                backend.summarize_chapter,
+                segments.full_text,
+                result.title,
+                chapter.title,
+            )
+            if segments
+            else None
+            for chapter, segments in sections
+        ]
+        summaries = []
+        for (chapter, _), future in zip(sections, futures):
+            if future is None:
+                summaries.append("")
+                continue
+            try:
+                summaries.append(future.result())
+            except (RuntimeError, ValueError) as e:
+                logger.error("Chapter summary failed for '%s': %s", chapter.title, e)
+                summaries.append("")
+    return summaries
@@ -3,29 +3,49 @@
 import json
 import logging
 import subprocess
+from collections.abc import Callable
+from typing import TypeVar
 
 from study.ai.base import AIBackend
-from study.ai.prompts import SYSTEM_PROMPT
-from study.ai.schemas import parse_ai_response
+from study.ai.prompts import DEFAULT_CONTENT_LANG
+from study.ai.schemas import parse_ai_response, parse_text_response
 from study.core.models import AIResponse
 
 logger = logging.getLogger("study")
 
+T = TypeVar("T")
+
 MAX_RETRIES = 2
 
 
 class ClaudeCliBackend(AIBackend):
     """AI backend using the Claude Code CLI as a subprocess."""
 
+    def __init__(self, content_lang: str = DEFAULT_CONTENT_LANG):
+        self.content_lang = content_lang
+
     def process_transcript(self, transcript_text: str, video_title: str) -> AIResponse:
         """Invoke claude CLI and return structured response."""
         prompt = self._build_prompt(transcript_text, video_title)
-        full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
+        return self._call(f"{self._system_prompt()}\n\n{prompt}", video_title, parse_ai_response)
+
+    def summarize_chapter(
+        self, chapter_text: str, video_title: str, chapter_title: str
+    ) -> str:
+        """Invoke claude CLI for one chapter and return its summary."""
+        prompt = self._build_chapter_prompt(chapter_text, video_title, chapter_title)
+        return self._call(
+            f"{self._chapter_system_prompt()}\n\n{prompt}",
+            f"{video_title} / {chapter_title}",
+            parse_text_response,
+        )
 
+    def _call(self, full_prompt: str, label: str, parse: Callable[[str], T]) -> T:
+        """Run the CLI with retries, parsing its reply with ``parse``."""
         last_error = None
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                logger.info("CLI call attempt %d/%d for '%s'", attempt, MAX_RETRIES, video_title)
+                logger.info("CLI call attempt %d/%d for '%s'", attempt, MAX_RETRIES, label)
                 result = subprocess.run(
                     ["claude", "-p", full_prompt, "--output-format", "json"],
                     capture_output=True,
@@ -47,7 +67,7 @@ class ClaudeCliBackend(AIBackend):
                 except json.JSONDecodeError:
                     pass
 
-                return parse_ai_response(output)
+                return parse(output)
             except FileNotFoundError:
                 raise RuntimeError(
                     "claude CLI not found. Install it with: npm install -g @anthropic-ai/claude-code"
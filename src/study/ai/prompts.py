@@ -1,17 +1,32 @@
 """Prompt templates for Claude AI processing."""
 
-SYSTEM_PROMPT = (
+DEFAULT_CONTENT_LANG = "pt-BR"
+
+LANGUAGE_NAMES = {
+    "pt-BR": "Brazilian Portuguese",
+    "pt-PT": "European Portuguese",
+    "pt": "Portuguese",
+    "en": "English",
+    "en-US": "American English",
+    "en-GB": "British English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+}
+
+SYSTEM_PROMPT_TEMPLATE = (
     "You are a knowledge extraction assistant. "
-    "You analyze video transcripts and extract structured knowledge in Brazilian Portuguese (pt-BR). "
+    "You analyze video transcripts and extract structured knowledge in {language}. "
     "You always respond with valid JSON, without markdown code fences."
 )
 
 USER_PROMPT_TEMPLATE = (
     'Analise a transcricao do video "{title}" e retorne um JSON com:\n'
     "\n"
-    '1. "tldr": Resumo de 2-3 linhas em portugues (pt-BR)\n'
-    '2. "summary": Resumo detalhado em Markdown, 5-20 paragrafos, em portugues (pt-BR)\n'
-    '3. "concepts": Lista de conceitos-chave, cada um com "name" e "definition" em portugues\n'
+    '1. "tldr": Resumo de 2-3 linhas em {language}\n'
+    '2. "summary": Resumo detalhado em Markdown, 5-20 paragrafos, em {language}\n'
+    '3. "concepts": Lista de conceitos-chave, cada um com "name" e "definition" em {language}\n'
     "\n"
     "Transcricao:\n"
     "---\n"
@@ -20,3 +35,27 @@ USER_PROMPT_TEMPLATE = (
     "\n"
     "Retorne APENAS o JSON valido, sem markdown code fences."
 )
+
+CHAPTER_SYSTEM_PROMPT_TEMPLATE = (
+    "You are a knowledge extraction assistant. "
+    "You summarize one chapter of a video transcript in {language}. "
+    "You respond with plain Markdown only."
+)
+
+CHAPTER_PROMPT_TEMPLATE = (
+    'Resuma o capitulo "{chapter}" do video "{title}" em 1-3 paragrafos '
+    "em Markdown, em {language}.\n"
+    "\n"
+    "Transcricao do capitulo:\n"
+    "---\n"
+    "{transcript}\n"
+    "---\n"
+    "\n"
+    "Retorne APENAS o resumo, sem titulo."
+)
+
+
+def language_name(content_lang: str) -> str:
+    """Describe a language code for prompts, e.g. ``Brazilian Portuguese (pt-BR)``."""
+    name = LANGUAGE_NAMES.get(content_lang)
+    return f"{name} ({content_lang})" if name else content_lang
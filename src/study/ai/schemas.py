@@ -52,3 +52,11 @@ def parse_ai_response(raw_text: str) -> AIResponse:
         raise ValueError(f"Invalid JSON in AI response: {e}") from e
 
     return validate_ai_response(data)
+
+
+def parse_text_response(raw_text: str) -> str:
+    """Parse a plain Markdown response, such as a chapter summary."""
+    text = raw_text.strip()
+    if not text:
+        raise ValueError("Empty AI response")
+    return text
@@ -1,68 +1,109 @@
 """Commands for full pipeline: transcript + AI + notes."""
 
-import json
 import logging
+from collections.abc import Iterable
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
 import typer
 
 from study.ai import create_backend
-from study.core.config import load_settings
+from study.ai.chapters import summarize_chapters
+from study.core.config import Settings, load_settings
 from study.core.models import AIResponse, TranscriptResult
+from study.core.serialization import ai_response_from_dict, ai_response_to_dict, read_json, write_json
 from study.core.state import ProcessingStateManager
 from study.core.utils import setup_logging
 from study.obsidian.channel_note import create_or_update_channel
 from study.obsidian.concept_note import create_or_update_concept
 from study.obsidian.vault import Vault
 from study.obsidian.video_note import create_video_note
-from study.transcript.extractor import extract_transcripts, extract_channel, extract_playlist
+from study.transcript.extractor import iter_transcripts, iter_channel, iter_playlist
+from study.transcript.negative_cache import NegativeCache
+from study.transcript.retry import RetryQueue
 from study.transcript.storage import TranscriptStorage
+from study.transcript.watermarks import ChannelWatermarks
 
 logger = logging.getLogger("study")
 
 ingest_app = typer.Typer(help="Full pipeline: transcript + AI + notes")
 
 
-def _save_ai_response(data_dir: Path, video_id: str, response: AIResponse) -> Path:
-    """Save AIResponse as JSON in data/ai_responses/{video_id}.json."""
+def _ai_response_path(data_dir: Path, video_id: str, content_lang: str | None = None) -> Path:
+    """Path of a saved AIResponse; per-language targets get their own subdirectory."""
     out_dir = data_dir / "ai_responses"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    path = out_dir / f"{video_id}.json"
-    data = {
-        "tldr": response.tldr,
-        "summary": response.summary,
-        "concepts": [{"name": c.name, "definition": c.definition} for c in response.concepts],
-    }
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    if content_lang:
+        out_dir = out_dir / content_lang
+    return out_dir / f"{video_id}.json"
+
+
+def _save_ai_response(
+    data_dir: Path, video_id: str, response: AIResponse, content_lang: str | None = None
+) -> Path:
+    """Save AIResponse as JSON in data/ai_responses/[{content_lang}/]{video_id}.json."""
+    path = _ai_response_path(data_dir, video_id, content_lang)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(path, ai_response_to_dict(response))
     return path
 
 
-def _load_ai_response(data_dir: Path, video_id: str) -> AIResponse | None:
+def _load_ai_response(
+    data_dir: Path, video_id: str, content_lang: str | None = None
+) -> AIResponse | None:
     """Load AIResponse from JSON if it exists."""
-    from study.core.models import Concept
-    path = data_dir / "ai_responses" / f"{video_id}.json"
+    path = _ai_response_path(data_dir, video_id, content_lang)
     if not path.exists():
         return None
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return AIResponse(
-        tldr=data["tldr"],
-        summary=data["summary"],
-        concepts=[Concept(name=c["name"], definition=c["definition"]) for c in data.get("concepts", [])],
-    )
+    return ai_response_from_dict(read_json(path))
+
+
+def _load_target_response(
+    data_dir: Path, video_id: str, content_lang: str | None, default_lang: str
+) -> AIResponse | None:
+    """Load a target's AIResponse, falling back to the pre-target layout.
+
+    Responses saved before ``VAULT_TARGETS`` was configured live directly in
+    ``data/ai_responses/`` and are in the default ``CONTENT_LANG``.
+    """
+    response = _load_ai_response(data_dir, video_id, content_lang)
+    if response is None and content_lang == default_lang:
+        response = _load_ai_response(data_dir, video_id)
+    return response
+
+
+def _targets(settings) -> list[tuple[str | None, Settings]]:
+    """The vault/language targets of a run, as (state key, target settings).
+
+    Without ``VAULT_TARGETS`` the run has a single target, ``VAULT_PATH`` in
+    ``CONTENT_LANG``, tracked by the top-level processing state.
+    """
+    if not settings.vault_targets:
+        return [(None, settings)]
+    return [
+        (target.key, replace(settings, vault_path=target.vault_path, content_lang=target.content_lang))
+        for target in settings.vault_targets
+    ]
 
 
 def _run_pipeline(
-    results: list[TranscriptResult],
+    results: Iterable[TranscriptResult],
     settings,
     storage: TranscriptStorage,
     state: ProcessingStateManager,
     force: bool,
     reprocess: bool,
 ) -> dict:
-    """Run the full pipeline on a list of TranscriptResults. Returns summary counts."""
-    vault = Vault(settings.vault_path)
-    vault.ensure_structure()
+    """Run the full pipeline on TranscriptResults as they arrive. Returns summary counts.
+
+    Each transcript is saved once, then processed with AI and turned into
+    notes for every vault/language target. Targets sharing a language share
+    one AI response. Stored transcripts that a target is still missing are
+    left to ``study process --all`` (see ``catch_up_targets``).
+    """
+    targets = _targets(settings)
+    for _, target_settings in targets:
+        Vault(target_settings.vault_path).ensure_structure()
 
     counts = {"transcripts_saved": 0, "transcripts_skipped": 0, "ai_processed": 0, "ai_failed": 0, "notes_generated": 0}
 
@@ -77,47 +118,130 @@ def _run_pipeline(
             logger.info("Transcript saved: %s", result.title)
             counts["transcripts_saved"] += 1
 
-        # Step 2: AI processing
-        ai_response = None
-        if state.is_ai_processed(result.id) and not reprocess:
-            logger.info("AI already processed: %s", result.title)
-            ai_response = _load_ai_response(settings.data_dir, result.id)
+        responses: dict[str, AIResponse] = {}
+        for target, target_settings in targets:
+            _run_target(
+                result, target, target_settings, state, reprocess, counts, responses,
+                settings.content_lang,
+            )
+        if settings.vault_targets:
+            state.complete_targets(result.id, (target for target, _ in targets))
+
+    return counts
+
+
+def catch_up_targets(
+    settings,
+    storage: TranscriptStorage,
+    state: ProcessingStateManager,
+    video_ids: Iterable[str] | None = None,
+    reprocess: bool = False,
+) -> dict:
+    """Run the missing AI and note stages of stored transcripts for each target.
+
+    Videos already extracted are dropped from listings before they reach the
+    pipeline, so a vault added to the targets later is filled from the
+    stored transcripts instead of re-extracting them. Without ``video_ids``,
+    every stored transcript that some target is missing is processed.
+    Returns summary counts like ``_run_pipeline``.
+    """
+    targets = _targets(settings)
+    for _, target_settings in targets:
+        Vault(target_settings.vault_path).ensure_structure()
+
+    counts = {"transcripts_saved": 0, "transcripts_skipped": 0, "ai_processed": 0, "ai_failed": 0, "notes_generated": 0}
+
+    if video_ids is None:
+        pending: set[str] = set()
+        for target, _ in targets:
+            pending.update(state.pending_for_target(target))
+    else:
+        pending = set(video_ids)
+    if not pending:
+        return counts
+
+    typer.echo(f"Processing {len(pending)} stored transcript(s) for vault targets")
+    for result in storage.load_many(pending):
+        responses: dict[str, AIResponse] = {}
+        for target, target_settings in targets:
+            _run_target(
+                result, target, target_settings, state, reprocess, counts, responses,
+                settings.content_lang,
+            )
+        state.complete_targets(result.id, (target for target, _ in targets))
+    return counts
+
+
+def _run_target(
+    result: TranscriptResult,
+    target: str | None,
+    settings,
+    state: ProcessingStateManager,
+    reprocess: bool,
+    counts: dict,
+    responses: dict[str, AIResponse],
+    default_lang: str,
+) -> None:
+    """Run the AI and note stages of one transcript for one target.
+
+    ``default_lang`` is the run's ``CONTENT_LANG``, whose AI responses may
+    still be stored in the layout from before targets were configured.
+    """
+    # Targets are stored per language; the single default target keeps the old layout
+    lang = settings.content_lang if target is not None else None
+
+    # Step 2: AI processing
+    ai_response = responses.get(settings.content_lang)
+    if ai_response is not None:
+        # Another target in the same language processed it during this run
+        state.update(result.id, target=target, ai_processed=True)
+    elif state.is_ai_processed(result.id, target) and not reprocess:
+        logger.info("AI already processed: %s", result.title)
+        ai_response = _load_target_response(settings.data_dir, result.id, lang, default_lang)
+    else:
+        if lang and not reprocess:
+            # Saved earlier for another target, or before targets were set
+            ai_response = _load_target_response(settings.data_dir, result.id, lang, default_lang)
+        if ai_response is not None:
+            logger.info("Reusing %s AI response: %s", lang, result.title)
+            state.update(result.id, target=target, ai_processed=True)
         else:
             typer.echo(f"  Processing with AI: {result.title}")
             try:
                 backend = create_backend(settings)
                 ai_response = backend.process_transcript(result.full_text, result.title)
-                _save_ai_response(settings.data_dir, result.id, ai_response)
-                state.update(result.id, ai_processed=True)
+                ai_response.chapter_summaries = summarize_chapters(backend, result, settings)
+                _save_ai_response(settings.data_dir, result.id, ai_response, lang)
+                state.update(result.id, target=target, ai_processed=True)
                 counts["ai_processed"] += 1
             except (RuntimeError, ValueError) as e:
                 logger.error("AI processing failed for %s: %s", result.id, e)
                 typer.echo(f"  AI failed for {result.id}: {e}")
                 counts["ai_failed"] += 1
-                continue
+                return
 
-        if ai_response is None:
-            logger.warning("No AI response for %s, skipping notes", result.id)
-            continue
+    if ai_response is None:
+        logger.warning("No AI response for %s, skipping notes", result.id)
+        return
+    responses[settings.content_lang] = ai_response
 
-        # Step 3: Generate Obsidian notes
-        if state.is_notes_generated(result.id) and not reprocess:
-            logger.info("Notes already generated: %s", result.title)
-            continue
+    # Step 3: Generate Obsidian notes
+    if state.is_notes_generated(result.id, target) and not reprocess:
+        logger.info("Notes already generated: %s", result.title)
+        return
 
-        create_video_note(vault, result, ai_response)
-
-        for concept in ai_response.concepts:
-            create_or_update_concept(vault, concept, result.title)
+    vault = Vault(settings.vault_path)
+    create_video_note(vault, result, ai_response)
 
-        channel_url = result.webpage_url.rsplit("/watch", 1)[0] if "/watch" in result.webpage_url else result.webpage_url
-        create_or_update_channel(vault, result.channel, channel_url, result.title)
+    for concept in ai_response.concepts:
+        create_or_update_concept(vault, concept, result.title)
 
-        state.update(result.id, notes_generated=True)
-        counts["notes_generated"] += 1
-        typer.echo(f"  Notes generated: {result.title}")
+    channel_url = result.webpage_url.rsplit("/watch", 1)[0] if "/watch" in result.webpage_url else result.webpage_url
+    create_or_update_channel(vault, result.channel, channel_url, result.title)
 
-    return counts
+    state.update(result.id, target=target, notes_generated=True)
+    counts["notes_generated"] += 1
+    typer.echo(f"  Notes generated: {result.title}")
 
 
 def _print_summary(counts: dict) -> None:
@@ -136,10 +260,13 @@ def video(
     url: str,
     backend: Optional[str] = typer.Option(None, help="AI backend: api or cli"),
     model: Optional[str] = typer.Option(None, help="Claude model override"),
-    lang: str = typer.Option("en", help="Subtitle language"),
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
     format: str = typer.Option("json3", help="Subtitle format"),
     force: bool = typer.Option(False, help="Re-extract transcript"),
     reprocess: bool = typer.Option(False, help="Re-process with AI"),
+    target: Optional[list[str]] = typer.Option(
+        None, "--target", help="Vault target LANG=PATH, repeatable (default: VAULT_PATH)"
+    ),
     verbose: bool = typer.Option(False, help="Verbose output"),
 ) -> None:
     """Ingest a single video: extract transcript, process with AI, generate notes."""
@@ -149,13 +276,24 @@ def video(
         overrides["claude_backend"] = backend
     if model:
         overrides["claude_model"] = model
+    if target:
+        overrides["vault_targets"] = ";".join(target)
 
     settings = load_settings(**overrides)
     storage = TranscriptStorage(settings.data_dir)
     state = ProcessingStateManager(settings.data_dir / "processing_state.json")
 
     typer.echo(f"Ingesting video: {url}")
-    results = extract_transcripts([url], settings, state=state, force=force)
+    retries = RetryQueue(settings.data_dir / "retry_queue.json")
+    unavailable = NegativeCache(settings.data_dir / "negative_cache.json")
+    results = iter_transcripts(
+        [url],
+        settings,
+        state=state,
+        force=force,
+        retries=retries,
+        unavailable=unavailable,
+    )
     counts = _run_pipeline(results, settings, storage, state, force, reprocess)
     _print_summary(counts)
 
@@ -165,11 +303,21 @@ def playlist(
     url: str,
     backend: Optional[str] = typer.Option(None, help="AI backend: api or cli"),
     model: Optional[str] = typer.Option(None, help="Claude model override"),
-    lang: str = typer.Option("en", help="Subtitle language"),
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
     format: str = typer.Option("json3", help="Subtitle format"),
     after: Optional[str] = typer.Option(None, help="Only videos after YYYYMMDD"),
     force: bool = typer.Option(False, help="Re-extract transcript"),
     reprocess: bool = typer.Option(False, help="Re-process with AI"),
+    jobs: Optional[int] = typer.Option(None, help="Parallel extraction workers"),
+    min_duration: Optional[int] = typer.Option(None, help="Minimum duration in seconds"),
+    max_duration: Optional[int] = typer.Option(None, help="Maximum duration in seconds"),
+    no_shorts: bool = typer.Option(False, "--no-shorts", help="Skip YouTube Shorts"),
+    no_live: bool = typer.Option(False, "--no-live", help="Skip livestreams and premieres"),
+    title_include: Optional[str] = typer.Option(None, help="Only titles matching this regex"),
+    title_exclude: Optional[str] = typer.Option(None, help="Skip titles matching this regex"),
+    target: Optional[list[str]] = typer.Option(
+        None, "--target", help="Vault target LANG=PATH, repeatable (default: VAULT_PATH)"
+    ),
     verbose: bool = typer.Option(False, help="Verbose output"),
 ) -> None:
     """Ingest all videos from a playlist."""
@@ -179,13 +327,34 @@ def playlist(
         overrides["claude_backend"] = backend
     if model:
         overrides["claude_model"] = model
+    if target:
+        overrides["vault_targets"] = ";".join(target)
+    if jobs:
+        overrides["extract_jobs"] = jobs
+    overrides.update(
+        min_duration=min_duration,
+        max_duration=max_duration,
+        skip_shorts=no_shorts or None,
+        skip_live=no_live or None,
+        title_include=title_include,
+        title_exclude=title_exclude,
+    )
 
     settings = load_settings(**overrides)
     storage = TranscriptStorage(settings.data_dir)
     state = ProcessingStateManager(settings.data_dir / "processing_state.json")
 
     typer.echo(f"Ingesting playlist: {url}")
-    results = extract_playlist(url, settings, state=state, force=force)
+    retries = RetryQueue(settings.data_dir / "retry_queue.json")
+    unavailable = NegativeCache(settings.data_dir / "negative_cache.json")
+    results = iter_playlist(
+        url,
+        settings,
+        state=state,
+        force=force,
+        retries=retries,
+        unavailable=unavailable,
+    )
     counts = _run_pipeline(results, settings, storage, state, force, reprocess)
     _print_summary(counts)
 
@@ -195,11 +364,21 @@ def channel(
     url: str,
     backend: Optional[str] = typer.Option(None, help="AI backend: api or cli"),
     model: Optional[str] = typer.Option(None, help="Claude model override"),
-    lang: str = typer.Option("en", help="Subtitle language"),
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
     format: str = typer.Option("json3", help="Subtitle format"),
     after: Optional[str] = typer.Option(None, help="Only videos after YYYYMMDD"),
     force: bool = typer.Option(False, help="Re-extract transcript"),
     reprocess: bool = typer.Option(False, help="Re-process with AI"),
+    jobs: Optional[int] = typer.Option(None, help="Parallel extraction workers"),
+    min_duration: Optional[int] = typer.Option(None, help="Minimum duration in seconds"),
+    max_duration: Optional[int] = typer.Option(None, help="Maximum duration in seconds"),
+    no_shorts: bool = typer.Option(False, "--no-shorts", help="Skip YouTube Shorts"),
+    no_live: bool = typer.Option(False, "--no-live", help="Skip livestreams and premieres"),
+    title_include: Optional[str] = typer.Option(None, help="Only titles matching this regex"),
+    title_exclude: Optional[str] = typer.Option(None, help="Skip titles matching this regex"),
+    target: Optional[list[str]] = typer.Option(
+        None, "--target", help="Vault target LANG=PATH, repeatable (default: VAULT_PATH)"
+    ),
     verbose: bool = typer.Option(False, help="Verbose output"),
 ) -> None:
     """Ingest all videos from a channel."""
@@ -209,12 +388,36 @@ def channel(
         overrides["claude_backend"] = backend
     if model:
         overrides["claude_model"] = model
+    if target:
+        overrides["vault_targets"] = ";".join(target)
+    if jobs:
+        overrides["extract_jobs"] = jobs
+    overrides.update(
+        min_duration=min_duration,
+        max_duration=max_duration,
+        skip_shorts=no_shorts or None,
+        skip_live=no_live or None,
+        title_include=title_include,
+        title_exclude=title_exclude,
+    )
 
     settings = load_settings(**overrides)
     storage = TranscriptStorage(settings.data_dir)
     state = ProcessingStateManager(settings.data_dir / "processing_state.json")
+    watermarks = ChannelWatermarks(settings.data_dir / "channel_watermarks.json")
 
     typer.echo(f"Ingesting channel: {url}")
-    results = extract_channel(url, settings, after_date=after, state=state, force=force)
+    retries = RetryQueue(settings.data_dir / "retry_queue.json")
+    unavailable = NegativeCache(settings.data_dir / "negative_cache.json")
+    results = iter_channel(
+        url,
+        settings,
+        after_date=after,
+        state=state,
+        force=force,
+        watermarks=watermarks,
+        retries=retries,
+        unavailable=unavailable,
+    )
     counts = _run_pipeline(results, settings, storage, state, force, reprocess)
     _print_summary(counts)
@@ -46,6 +46,16 @@ def status() -> None:
     typer.echo(f"AI processed: {ai_done} completed, {ai_pending} pending")
     typer.echo(f"Notes:        {notes_done} generated, {notes_pending} pending")
 
+    if settings.vault_targets:
+        typer.echo("\nTargets:")
+        for target in settings.vault_targets:
+            target_ai = sum(1 for vid in all_ids if state.is_ai_processed(vid, target.key))
+            target_notes = sum(1 for vid in all_ids if state.is_notes_generated(vid, target.key))
+            typer.echo(
+                f"  {target.content_lang} -> {target.vault_path}: "
+                f"{target_ai} AI processed, {target_notes} notes"
+            )
+
     pending = state.pending_ai_processing()
     if pending:
         typer.echo("\nPending AI processing:")
@@ -78,5 +88,7 @@ def config() -> None:
     typer.echo(f"Claude model:    {settings.claude_model}")
     typer.echo(f"Transcript lang: {settings.transcript_lang}")
     typer.echo(f"Content lang:    {settings.content_lang}")
+    for target in settings.vault_targets:
+        typer.echo(f"Vault target:    {target.content_lang} -> {target.vault_path}")
     typer.echo(f"Subtitle format: {settings.subtitle_format}")
     typer.echo(f"Data dir:        {settings.data_dir}")
@@ -1,6 +1,5 @@
 """Commands for AI processing of existing transcripts."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional
@@ -8,8 +7,11 @@ from typing import Optional
 import typer
 
 from study.ai import create_backend
+from study.ai.chapters import summarize_chapters
+from study.cli.ingest import catch_up_targets
 from study.core.config import load_settings
 from study.core.models import AIResponse
+from study.core.serialization import ai_response_to_dict, write_json
 from study.core.state import ProcessingStateManager
 from study.transcript.storage import TranscriptStorage
 
@@ -23,12 +25,7 @@ def _save_ai_response(data_dir: Path, video_id: str, response: AIResponse) -> Pa
     out_dir = data_dir / "ai_responses"
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{video_id}.json"
-    data = {
-        "tldr": response.tldr,
-        "summary": response.summary,
-        "concepts": [{"name": c.name, "definition": c.definition} for c in response.concepts],
-    }
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(path, ai_response_to_dict(response))
     return path
 
 
@@ -53,6 +50,7 @@ def _process_single(
     backend = create_backend(settings)
     try:
         response = backend.process_transcript(transcript.full_text, transcript.title)
+        response.chapter_summaries = summarize_chapters(backend, transcript, settings)
     except RuntimeError as e:
         typer.echo(f"  Error processing {video_id}: {e}")
         return False
@@ -70,14 +68,23 @@ def run(
     reprocess: bool = typer.Option(False, "--reprocess", help="Force reprocessing"),
     backend: Optional[str] = typer.Option(None, help="AI backend: api or cli"),
     model: Optional[str] = typer.Option(None, help="Claude model override"),
+    target: Optional[list[str]] = typer.Option(
+        None, "--target", help="Vault target LANG=PATH, repeatable (default: VAULT_TARGETS)"
+    ),
     verbose: bool = typer.Option(False, "--verbose", help="Verbose output"),
 ) -> None:
-    """Process transcript(s) with AI."""
+    """Process transcript(s) with AI.
+
+    With vault targets, also writes the notes of every target that is still
+    missing them, e.g. to fill a vault added after the videos were ingested.
+    """
     overrides = {}
     if backend:
         overrides["claude_backend"] = backend
     if model:
         overrides["claude_model"] = model
+    if target:
+        overrides["vault_targets"] = ";".join(target)
     if verbose:
         overrides["verbose"] = True
 
@@ -86,7 +93,18 @@ def run(
     state_file = settings.data_dir / "processing_state.json"
     state = ProcessingStateManager(state_file)
 
-    if all_pending:
+    if settings.vault_targets and (all_pending or video_id):
+        counts = catch_up_targets(
+            settings, storage, state, None if all_pending else [video_id], reprocess
+        )
+        if not any(counts.values()):
+            typer.echo("No pending transcripts to process.")
+            return
+        typer.echo(
+            f"\nDone: {counts['ai_processed']} processed, {counts['ai_failed']} failed, "
+            f"{counts['notes_generated']} notes generated"
+        )
+    elif all_pending:
         pending = state.pending_ai_processing()
         if not pending:
             typer.echo("No pending transcripts to process.")
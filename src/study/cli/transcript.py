@@ -1,18 +1,24 @@
 """Commands for transcript extraction only (no AI)."""
 
+from pathlib import Path
+
 import typer
 
 from study.core.config import load_settings
 from study.core.state import ProcessingStateManager
 from study.core.utils import setup_logging, logger
-from study.transcript.extractor import extract_transcripts, extract_channel, extract_playlist
+from study.transcript.extractor import iter_transcripts, iter_channel, iter_playlist
+from study.transcript.importer import import_directory
+from study.transcript.negative_cache import NegativeCache
+from study.transcript.retry import RetryQueue
 from study.transcript.storage import TranscriptStorage
+from study.transcript.watermarks import ChannelWatermarks
 
 transcript_app = typer.Typer(help="Extract and save transcripts (no AI processing)")
 
 
 def _save_results(results, storage, state, force: bool) -> tuple[int, int]:
-    """Save extraction results, returning (saved, skipped) counts."""
+    """Save extraction results as they stream in, returning (saved, skipped) counts."""
     saved = 0
     skipped = 0
     for result in results:
@@ -30,7 +36,7 @@ def _save_results(results, storage, state, force: bool) -> tuple[int, int]:
 @transcript_app.command()
 def video(
     url: str,
-    lang: str = typer.Option("en", help="Subtitle language"),
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
     format: str = typer.Option("json3", help="Subtitle format (json3, vtt, srt)"),
     force: bool = typer.Option(False, help="Re-extract even if already exists"),
     verbose: bool = typer.Option(False, help="Enable verbose output"),
@@ -43,7 +49,17 @@ def video(
     storage = TranscriptStorage(settings.data_dir)
     state = ProcessingStateManager(settings.data_dir / "processing_state.json")
 
-    results = extract_transcripts([url], settings, state=state, force=force)
+    retries = RetryQueue(settings.data_dir / "retry_queue.json")
+    unavailable = NegativeCache(settings.data_dir / "negative_cache.json")
+
+    results = iter_transcripts(
+        [url],
+        settings,
+        state=state,
+        force=force,
+        retries=retries,
+        unavailable=unavailable,
+    )
     saved, skipped = _save_results(results, storage, state, force)
 
     typer.echo(f"Done: {saved} saved, {skipped} skipped")
@@ -52,20 +68,46 @@ def video(
 @transcript_app.command()
 def playlist(
     url: str,
-    lang: str = typer.Option("en", help="Subtitle language"),
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
     format: str = typer.Option("json3", help="Subtitle format"),
     force: bool = typer.Option(False, help="Re-extract even if already exists"),
+    jobs: int | None = typer.Option(None, help="Parallel extraction workers"),
+    min_duration: int | None = typer.Option(None, help="Minimum duration in seconds"),
+    max_duration: int | None = typer.Option(None, help="Maximum duration in seconds"),
+    no_shorts: bool = typer.Option(False, "--no-shorts", help="Skip YouTube Shorts"),
+    no_live: bool = typer.Option(False, "--no-live", help="Skip livestreams and premieres"),
+    title_include: str | None = typer.Option(None, help="Only titles matching this regex"),
+    title_exclude: str | None = typer.Option(None, help="Skip titles matching this regex"),
     verbose: bool = typer.Option(False, help="Enable verbose output"),
 ) -> None:
     """Extract transcripts from a playlist."""
     setup_logging(verbose)
     settings = load_settings(
-        transcript_lang=lang, subtitle_format=format, verbose=verbose
+        transcript_lang=lang,
+        subtitle_format=format,
+        verbose=verbose,
+        extract_jobs=jobs,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        skip_shorts=no_shorts or None,
+        skip_live=no_live or None,
+        title_include=title_include,
+        title_exclude=title_exclude,
     )
     storage = TranscriptStorage(settings.data_dir)
     state = ProcessingStateManager(settings.data_dir / "processing_state.json")
 
-    results = extract_playlist(url, settings, state=state, force=force)
+    retries = RetryQueue(settings.data_dir / "retry_queue.json")
+    unavailable = NegativeCache(settings.data_dir / "negative_cache.json")
+
+    results = iter_playlist(
+        url,
+        settings,
+        state=state,
+        force=force,
+        retries=retries,
+        unavailable=unavailable,
+    )
     saved, skipped = _save_results(results, storage, state, force)
 
     typer.echo(f"Done: {saved} saved, {skipped} skipped")
@@ -74,21 +116,123 @@ def playlist(
 @transcript_app.command()
 def channel(
     url: str,
-    lang: str = typer.Option("en", help="Subtitle language"),
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
     format: str = typer.Option("json3", help="Subtitle format"),
     after: str | None = typer.Option(None, help="Only videos after YYYYMMDD"),
     force: bool = typer.Option(False, help="Re-extract even if already exists"),
+    jobs: int | None = typer.Option(None, help="Parallel extraction workers"),
+    min_duration: int | None = typer.Option(None, help="Minimum duration in seconds"),
+    max_duration: int | None = typer.Option(None, help="Maximum duration in seconds"),
+    no_shorts: bool = typer.Option(False, "--no-shorts", help="Skip YouTube Shorts"),
+    no_live: bool = typer.Option(False, "--no-live", help="Skip livestreams and premieres"),
+    title_include: str | None = typer.Option(None, help="Only titles matching this regex"),
+    title_exclude: str | None = typer.Option(None, help="Skip titles matching this regex"),
     verbose: bool = typer.Option(False, help="Enable verbose output"),
 ) -> None:
     """Extract transcripts from a channel."""
     setup_logging(verbose)
     settings = load_settings(
-        transcript_lang=lang, subtitle_format=format, verbose=verbose
+        transcript_lang=lang,
+        subtitle_format=format,
+        verbose=verbose,
+        extract_jobs=jobs,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        skip_shorts=no_shorts or None,
+        skip_live=no_live or None,
+        title_include=title_include,
+        title_exclude=title_exclude,
     )
     storage = TranscriptStorage(settings.data_dir)
     state = ProcessingStateManager(settings.data_dir / "processing_state.json")
-
-    results = extract_channel(url, settings, after_date=after, state=state, force=force)
+    watermarks = ChannelWatermarks(settings.data_dir / "channel_watermarks.json")
+    retries = RetryQueue(settings.data_dir / "retry_queue.json")
+    unavailable = NegativeCache(settings.data_dir / "negative_cache.json")
+
+    results = iter_channel(
+        url,
+        settings,
+        after_date=after,
+        state=state,
+        force=force,
+        watermarks=watermarks,
+        retries=retries,
+        unavailable=unavailable,
+    )
     saved, skipped = _save_results(results, storage, state, force)
 
     typer.echo(f"Done: {saved} saved, {skipped} skipped")
+
+
+@transcript_app.command()
+def retry(
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
+    format: str = typer.Option("json3", help="Subtitle format"),
+    jobs: int | None = typer.Option(None, help="Parallel extraction workers"),
+    verbose: bool = typer.Option(False, help="Enable verbose output"),
+) -> None:
+    """Retry failed videos whose backoff has expired."""
+    setup_logging(verbose)
+    settings = load_settings(
+        transcript_lang=lang, subtitle_format=format, verbose=verbose, extract_jobs=jobs
+    )
+    storage = TranscriptStorage(settings.data_dir)
+    state = ProcessingStateManager(settings.data_dir / "processing_state.json")
+    retries = RetryQueue(settings.data_dir / "retry_queue.json")
+    unavailable = NegativeCache(settings.data_dir / "negative_cache.json")
+
+    urls = []
+    for entry in retries.due():
+        if state.is_transcript_extracted(entry.video_id):
+            retries.remove(entry.video_id)
+            continue
+        urls.append(entry.url)
+
+    if not urls:
+        typer.echo(f"Nothing due ({len(retries)} queued)")
+        return
+
+    results = iter_transcripts(
+        urls,
+        settings,
+        state=state,
+        retries=retries,
+        unavailable=unavailable,
+    )
+    saved, skipped = _save_results(results, storage, state, force=False)
+
+    typer.echo(f"Done: {saved} saved, {skipped} skipped, {len(retries)} still queued")
+
+
+@transcript_app.command("import")
+def import_(
+    directory: Path = typer.Argument(
+        ..., exists=True, file_okay=False, help="Directory of subtitle files"
+    ),
+    lang: str = typer.Option("en", help="Subtitle language priority list, e.g. en,pt,*"),
+    force: bool = typer.Option(False, help="Re-import even if already extracted"),
+    workers: int | None = typer.Option(None, help="Parsing processes (default: one per CPU)"),
+    dedupe_captions: bool = typer.Option(
+        False, help="Collapse rolling auto-caption repeats (files are kept as written by default)"
+    ),
+    verbose: bool = typer.Option(False, help="Enable verbose output"),
+) -> None:
+    """Import existing .json3/.vtt/.srt files without contacting YouTube."""
+    setup_logging(verbose)
+    settings = load_settings(transcript_lang=lang, verbose=verbose)
+    storage = TranscriptStorage(settings.data_dir)
+    state = ProcessingStateManager(settings.data_dir / "processing_state.json")
+
+    stats = import_directory(
+        directory,
+        settings,
+        storage,
+        state,
+        force=force,
+        workers=workers,
+        dedupe_captions=dedupe_captions,
+    )
+
+    typer.echo(
+        f"Done: {stats.imported} imported, {stats.skipped} skipped, {stats.failed} failed"
+    )
@@ -1,12 +1,40 @@
 """Central configuration loaded from .env with CLI overrides."""
 
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 
+@dataclass
+class Target:
+    """A vault fed by the pipeline, and the language its notes are written in."""
+
+    vault_path: Path
+    content_lang: str
+
+    @property
+    def key(self) -> str:
+        """Identifies the target in the processing state."""
+        return f"{self.content_lang}:{self.vault_path}"
+
+
+def parse_targets(spec: str) -> list[Target]:
+    """Parse ``LANG=PATH`` targets separated by ``;``, e.g. ``pt-BR=~/estudos;en=~/notes``."""
+    targets = []
+    for item in spec.split(";"):
+        item = item.strip()
+        if not item:
+            continue
+        lang, sep, path = item.partition("=")
+        if not sep or not lang.strip() or not path.strip():
+            raise ValueError(f"vault target must look like LANG=PATH, got '{item}'")
+        targets.append(Target(Path(path.strip()).expanduser(), lang.strip()))
+    return targets
+
+
 @dataclass
 class Settings:
     """Application settings."""
@@ -21,6 +49,33 @@ class Settings:
     data_dir: Path
     archive_file: Path
     verbose: bool
+    extract_jobs: int = 1
+    request_rate: float = 2.0
+    subtitle_capture: str = "file"
+    metadata_cache_ttl: int = 21600
+    metadata_cache_size: int = 50000
+    extractor_backend: str = "yt-dlp"
+    replay_dir: Path | None = None
+    replay_latency: float = 0.0
+    replay_failure_rate: float = 0.0
+    parse_workers: int = 0
+    min_duration: int = 0
+    max_duration: int = 0
+    skip_shorts: bool = False
+    skip_live: bool = False
+    title_include: str = ""
+    title_exclude: str = ""
+    chapter_summary_min_duration: int = 0
+    ai_workers: int = 4
+    dedupe_captions: bool = True
+    coalesce_seconds: float = 0.0
+    coalesce_chars: int = 0
+    vault_targets: list[Target] = field(default_factory=list)
+
+    @property
+    def transcript_langs(self) -> list[str]:
+        """Subtitle language priority list, e.g. ``en,en-orig,pt,*``."""
+        return [lang.strip() for lang in self.transcript_lang.split(",") if lang.strip()]
 
 
 def load_settings(**overrides) -> Settings:
@@ -44,13 +99,76 @@ def load_settings(**overrides) -> Settings:
     archive_file_str = _get("archive_file", "")
     archive_file = Path(archive_file_str) if archive_file_str else data_dir / "archive.txt"
     verbose = _get("verbose", "false").lower() in ("true", "1", "yes")
+    extract_jobs = int(_get("extract_jobs", "1"))
+    request_rate = float(_get("request_rate", "2.0"))
+    subtitle_capture = _get("subtitle_capture", "file")
+    metadata_cache_ttl = int(_get("metadata_cache_ttl", "21600"))
+    metadata_cache_size = int(_get("metadata_cache_size", "50000"))
+    extractor_backend = _get("extractor_backend", "yt-dlp")
+    replay_dir_str = _get("replay_dir", "")
+    replay_dir = Path(replay_dir_str) if replay_dir_str else data_dir / "replay"
+    replay_latency = float(_get("replay_latency", "0"))
+    replay_failure_rate = float(_get("replay_failure_rate", "0"))
+    parse_workers = int(_get("parse_workers", "0"))
+    min_duration = int(_get("min_duration", "0"))
+    max_duration = int(_get("max_duration", "0"))
+    skip_shorts = _get("skip_shorts", "false").lower() in ("true", "1", "yes")
+    skip_live = _get("skip_live", "false").lower() in ("true", "1", "yes")
+    title_include = _get("title_include", "")
+    title_exclude = _get("title_exclude", "")
+    chapter_summary_min_duration = int(_get("chapter_summary_min_duration", "0"))
+    ai_workers = int(_get("ai_workers", "4"))
+    dedupe_captions = _get("dedupe_captions", "true").lower() in ("true", "1", "yes")
+    coalesce_seconds = float(_get("coalesce_seconds", "0"))
+    coalesce_chars = int(_get("coalesce_chars", "0"))
+    vault_targets = parse_targets(_get("vault_targets", ""))
 
     if claude_backend not in ("api", "cli"):
         raise ValueError(f"claude_backend must be 'api' or 'cli', got '{claude_backend}'")
 
+    if subtitle_capture not in ("file", "memory"):
+        raise ValueError(
+            f"subtitle_capture must be 'file' or 'memory', got '{subtitle_capture}'"
+        )
+
+    if extractor_backend not in ("yt-dlp", "replay", "record"):
+        raise ValueError(
+            f"extractor_backend must be 'yt-dlp', 'replay' or 'record', got '{extractor_backend}'"
+        )
+
+    if extract_jobs < 1:
+        raise ValueError(f"extract_jobs must be at least 1, got {extract_jobs}")
+
+    if ai_workers < 1:
+        raise ValueError(f"ai_workers must be at least 1, got {ai_workers}")
+
+    if parse_workers < 0:
+        raise ValueError(f"parse_workers must not be negative, got {parse_workers}")
+
+    if coalesce_seconds < 0 or coalesce_chars < 0:
+        raise ValueError("coalesce_seconds and coalesce_chars must not be negative")
+
+    if min_duration < 0 or max_duration < 0:
+        raise ValueError("min_duration and max_duration must not be negative")
+
+    if max_duration and min_duration > max_duration:
+        raise ValueError(
+            f"min_duration ({min_duration}) is greater than max_duration ({max_duration})"
+        )
+
+    for name, pattern in (("title_include", title_include), ("title_exclude", title_exclude)):
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"{name} is not a valid regex: {e}") from e
+
     if str(vault_path) and not vault_path.exists():
         raise ValueError(f"vault_path does not exist: {vault_path}")
 
+    for target in vault_targets:
+        if not target.vault_path.exists():
+            raise ValueError(f"vault target path does not exist: {target.vault_path}")
+
     return Settings(
         vault_path=vault_path,
         claude_backend=claude_backend,
@@ -62,4 +180,26 @@ def load_settings(**overrides) -> Settings:
         data_dir=data_dir,
         archive_file=archive_file,
         verbose=verbose,
+        extract_jobs=extract_jobs,
+        request_rate=request_rate,
+        subtitle_capture=subtitle_capture,
+        metadata_cache_ttl=metadata_cache_ttl,
+        metadata_cache_size=metadata_cache_size,
+        extractor_backend=extractor_backend,
+        replay_dir=replay_dir,
+        replay_latency=replay_latency,
+        replay_failure_rate=replay_failure_rate,
+        parse_workers=parse_workers,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        skip_shorts=skip_shorts,
+        skip_live=skip_live,
+        title_include=title_include,
+        title_exclude=title_exclude,
+        chapter_summary_min_duration=chapter_summary_min_duration,
+        ai_workers=ai_workers,
+        dedupe_captions=dedupe_captions,
+        coalesce_seconds=coalesce_seconds,
+        coalesce_chars=coalesce_chars,
+        vault_targets=vault_targets,
     )
@@ -1,9 +1,24 @@
 """Domain models used across the project."""
 
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 
+# Caption annotations this short ("[Music]", "[Applause]", "(risos)") repeat
+# throughout a video and are interned so every copy shares one string
+INTERN_MAX_LENGTH = 32
 
-@dataclass
+
+def intern_text(text: str) -> str:
+    """Intern a short bracketed caption annotation; other text is returned as-is."""
+    if len(text) <= INTERN_MAX_LENGTH and text[:1] in ("[", "(") and text[-1:] in ("]", ")"):
+        return sys.intern(text)
+    return text
+
+
+@dataclass(slots=True)
 class TranscriptSegment:
     """A single segment of a transcript."""
 
@@ -12,24 +27,190 @@ class TranscriptSegment:
     duration: float
 
 
-@dataclass
+class SegmentTable(Sequence):
+    """Transcript segments packed into flat arrays.
+
+    Segment texts live in one string, joined by single spaces, with an
+    ``offsets`` array marking where each begins; starts and durations are
+    ``array('d')`` columns. That is a few dozen bytes per segment instead of
+    three Python objects, and the full text is the buffer itself.
+
+    Behaves as an immutable sequence of ``TranscriptSegment``: indexing and
+    iteration build segments on demand, slicing returns another table.
+    """
+
+    __slots__ = ("_text", "_offsets", "starts", "durations")
+
+    def __init__(
+        self,
+        text: str = "",
+        offsets: array | None = None,
+        starts: array | None = None,
+        durations: array | None = None,
+    ):
+        self._text = text
+        # offsets[i] is where segment i starts; offsets[-1] is len(text) + 1
+        self._offsets = offsets if offsets is not None else array("q", [0])
+        self.starts = starts if starts is not None else array("d")
+        self.durations = durations if durations is not None else array("d")
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[TranscriptSegment]) -> "SegmentTable":
+        if isinstance(segments, SegmentTable):
+            return segments
+        texts = []
+        offsets = array("q", [0])
+        starts = array("d")
+        durations = array("d")
+        position = 0
+        for segment in segments:
+            texts.append(segment.text)
+            position += len(segment.text) + 1
+            offsets.append(position)
+            starts.append(segment.start)
+            durations.append(segment.duration)
+        return cls(" ".join(texts), offsets, starts, durations)
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> "SegmentTable":
+        """Build a table from serialized ``{"text", "start", "duration"}`` dicts."""
+        items = list(items)
+        texts = [item["text"] for item in items]
+        offsets = array("q", [0])
+        position = 0
+        for text in texts:
+            position += len(text) + 1
+            offsets.append(position)
+        return cls(
+            " ".join(texts),
+            offsets,
+            array("d", [item["start"] for item in items]),
+            array("d", [item["duration"] for item in items]),
+        )
+
+    @property
+    def full_text(self) -> str:
+        """Every segment's text joined by spaces, without copying."""
+        return self._text
+
+    def text(self, index: int) -> str:
+        """Text of one segment, without building the segment."""
+        return intern_text(self._text[self._offsets[index]:self._offsets[index + 1] - 1])
+
+    def to_dicts(self) -> list[dict]:
+        text = self._text
+        offsets = self._offsets
+        return [
+            {"text": text[offsets[i]:offsets[i + 1] - 1], "start": start, "duration": duration}
+            for i, (start, duration) in enumerate(zip(self.starts, self.durations))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            lo, hi, step = index.indices(len(self))
+            if step != 1:
+                return SegmentTable.from_segments(self[i] for i in range(lo, hi, step))
+            return self._slice(lo, max(lo, hi))
+        index = range(len(self))[index]
+        return TranscriptSegment(
+            text=self.text(index), start=self.starts[index], duration=self.durations[index]
+        )
+
+    def _slice(self, lo: int, hi: int) -> "SegmentTable":
+        base = self._offsets[lo]
+        end = self._offsets[hi] - 1 if hi > lo else base
+        return SegmentTable(
+            self._text[base:end],
+            array("q", (offset - base for offset in self._offsets[lo:hi + 1])),
+            self.starts[lo:hi],
+            self.durations[lo:hi],
+        )
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for i in range(len(self)):
+            yield TranscriptSegment(
+                text=self.text(i), start=self.starts[i], duration=self.durations[i]
+            )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SegmentTable):
+            return (
+                self._text == other._text
+                and self._offsets == other._offsets
+                and self.starts == other.starts
+                and self.durations == other.durations
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"SegmentTable({len(self)} segments)"
+
+
+@dataclass(slots=True)
+class Chapter:
+    """A chapter of a video, as listed in its description."""
+
+    title: str
+    start: float
+    end: float
+
+
+@dataclass(slots=True)
 class TranscriptResult:
-    """Complete transcript with video metadata."""
+    """Complete transcript with video metadata.
+
+    Segment lists passed in are packed into ``SegmentTable``s; lists assigned
+    later are packed on first use.
+    """
 
     id: str
     title: str
     channel: str
     upload_date: str
     webpage_url: str
-    transcript: list[TranscriptSegment] = field(default_factory=list)
+    transcript: SegmentTable = field(default_factory=SegmentTable)
+    language: str = ""
+    alt_transcripts: dict[str, SegmentTable] = field(default_factory=dict)
+    chapters: list[Chapter] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.transcript = SegmentTable.from_segments(self.transcript)
+        self.alt_transcripts = {
+            lang: SegmentTable.from_segments(segments)
+            for lang, segments in self.alt_transcripts.items()
+        }
 
     @property
     def full_text(self) -> str:
         """Concatenated transcript text for AI processing."""
-        return " ".join(seg.text for seg in self.transcript)
-
-
-@dataclass
+        self.transcript = SegmentTable.from_segments(self.transcript)
+        return self.transcript.full_text
+
+    def chapter_segments(self) -> list[tuple[Chapter, SegmentTable]]:
+        """Pair each chapter with the segments that start inside it.
+
+        Segments are sorted by start time, so each chapter's range is found
+        by binary search over the table's start column.
+        """
+        self.transcript = SegmentTable.from_segments(self.transcript)
+        starts = self.transcript.starts
+        return [
+            (
+                chapter,
+                self.transcript[bisect_left(starts, chapter.start):bisect_left(starts, chapter.end)],
+            )
+            for chapter in self.chapters
+        ]
+
+
+@dataclass(slots=True)
 class Concept:
     """A knowledge concept extracted by AI."""
 
@@ -37,16 +218,17 @@ class Concept:
     definition: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     """Structured response from AI processing."""
 
     tldr: str
     summary: str
     concepts: list[Concept] = field(default_factory=list)
+    chapter_summaries: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingState:
     """Processing state for a single video."""
 
@@ -55,3 +237,4 @@ class ProcessingState:
     ai_processed: bool = False
     notes_generated: bool = False
     last_processed: str = ""
+    targets: dict[str, dict[str, bool]] = field(default_factory=dict)
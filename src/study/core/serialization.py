@@ -0,0 +1,157 @@
+"""JSON serialization of persisted models, with an optional fast codec.
+
+Transcripts, AI responses and processing state are converted to plain
+dicts here and encoded with orjson or msgspec when one is installed
+(``pip install study-cli[fast]``), or the standard library ``json``
+otherwise. Every codec writes UTF-8 JSON with a 2-space indent and
+non-ASCII text kept as-is, so files written with and without the extra are
+interchangeable.
+"""
+
+import json
+from pathlib import Path
+
+from study.core.models import (
+    AIResponse,
+    Chapter,
+    Concept,
+    ProcessingState,
+    SegmentTable,
+    TranscriptResult,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+CODECS = ("orjson", "msgspec", "json")
+
+if orjson is not None:
+    CODEC = "orjson"
+elif msgspec is not None:
+    CODEC = "msgspec"
+else:
+    CODEC = "json"
+
+
+def dumps(obj, indent: bool = True) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON with the configured codec."""
+    if CODEC == "orjson":
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if CODEC == "msgspec":
+        data = msgspec.json.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str):
+    """Decode JSON with the configured codec."""
+    if CODEC == "orjson":
+        return orjson.loads(data)
+    if CODEC == "msgspec":
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def write_json(path: Path, obj, indent: bool = True) -> None:
+    path.write_bytes(dumps(obj, indent))
+
+
+def read_json(path: Path):
+    return loads(path.read_bytes())
+
+
+def transcript_to_dict(result: TranscriptResult) -> dict:
+    """Convert a TranscriptResult to a plain dict, including ``full_text``."""
+    return {
+        "id": result.id,
+        "title": result.title,
+        "channel": result.channel,
+        "upload_date": result.upload_date,
+        "webpage_url": result.webpage_url,
+        "transcript": SegmentTable.from_segments(result.transcript).to_dicts(),
+        "language": result.language,
+        "alt_transcripts": {
+            lang: SegmentTable.from_segments(segments).to_dicts()
+            for lang, segments in result.alt_transcripts.items()
+        },
+        "chapters": [
+            {"title": chapter.title, "start": chapter.start, "end": chapter.end}
+            for chapter in result.chapters
+        ],
+        "full_text": result.full_text,
+    }
+
+
+def transcript_from_dict(data: dict) -> TranscriptResult:
+    """Rebuild a TranscriptResult; ``full_text`` is derived, not read."""
+    return TranscriptResult(
+        id=data["id"],
+        title=data["title"],
+        channel=data["channel"],
+        upload_date=data["upload_date"],
+        webpage_url=data["webpage_url"],
+        transcript=SegmentTable.from_dicts(data.get("transcript", [])),
+        language=data.get("language", ""),
+        alt_transcripts={
+            lang: SegmentTable.from_dicts(segments)
+            for lang, segments in data.get("alt_transcripts", {}).items()
+        },
+        chapters=[
+            Chapter(title=ch["title"], start=ch["start"], end=ch["end"])
+            for ch in data.get("chapters", [])
+        ],
+    )
+
+
+def ai_response_to_dict(response: AIResponse) -> dict:
+    return {
+        "tldr": response.tldr,
+        "summary": response.summary,
+        "concepts": [{"name": c.name, "definition": c.definition} for c in response.concepts],
+        "chapter_summaries": response.chapter_summaries,
+    }
+
+
+def ai_response_from_dict(data: dict) -> AIResponse:
+    return AIResponse(
+        tldr=data["tldr"],
+        summary=data["summary"],
+        concepts=[
+            Concept(name=c["name"], definition=c["definition"])
+            for c in data.get("concepts", [])
+        ],
+        chapter_summaries=data.get("chapter_summaries", []),
+    )
+
+
+def state_to_dict(state: ProcessingState) -> dict:
+    """Serialize one video's state; ``targets`` is omitted when empty."""
+    data = {
+        "transcript_extracted": state.transcript_extracted,
+        "ai_processed": state.ai_processed,
+        "notes_generated": state.notes_generated,
+        "last_processed": state.last_processed,
+    }
+    if state.targets:
+        data["targets"] = state.targets
+    return data
+
+
+def state_from_dict(video_id: str, data: dict) -> ProcessingState:
+    return ProcessingState(
+        video_id=video_id,
+        transcript_extracted=data.get("transcript_extracted", False),
+        ai_processed=data.get("ai_processed", False),
+        notes_generated=data.get("notes_generated", False),
+        last_processed=data.get("last_processed", ""),
+        targets=data.get("targets", {}),
+    )
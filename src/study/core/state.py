@@ -1,10 +1,14 @@
 """Processing state manager for idempotent pipeline execution."""
 
-import json
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 
 from study.core.models import ProcessingState
+from study.core.serialization import read_json, state_from_dict, state_to_dict, write_json
+
+# Stages tracked separately for each vault/language target
+TARGET_STAGES = ("ai_processed", "notes_generated")
 
 
 class ProcessingStateManager:
@@ -19,62 +23,95 @@ class ProcessingStateManager:
         """Load state from JSON file."""
         if not self.state_file.exists():
             return
-        data = json.loads(self.state_file.read_text(encoding="utf-8"))
-        for video_id, fields in data.items():
-            self._states[video_id] = ProcessingState(
-                video_id=video_id,
-                transcript_extracted=fields.get("transcript_extracted", False),
-                ai_processed=fields.get("ai_processed", False),
-                notes_generated=fields.get("notes_generated", False),
-                last_processed=fields.get("last_processed", ""),
-            )
+        for video_id, fields in read_json(self.state_file).items():
+            self._states[video_id] = state_from_dict(video_id, fields)
 
     def _save(self) -> None:
         """Persist state to JSON file."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        data = {}
-        for video_id, state in self._states.items():
-            data[video_id] = {
-                "transcript_extracted": state.transcript_extracted,
-                "ai_processed": state.ai_processed,
-                "notes_generated": state.notes_generated,
-                "last_processed": state.last_processed,
-            }
-        self.state_file.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        write_json(
+            self.state_file,
+            {video_id: state_to_dict(state) for video_id, state in self._states.items()},
         )
 
     def get(self, video_id: str) -> ProcessingState | None:
         """Get processing state for a video."""
         return self._states.get(video_id)
 
-    def update(self, video_id: str, **kwargs) -> None:
-        """Update state fields for a video and persist."""
+    def update(self, video_id: str, target: str | None = None, **kwargs) -> None:
+        """Update state fields for a video and persist.
+
+        With a ``target`` key, the AI and note stages are recorded for that
+        vault/language target only; the transcript is shared by all targets.
+        """
+        self._apply(video_id, kwargs, datetime.now(timezone.utc).isoformat(), target)
+        self._save()
+
+    def update_many(self, video_ids: Iterable[str], target: str | None = None, **kwargs) -> None:
+        """Update the same state fields for many videos and persist once."""
+        now = datetime.now(timezone.utc).isoformat()
+        for video_id in video_ids:
+            self._apply(video_id, kwargs, now, target)
+        self._save()
+
+    def _apply(self, video_id: str, fields: dict, now: str, target: str | None) -> None:
         if video_id not in self._states:
             self._states[video_id] = ProcessingState(video_id=video_id)
         state = self._states[video_id]
-        for key, value in kwargs.items():
-            if hasattr(state, key):
+        for key, value in fields.items():
+            if target is not None and key in TARGET_STAGES:
+                state.targets.setdefault(target, {})[key] = value
+            elif hasattr(state, key):
                 setattr(state, key, value)
-        state.last_processed = datetime.now(timezone.utc).isoformat()
-        self._save()
+        state.last_processed = now
+
+    def complete_targets(self, video_id: str, targets: Iterable[str]) -> None:
+        """Mark the top-level AI and note stages done once every target has them.
+
+        ``pending_ai_processing()`` without a target then stops listing a
+        video that all vault targets have already processed.
+        """
+        targets = list(targets)
+        fields = {
+            stage: True
+            for stage in TARGET_STAGES
+            if not self._stage_done(video_id, stage, None)
+            and all(self._stage_done(video_id, stage, target) for target in targets)
+        }
+        if fields:
+            self.update(video_id, **fields)
 
     def is_transcript_extracted(self, video_id: str) -> bool:
         state = self._states.get(video_id)
         return state.transcript_extracted if state else False
 
-    def is_ai_processed(self, video_id: str) -> bool:
-        state = self._states.get(video_id)
-        return state.ai_processed if state else False
+    def is_ai_processed(self, video_id: str, target: str | None = None) -> bool:
+        return self._stage_done(video_id, "ai_processed", target)
 
-    def is_notes_generated(self, video_id: str) -> bool:
+    def is_notes_generated(self, video_id: str, target: str | None = None) -> bool:
+        return self._stage_done(video_id, "notes_generated", target)
+
+    def _stage_done(self, video_id: str, stage: str, target: str | None) -> bool:
         state = self._states.get(video_id)
-        return state.notes_generated if state else False
+        if state is None:
+            return False
+        if target is not None:
+            return state.targets.get(target, {}).get(stage, False)
+        return getattr(state, stage)
+
+    def pending_for_target(self, target: str | None = None) -> list[str]:
+        """Return video_ids with transcript but AI or notes missing for a target."""
+        return [
+            vid
+            for vid, state in self._states.items()
+            if state.transcript_extracted
+            and not (self.is_ai_processed(vid, target) and self.is_notes_generated(vid, target))
+        ]
 
-    def pending_ai_processing(self) -> list[str]:
+    def pending_ai_processing(self, target: str | None = None) -> list[str]:
         """Return video_ids with transcript but not yet AI processed."""
         return [
             vid
             for vid, state in self._states.items()
-            if state.transcript_extracted and not state.ai_processed
+            if state.transcript_extracted and not self.is_ai_processed(vid, target)
         ]
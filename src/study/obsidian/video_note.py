@@ -38,11 +38,41 @@ def create_video_note(
         f"# {transcript.title}\n\n"
         f"## TLDR\n\n{ai_response.tldr}\n\n---\n\n"
         f"## Resumo\n\n{ai_response.summary}\n\n---\n\n"
-        f"## Conceitos\n\n{concept_list}\n"
     )
+    if transcript.chapters:
+        body += _chapter_sections(transcript, ai_response.chapter_summaries) + "---\n\n"
+    body += f"## Conceitos\n\n{concept_list}\n"
 
     note_path = vault.video_note_path(transcript.channel, transcript.title)
     note_path.parent.mkdir(parents=True, exist_ok=True)
     note_path.write_text(serialize_frontmatter(frontmatter) + body, encoding="utf-8")
 
     return note_path
+
+
+def _chapter_sections(transcript: TranscriptResult, summaries: list[str]) -> str:
+    """Render one section per chapter, headed by a link to its start time."""
+    lines = ["## Capitulos\n"]
+    for i, chapter in enumerate(transcript.chapters):
+        link = _timestamp_url(transcript.webpage_url, chapter.start)
+        lines.append(f"### [{_format_timestamp(chapter.start)}]({link}) {chapter.title}\n")
+        summary = summaries[i] if i < len(summaries) else ""
+        if summary:
+            lines.append(f"{summary}\n")
+    return "\n".join(lines) + "\n"
+
+
+def _format_timestamp(seconds: float) -> str:
+    """Format seconds as M:SS, or H:MM:SS from one hour on."""
+    total = int(seconds)
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+def _timestamp_url(url: str, seconds: float) -> str:
+    """Link to a point in the video with a ``t=`` parameter."""
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}t={int(seconds)}s"
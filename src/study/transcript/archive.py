@@ -0,0 +1,128 @@
+"""Append-only yt-dlp download archive kept in sync with processing state."""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+from yt_dlp.utils import locked_file
+
+from study.core.state import ProcessingStateManager
+
+logger = logging.getLogger("study")
+
+COMPACT_THRESHOLD = 1000
+
+
+def _archive_line(video_id: str) -> str:
+    return f"youtube {video_id}"
+
+
+class DownloadArchive:
+    """yt-dlp archive file that only grows by the IDs extracted since the last sync.
+
+    A sidecar JSON file records the sync cursor (the newest ``last_processed``
+    already written) and the number of lines written, so a sync appends only
+    newer IDs instead of rewriting the whole file. Duplicates left by
+    re-processed videos or concurrent runs are removed by a compaction pass
+    once they exceed ``compact_threshold``.
+    """
+
+    def __init__(self, path: Path, compact_threshold: int = COMPACT_THRESHOLD):
+        self.path = path
+        self.meta_path = path.with_name(path.name + ".sync.json")
+        self.compact_threshold = compact_threshold
+        self.synced = False
+        self.cursor = ""
+        self.lines = 0
+        self.extra = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Load the sync cursor from the sidecar file."""
+        if not self.meta_path.exists() or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Ignoring unreadable archive sync file %s", self.meta_path)
+            return
+        self.synced = True
+        self.cursor = data.get("cursor", "")
+        self.lines = data.get("lines", 0)
+        self.extra = data.get("extra", 0)
+
+    def _save(self) -> None:
+        """Persist the sync cursor atomically."""
+        data = {"cursor": self.cursor, "lines": self.lines, "extra": self.extra}
+        tmp = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, self.meta_path)
+
+    def sync(self, state: ProcessingStateManager) -> int:
+        """Bring the archive up to date with extracted IDs; return lines written."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        extracted = [
+            ps for ps in state._states.values() if ps.transcript_extracted
+        ]
+        if not self.synced:
+            return self.compact(state)
+
+        new = [ps for ps in extracted if ps.last_processed > self.cursor]
+        if new:
+            self._append([_archive_line(ps.video_id) for ps in new])
+            self.cursor = max(ps.last_processed for ps in new)
+            self.lines += len(new)
+            self._save()
+
+        duplicates = self.lines - len(extracted) - self.extra
+        if duplicates > self.compact_threshold:
+            logger.debug("Archive has ~%d duplicate lines, compacting", duplicates)
+            return self.compact(state)
+
+        logger.debug("Appended %d entries to archive.txt", len(new))
+        return len(new)
+
+    def _append(self, lines: list[str]) -> None:
+        """Append lines under yt-dlp's archive lock, repairing a missing newline."""
+        prefix = ""
+        if self.path.exists() and self.path.stat().st_size:
+            with self.path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    prefix = "\n"
+        with locked_file(str(self.path), "a", encoding="utf-8") as f:
+            f.write(prefix + "\n".join(lines) + "\n")
+
+    def compact(self, state: ProcessingStateManager) -> int:
+        """Rewrite the archive without duplicates, merged with the full state.
+
+        The file is read and rewritten in place while holding the same lock
+        as appends. Replacing it with a new file would let a writer already
+        waiting on the old one append to a file that no longer exists.
+        """
+        extracted = [
+            ps for ps in state._states.values() if ps.transcript_extracted
+        ]
+        state_lines = {_archive_line(ps.video_id) for ps in extracted}
+
+        # A crash mid-rewrite must not leave a cursor past the lost lines
+        self.meta_path.unlink(missing_ok=True)
+        with locked_file(str(self.path), "a", encoding="utf-8") as f:
+            seen: dict[str, None] = {}
+            for line in self.path.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line:
+                    seen[line] = None
+            for line in sorted(state_lines):
+                seen[line] = None
+            f.truncate(0)
+            f.write("".join(line + "\n" for line in seen))
+
+        self.synced = True
+        self.cursor = max((ps.last_processed for ps in extracted), default="")
+        self.lines = len(seen)
+        self.extra = len(seen) - len(state_lines)
+        self._save()
+        logger.debug("Compacted archive.txt to %d entries", len(seen))
+        return len(seen)
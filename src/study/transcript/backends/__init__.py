@@ -0,0 +1,22 @@
+"""Extractor backends: where listings, video metadata and subtitles come from."""
+
+from study.core.config import Settings
+from study.transcript.backends.base import ExtractorBackend, ExtractorSession
+from study.transcript.backends.replay_backend import RecordingBackend, ReplayBackend
+from study.transcript.backends.ytdlp_backend import YtDlpBackend
+
+
+def create_extractor_backend(settings: Settings) -> ExtractorBackend:
+    """Create the extractor backend selected by settings."""
+    replay_dir = settings.replay_dir or settings.data_dir / "replay"
+    if settings.extractor_backend == "yt-dlp":
+        return YtDlpBackend()
+    elif settings.extractor_backend == "replay":
+        return ReplayBackend(
+            replay_dir,
+            latency=settings.replay_latency,
+            failure_rate=settings.replay_failure_rate,
+        )
+    elif settings.extractor_backend == "record":
+        return RecordingBackend(replay_dir, YtDlpBackend())
+    raise ValueError(f"Unknown extractor backend: {settings.extractor_backend}")
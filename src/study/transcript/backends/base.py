@@ -0,0 +1,53 @@
+"""Abstract base classes for extractor backends."""
+
+from abc import ABC, abstractmethod
+
+from study.transcript.subtitle_index import SubtitleIndex
+
+
+class ExtractorSession(ABC):
+    """One worker's handle on a video site.
+
+    Mirrors the subset of ``yt_dlp.YoutubeDL`` the extractor uses, so a
+    ``YoutubeDL`` instance is itself a valid session.
+    """
+
+    params: dict
+
+    @abstractmethod
+    def extract_info(
+        self, url: str, download: bool = True, ie_key: str | None = None, process: bool = True
+    ) -> dict | None:
+        """Return the info dict for a URL; with ``process=False`` listings stay lazy."""
+
+    @abstractmethod
+    def process_ie_result(self, ie_result: dict, download: bool = True) -> dict | None:
+        """Resolve an entry, selecting subtitles and writing them if ``download``."""
+
+    @abstractmethod
+    def urlopen(self, req):
+        """Open a request (e.g. a subtitle track URL) and return a response."""
+
+    def close(self) -> None:
+        """Release the session's resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ExtractorBackend(ABC):
+    """Abstract interface for the source of video listings, metadata and subtitles."""
+
+    @abstractmethod
+    def open(self, opts: dict, index: SubtitleIndex) -> ExtractorSession:
+        """Create a session configured with yt-dlp style ``opts``.
+
+        Subtitle files written by the session must be recorded in ``index``.
+        """
+
+    @abstractmethod
+    def video_id(self, url: str) -> str | None:
+        """Return the video ID of a single-video URL, without any request."""
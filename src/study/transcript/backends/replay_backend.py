@@ -0,0 +1,320 @@
+"""Offline extractor backends: replay recorded videos, or record them for replay.
+
+A recording directory holds the files yt-dlp itself writes with
+``--write-info-json --write-subs -o "%(id)s.%(ext)s"``:
+
+- ``{id}.info.json`` -- the resolved info dict of a video
+- ``{id}.{lang}.{ext}`` -- its subtitle tracks
+
+plus two optional files:
+
+- ``listings.json`` -- ``{url: [video_id, ...]}``, channel/playlist listings
+  in listing order
+- ``failures.json`` -- ``{video_id: error message}``, videos that always fail
+"""
+
+import io
+import json
+import random
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import yt_dlp
+from yt_dlp.utils import DownloadError
+
+from study.transcript.backends.base import ExtractorBackend, ExtractorSession
+from study.transcript.backends.ytdlp_backend import video_id_from_url
+from study.transcript.subtitle_index import SubtitleIndex
+
+
+def _request_url(req) -> str:
+    return req if isinstance(req, str) else req.url
+
+
+class ReplayBackend(ExtractorBackend):
+    """Serves recorded info dicts and subtitle files from a local directory.
+
+    Every request (listing, video page, subtitle track) sleeps ``latency``
+    seconds and fails with a transient HTTP 503 with probability
+    ``failure_rate``, so throughput and error handling can be measured
+    reproducibly without the network.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.directory = directory
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._infos = {
+            path.name[: -len(".info.json")]: path
+            for path in directory.glob("*.info.json")
+        }
+        self._subtitles = SubtitleIndex()
+        self._subtitles.scan(directory)
+        self._listings = self._load_json("listings.json")
+        self._failures = self._load_json("failures.json")
+        self._newest_first: list[str] | None = None
+
+    def _load_json(self, name: str) -> dict:
+        path = self.directory / name
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def open(self, opts: dict, index: SubtitleIndex) -> ExtractorSession:
+        return ReplaySession(self, opts, index)
+
+    def video_id(self, url: str) -> str | None:
+        if url in self._infos:
+            return url
+        return video_id_from_url(url)
+
+    def request(self) -> None:
+        """Simulate one network request: wait, then maybe fail."""
+        if self.latency > 0:
+            time.sleep(self.latency)
+        with self._rng_lock:
+            failed = self.failure_rate > 0 and self._rng.random() < self.failure_rate
+        if failed:
+            raise DownloadError("ERROR: HTTP Error 503: Service Unavailable (injected)")
+
+    def listing(self, url: str) -> list[str]:
+        """Video IDs listed under a URL, or every recorded video newest-first."""
+        key = url.strip().rstrip("/")
+        if key in self._listings:
+            return list(self._listings[key])
+        if self._newest_first is None:
+            self._newest_first = sorted(
+                self._infos,
+                key=lambda vid: self.read_info(vid).get("upload_date") or "",
+                reverse=True,
+            )
+        return list(self._newest_first)
+
+    def read_info(self, video_id: str) -> dict:
+        """Read a recorded info dict as-is; empty if the video was not recorded."""
+        path = self._infos.get(video_id)
+        if path is None:
+            return {}
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def load_info(self, video_id: str) -> dict:
+        """Load a recorded info dict, raising like yt-dlp for unavailable videos."""
+        if video_id in self._failures:
+            raise DownloadError(f"ERROR: [youtube] {video_id}: {self._failures[video_id]}")
+        info = self.read_info(video_id)
+        if not info:
+            raise DownloadError(f"ERROR: [youtube] {video_id}: Video unavailable")
+        return info
+
+    def subtitle_files(self, video_id: str) -> dict[str, Path]:
+        """Recorded subtitle files of a video, by language."""
+        return self._subtitles.tracks(video_id)
+
+
+class ReplaySession(ExtractorSession):
+    """A replay worker session, honouring the yt-dlp options it was opened with."""
+
+    def __init__(self, backend: ReplayBackend, opts: dict, index: SubtitleIndex):
+        self.backend = backend
+        self.params = opts
+        self.index = index
+        self._archive: set[str] = set()
+        archive_file = opts.get("download_archive")
+        if archive_file and Path(archive_file).exists():
+            self._archive = set(Path(archive_file).read_text(encoding="utf-8").split("\n"))
+
+    def extract_info(
+        self, url: str, download: bool = True, ie_key: str | None = None, process: bool = True
+    ) -> dict | None:
+        self.backend.request()
+        video_id = self.backend.video_id(url)
+        if video_id:
+            info = self.backend.load_info(video_id)
+            return self.process_ie_result(info, download) if process else info
+
+        entries = (self._flat_entry(vid) for vid in self.backend.listing(url))
+        playlist = {"_type": "playlist", "id": url, "webpage_url": url, "entries": entries}
+        if process:
+            playlist["entries"] = [self.process_ie_result(e, download) for e in entries]
+        return playlist
+
+    def _flat_entry(self, video_id: str) -> dict:
+        entry = {
+            "_type": "url",
+            "ie_key": "Youtube",
+            "id": video_id,
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+        }
+        info = self.backend.read_info(video_id)
+        for key in ("title", "duration", "live_status", "channel"):
+            if info.get(key) is not None:
+                entry[key] = info[key]
+        return entry
+
+    def process_ie_result(self, ie_result: dict, download: bool = True) -> dict | None:
+        if ie_result.get("_type") == "url":
+            return self.extract_info(
+                ie_result["url"], download, ie_key=ie_result.get("ie_key"), process=True
+            )
+
+        info = dict(ie_result)
+        video_id = info["id"]
+        files = self.backend.subtitle_files(video_id)
+        info["subtitles"] = {
+            lang: [{"ext": path.suffix.lstrip("."), "url": path.resolve().as_uri()}]
+            for lang, path in files.items()
+        }
+        info["automatic_captions"] = {}
+        info["requested_subtitles"] = self._select_subtitles(info["subtitles"])
+        if download and self._should_download(info):
+            self._write_subtitles(info)
+        return info
+
+    def _select_subtitles(self, available: dict[str, list[dict]]) -> dict:
+        """Pick tracks the way yt-dlp does from ``subtitleslangs``."""
+        wanted = self.params.get("subtitleslangs") or []
+        if wanted:
+            langs = [
+                lang for lang in available
+                if any(re.fullmatch(pattern, lang) for pattern in wanted)
+            ]
+        else:
+            langs = list(available)[:1]
+        return {lang: dict(available[lang][-1]) for lang in langs}
+
+    def _should_download(self, info: dict) -> bool:
+        daterange = self.params.get("daterange")
+        upload_date = info.get("upload_date")
+        if daterange and upload_date and upload_date not in daterange:
+            return False
+        return f"youtube {info['id']}" not in self._archive
+
+    def _write_subtitles(self, info: dict) -> None:
+        outtmpl = self.params.get("outtmpl")
+        if not outtmpl:
+            return
+        out_dir = Path(outtmpl).parent
+        for lang, sub_info in info["requested_subtitles"].items():
+            self.backend.request()
+            dest = out_dir / f"{info['id']}.{lang}.{sub_info['ext']}"
+            shutil.copyfile(self.backend.subtitle_files(info["id"])[lang], dest)
+            sub_info["filepath"] = str(dest)
+        self.index.record(info)
+
+    def urlopen(self, req):
+        self.backend.request()
+        url = _request_url(req)
+        if not url.startswith("file:"):
+            raise DownloadError(f"ERROR: replay backend cannot fetch {url}")
+        return io.BytesIO(Path(url2pathname(urlparse(url).path)).read_bytes())
+
+
+class RecordingBackend(ExtractorBackend):
+    """Wraps another backend and records everything it serves for ``ReplayBackend``."""
+
+    def __init__(self, directory: Path, inner: ExtractorBackend):
+        self.directory = directory
+        self.inner = inner
+        self._lock = threading.Lock()
+
+    def open(self, opts: dict, index: SubtitleIndex) -> ExtractorSession:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return RecordingSession(self, self.inner.open(opts, index))
+
+    def video_id(self, url: str) -> str | None:
+        return self.inner.video_id(url)
+
+    def record_listing(self, url: str, video_ids: list[str]) -> None:
+        """Merge a walked listing into ``listings.json``."""
+        path = self.directory / "listings.json"
+        with self._lock:
+            listings = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+            listings[url.strip().rstrip("/")] = video_ids
+            path.write_text(json.dumps(listings, indent=2), encoding="utf-8")
+
+
+class RecordingSession(ExtractorSession):
+    """Delegates to an inner session and saves listings, info dicts and subtitles."""
+
+    def __init__(self, backend: RecordingBackend, inner: ExtractorSession):
+        self.backend = backend
+        self.inner = inner
+        self._pending: dict[str, Path] = {}
+
+    @property
+    def params(self) -> dict:
+        return self.inner.params
+
+    def extract_info(
+        self, url: str, download: bool = True, ie_key: str | None = None, process: bool = True
+    ) -> dict | None:
+        info = self.inner.extract_info(url, download=download, ie_key=ie_key, process=process)
+        if info is None:
+            return None
+        if info.get("entries") is not None and not process:
+            return {**info, "entries": self._record_entries(url, info["entries"])}
+        if process:
+            self._record_video(info)
+        return info
+
+    def _record_entries(self, url: str, entries):
+        video_ids = []
+        try:
+            for entry in entries:
+                if entry and entry.get("id"):
+                    video_ids.append(entry["id"])
+                yield entry
+        finally:
+            self.backend.record_listing(url, video_ids)
+
+    def process_ie_result(self, ie_result: dict, download: bool = True) -> dict | None:
+        info = self.inner.process_ie_result(ie_result, download=download)
+        if info is not None:
+            self._record_video(info)
+        return info
+
+    def _record_video(self, info: dict) -> None:
+        video_id = info.get("id")
+        if not video_id or info.get("entries") is not None:
+            return
+        directory = self.backend.directory
+        sanitized = yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True)
+        (directory / f"{video_id}.info.json").write_text(
+            json.dumps(sanitized, ensure_ascii=False, default=str), encoding="utf-8"
+        )
+        for lang, sub_info in (info.get("requested_subtitles") or {}).items():
+            dest = directory / f"{video_id}.{lang}.{sub_info.get('ext', 'vtt')}"
+            if sub_info.get("filepath") and Path(sub_info["filepath"]).exists():
+                shutil.copyfile(sub_info["filepath"], dest)
+            elif sub_info.get("data") is not None:
+                data = sub_info["data"]
+                dest.write_bytes(data if isinstance(data, bytes) else data.encode("utf-8"))
+            elif sub_info.get("url"):
+                # Saved when the extractor fetches the track (memory capture)
+                self._pending[sub_info["url"]] = dest
+
+    def urlopen(self, req):
+        response = self.inner.urlopen(req)
+        dest = self._pending.pop(_request_url(req), None)
+        if dest is None:
+            return response
+        with response:
+            data = response.read()
+        dest.write_bytes(data)
+        return io.BytesIO(data)
+
+    def close(self) -> None:
+        self.inner.__exit__(None, None, None)
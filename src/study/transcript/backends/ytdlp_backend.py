@@ -0,0 +1,30 @@
+"""Extractor backend backed by yt-dlp."""
+
+import yt_dlp
+from yt_dlp.extractor import gen_extractor_classes
+
+from study.transcript.backends.base import ExtractorBackend, ExtractorSession
+from study.transcript.subtitle_index import SubtitleIndex, SubtitleIndexPP
+
+ExtractorSession.register(yt_dlp.YoutubeDL)
+
+
+def video_id_from_url(url: str) -> str | None:
+    """Return the video ID encoded in a single-video URL, without any request."""
+    for ie in gen_extractor_classes():
+        if ie.suitable(url):
+            return ie.get_temp_id(url) if ie.is_single_video(url) else None
+    return None
+
+
+class YtDlpBackend(ExtractorBackend):
+    """Talks to the real sites through ``yt_dlp.YoutubeDL``."""
+
+    def open(self, opts: dict, index: SubtitleIndex) -> ExtractorSession:
+        """Create a YoutubeDL that records written subtitles into ``index``."""
+        ydl = yt_dlp.YoutubeDL(opts)
+        ydl.add_post_processor(SubtitleIndexPP(index), when="before_dl")
+        return ydl
+
+    def video_id(self, url: str) -> str | None:
+        return video_id_from_url(url)
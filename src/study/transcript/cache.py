@@ -0,0 +1,119 @@
+"""On-disk cache of per-video metadata resolved by yt-dlp."""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger("study")
+
+CACHED_FIELDS = (
+    "id", "title", "channel", "uploader", "upload_date", "webpage_url", "chapters"
+)
+
+
+class MetadataCache:
+    """Caches per-video metadata and subtitle tracks as JSON, one file per video.
+
+    Entries expire after ``ttl`` seconds. When more than ``max_entries``
+    files exist, the oldest are evicted. Cached tracks keep the subtitle
+    URL and extension so a re-run can fetch the subtitle without resolving
+    the video page again. They are only valid for the subtitle ``selection``
+    (languages and format) they were picked with.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float, max_entries: int):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._count: int | None = None
+
+    def _path(self, video_id: str) -> Path:
+        return self.cache_dir / f"{video_id}.json"
+
+    def get(self, video_id: str, selection: str = "") -> dict | None:
+        """Return cached metadata for a video, or None if missing or expired.
+
+        When the entry was stored for another subtitle ``selection``, its
+        ``subtitles`` are None: the tracks for this one are unknown.
+        """
+        path = self._path(video_id)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if time.time() - data.get("cached_at", 0) > self.ttl:
+            self.invalidate(video_id)
+            return None
+        if data.get("selection", "") != selection:
+            data["subtitles"] = None
+        return data
+
+    def put(self, info: dict, selection: str = "") -> None:
+        """Cache the metadata and selected subtitle tracks of a resolved video."""
+        video_id = info.get("id")
+        if not video_id:
+            return
+        data = {key: info.get(key) for key in CACHED_FIELDS}
+        data["subtitles"] = _cacheable_tracks(info)
+        data["selection"] = selection
+        data["cached_at"] = time.time()
+
+        path = self._path(video_id)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        is_new = not path.exists()
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+        if is_new:
+            with self._lock:
+                if self._count is None:
+                    self._count = sum(1 for _ in self.cache_dir.glob("*.json"))
+                else:
+                    self._count += 1
+                if self._count > self.max_entries:
+                    self._evict()
+
+    def invalidate(self, video_id: str) -> None:
+        """Drop a video from the cache."""
+        try:
+            self._path(video_id).unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if self._count is not None:
+                self._count -= 1
+
+    def _evict(self) -> None:
+        """Remove the oldest entries until the cache is 10% under its limit."""
+        files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        target = int(self.max_entries * 0.9)
+        excess = len(files) - target
+        for path in files[:max(excess, 0)]:
+            path.unlink(missing_ok=True)
+        self._count = min(len(files), target)
+        logger.debug("Evicted %d metadata cache entries", max(excess, 0))
+
+
+def _cacheable_tracks(info: dict) -> dict | None:
+    """Selected subtitle tracks as ``{lang: {"ext", "url"}}``, plus the
+    ``automatic`` flag of auto-caption tracks.
+
+    Returns ``{}`` when the video has no requested subtitles, and None when
+    a track cannot be re-fetched from a URL (so the video must be resolved
+    again to get it).
+    """
+    requested = info.get("requested_subtitles") or {}
+    tracks = {}
+    for lang, sub_info in requested.items():
+        url = (sub_info or {}).get("url")
+        if not url:
+            return None
+        tracks[lang] = {"ext": sub_info.get("ext", ""), "url": url}
+        if sub_info.get("automatic"):
+            tracks[lang]["automatic"] = True
+    return tracks
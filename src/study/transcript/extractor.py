@@ -2,57 +2,70 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import multiprocessing
+import queue
 import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
 
-import yt_dlp
+from yt_dlp.networking import Request
 
 from study.core.config import Settings
-from study.core.models import TranscriptResult, TranscriptSegment
+from study.core.models import Chapter, TranscriptResult, TranscriptSegment
 from study.core.state import ProcessingStateManager
-from study.transcript.parser import parse_subtitle_file
+from study.transcript.archive import DownloadArchive
+from study.transcript.backends import (
+    ExtractorBackend,
+    ExtractorSession,
+    create_extractor_backend,
+)
+from study.transcript.cache import MetadataCache
+from study.transcript.filters import EntryFilter
+from study.transcript.negative_cache import NO_CAPTIONS, NegativeCache, classify_error
+from study.transcript.parser import coalesce_segments, dedupe_segments, parse_subtitle_data
+from study.transcript.ratelimit import RateLimiter, is_rate_limited, with_backoff
+from study.transcript.retry import RetryQueue
+from study.transcript.subtitle_index import SubtitleIndex, pick_language
+from study.transcript.watermarks import ChannelWatermark, ChannelWatermarks
 
 logger = logging.getLogger("study")
 
+# Uploads younger than this may still be waiting for auto captions
+RECENT_UPLOAD_DAYS = 2
+
 
 def _sync_archive_file(settings: Settings, state: ProcessingStateManager) -> None:
     """Sync archive.txt with already-extracted video IDs from processing state."""
-    archive_path = settings.archive_file
-    existing: set[str] = set()
-    if archive_path.exists():
-        for line in archive_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if line:
-                existing.add(line)
-
-    for video_id, ps in state._states.items():
-        if ps.transcript_extracted:
-            entry = f"youtube {video_id}"
-            existing.add(entry)
-
-    archive_path.parent.mkdir(parents=True, exist_ok=True)
-    archive_path.write_text(
-        "\n".join(sorted(existing)) + "\n", encoding="utf-8"
-    )
-    logger.debug("Synced archive.txt with %d entries", len(existing))
+    DownloadArchive(settings.archive_file).sync(state)
 
 
 def _build_ydl_opts(
-    settings: Settings, temp_dir: Path, *, use_archive: bool = True
+    settings: Settings, temp_dir: Path | None, *, use_archive: bool = True
 ) -> dict:
-    """Build the yt-dlp options dictionary."""
+    """Build the yt-dlp options dictionary.
+
+    ``temp_dir`` is None when subtitles are captured in memory, in which
+    case yt-dlp is never asked to write files.
+    """
     opts: dict = {
         "skip_download": True,
         "writesubtitles": True,
         "writeautomaticsub": True,
-        "subtitleslangs": [settings.transcript_lang],
+        "subtitleslangs": [lang for lang in settings.transcript_langs if lang != "*"],
         "subtitlesformat": settings.subtitle_format,
-        "outtmpl": str(temp_dir / "%(id)s.%(ext)s"),
         "quiet": not settings.verbose,
         "no_warnings": not settings.verbose,
-        "ignoreerrors": True,
+        # Errors are raised per entry so failed videos can be queued for retry
+        "ignoreerrors": False,
     }
+    if temp_dir is not None:
+        opts["outtmpl"] = str(temp_dir / "%(id)s.%(ext)s")
     if use_archive:
         opts["download_archive"] = str(settings.archive_file.resolve())
     return opts
@@ -60,7 +73,7 @@ def _build_ydl_opts(
 
 def _build_ydl_opts_with_date(
     settings: Settings,
-    temp_dir: Path,
+    temp_dir: Path | None,
     after_date: str | None = None,
     *,
     use_archive: bool = True,
@@ -74,130 +87,1077 @@ def _build_ydl_opts_with_date(
     return opts
 
 
-def _find_subtitle_file(
-    entry: dict, settings: Settings, temp_dir: Path
-) -> Path | None:
-    """Locate the subtitle file for a video entry."""
-    requested_subs = entry.get("requested_subtitles") or {}
-    sub_info = requested_subs.get(settings.transcript_lang)
-    if not sub_info:
-        if requested_subs:
-            sub_info = next(iter(requested_subs.values()))
-
-    if sub_info:
-        filepath = sub_info.get("filepath")
-        if filepath and Path(filepath).exists():
-            return Path(filepath)
+def _find_subtitle_files(
+    entry: dict,
+    settings: Settings,
+    temp_dir: Path,
+    index: SubtitleIndex | None = None,
+) -> dict[str, Path]:
+    """Locate every subtitle file written for a video entry, by language.
 
+    With an ``index`` fed by ``SubtitleIndexPP`` this is a constant-time
+    lookup. Without one, the temp dir is scanned as a fallback.
+    """
     video_id = entry.get("id", "")
-    if video_id:
-        for path in temp_dir.iterdir():
-            if path.stem.startswith(video_id) and path.suffix in (
-                ".json3",
-                ".vtt",
-                ".srt",
-            ):
-                return path
+    if not video_id:
+        return {}
 
-    return None
+    if index is None:
+        index = SubtitleIndex()
+        index.record(entry)
+        index.scan(temp_dir)
+    else:
+        index.record(entry)
+
+    return {lang: path for lang, path in index.tracks(video_id).items() if path.exists()}
+
+
+def _find_subtitle_file(
+    entry: dict,
+    settings: Settings,
+    temp_dir: Path,
+    index: SubtitleIndex | None = None,
+) -> Path | None:
+    """Locate the preferred subtitle file for a video entry."""
+    files = _find_subtitle_files(entry, settings, temp_dir, index)
+    lang = pick_language(files, settings.transcript_langs)
+    return files[lang] if lang is not None else None
 
 
 def _detect_format(filepath: Path, settings: Settings) -> str:
     """Detect subtitle format from file extension, falling back to config."""
-    ext = filepath.suffix.lstrip(".")
-    if ext in ("json3", "vtt", "srt"):
+    return _format_for_ext(filepath.suffix.lstrip("."), settings)
+
+
+PARSEABLE_FORMATS = ("json3", "vtt", "srt")
+
+
+def _format_for_ext(ext: str, settings: Settings) -> str:
+    """Map a subtitle extension to a parser format, falling back to config."""
+    if ext in PARSEABLE_FORMATS:
         return ext
     return settings.subtitle_format
 
 
-def _process_entry(
-    entry: dict, settings: Settings, temp_dir: Path
-) -> TranscriptResult | None:
-    """Process a single video entry into a TranscriptResult."""
-    video_id = entry.get("id", "")
+def _caption_langs(settings: Settings) -> str:
+    """Key of the subtitle language list, for caption-less videos."""
+    return ",".join(settings.transcript_langs)
+
+
+def _subtitle_selection(settings: Settings) -> str:
+    """Key of the languages and format that subtitle tracks are picked with."""
+    return f"{','.join(settings.transcript_langs)};{settings.subtitle_format}"
+
+
+def _fallback_track(entry: dict, settings: Settings) -> dict | None:
+    """Pick a track for the ``*`` wildcard when no listed language exists.
+
+    Manual captions win over auto captions; among auto captions the
+    original-language track (``{lang}-orig``) wins over machine translations.
+    Only formats the parser reads are considered, preferring the configured
+    one. Returns a ``requested_subtitles``-style dict with a single language.
+    """
+    if "*" not in settings.transcript_langs:
+        return None
+    manual = entry.get("subtitles") or {}
+    auto = entry.get("automatic_captions") or {}
+    candidates = [
+        *((lang, formats) for lang, formats in manual.items() if lang != "live_chat"),
+        *((lang, formats) for lang, formats in auto.items() if lang.endswith("-orig")),
+        *auto.items(),
+    ]
+    wanted = settings.subtitle_format.split("/")
+    for lang, formats in candidates:
+        formats = [
+            f for f in formats or []
+            if (f.get("url") or f.get("data")) and f.get("ext") in PARSEABLE_FORMATS
+        ]
+        if not formats:
+            continue
+        matches = [f for f in formats if f.get("ext") in wanted]
+        chosen = (matches or formats)[-1]
+        return {lang: {**chosen, "fallback": True}}
+    return None
+
+
+# Info dict fields read by build_result
+RESULT_FIELDS = ("id", "title", "channel", "uploader", "upload_date", "webpage_url", "chapters")
+
+
+def build_result(
+    entry: dict,
+    tracks: dict[str, list[TranscriptSegment]],
+    settings: Settings,
+    auto_langs: Iterable[str] | None = None,
+) -> TranscriptResult:
+    """Build a TranscriptResult from an info dict and its parsed tracks.
+
+    The track chosen by the language priority list becomes the transcript;
+    the others are kept in ``alt_transcripts``. With ``dedupe_captions``,
+    rolling-caption repeats are collapsed first in the auto-caption tracks
+    (``auto_langs``, by default the ones marked in ``requested_subtitles``);
+    manual subtitles are left as written. With ``coalesce_seconds`` or
+    ``coalesce_chars``, fragments are then merged without crossing chapters.
+    """
+    if settings.dedupe_captions:
+        if auto_langs is None:
+            auto_langs = _auto_caption_langs(entry)
+        tracks = _dedupe_tracks(entry, tracks, set(auto_langs))
+    chapters = _chapters(entry)
+    if settings.coalesce_seconds or settings.coalesce_chars:
+        boundaries = [chapter.start for chapter in chapters]
+        tracks = {
+            lang: coalesce_segments(
+                segments, settings.coalesce_seconds, settings.coalesce_chars, boundaries
+            )
+            for lang, segments in tracks.items()
+        }
+    language = pick_language(tracks, settings.transcript_langs)
+    return TranscriptResult(
+        id=entry.get("id", ""),
+        title=entry.get("title") or "Unknown",
+        channel=entry.get("channel") or entry.get("uploader") or "Unknown",
+        upload_date=entry.get("upload_date") or "00000000",
+        webpage_url=entry.get("webpage_url") or "",
+        transcript=tracks[language],
+        language=language,
+        alt_transcripts={
+            lang: segments for lang, segments in tracks.items() if lang != language
+        },
+        chapters=chapters,
+    )
+
+
+def _auto_caption_langs(entry: dict) -> list[str]:
+    """Languages of the requested tracks that are auto captions."""
+    requested = entry.get("requested_subtitles") or {}
+    return [lang for lang, sub_info in requested.items() if (sub_info or {}).get("automatic")]
+
+
+def _mark_auto_captions(video: dict) -> None:
+    """Flag requested tracks that come from ``automatic_captions``.
+
+    yt-dlp picks a manual track over an auto caption of the same language,
+    so a requested language is an auto caption only if no manual one exists.
+    """
+    manual = video.get("subtitles") or {}
+    auto = video.get("automatic_captions") or {}
+    for lang, sub_info in (video.get("requested_subtitles") or {}).items():
+        if sub_info is not None and lang not in manual and lang in auto:
+            sub_info["automatic"] = True
+
+
+def _dedupe_tracks(
+    entry: dict, tracks: dict[str, list[TranscriptSegment]], auto_langs: set[str]
+) -> dict[str, list[TranscriptSegment]]:
+    """Deduplicate the auto-caption tracks, logging how much repeated text was dropped."""
+    deduped = {}
+    for lang, segments in tracks.items():
+        if lang not in auto_langs:
+            deduped[lang] = segments
+            continue
+        deduped[lang], stats = dedupe_segments(segments)
+        if stats.removed_chars:
+            logger.debug(
+                "Removed %d repeated caption characters (%.0f%%) from %s [%s]",
+                stats.removed_chars, stats.ratio * 100, entry.get("title") or entry.get("id"), lang,
+            )
+    return deduped
+
+
+def _chapters(entry: dict) -> list[Chapter]:
+    """Chapters of an info dict, skipping malformed ones."""
+    chapters = []
+    for chapter in entry.get("chapters") or []:
+        start = chapter.get("start_time")
+        end = chapter.get("end_time")
+        if start is None or end is None:
+            continue
+        chapters.append(
+            Chapter(title=chapter.get("title") or "", start=float(start), end=float(end))
+        )
+    return chapters
+
+
+RawTracks = dict[str, tuple[str | bytes, str]]
+"""Downloaded but unparsed subtitle tracks: ``{lang: (data, format)}``."""
+
+
+def _read_subtitle_files(
+    entry: dict,
+    settings: Settings,
+    temp_dir: Path,
+    index: SubtitleIndex | None = None,
+    ydl: ExtractorSession | None = None,
+) -> RawTracks | None:
+    """Read every subtitle file yt-dlp wrote for an entry.
+
+    A ``*`` fallback track was never written to disk, so with a ``ydl`` it
+    is fetched into memory instead.
+    """
     title = entry.get("title") or "Unknown"
-    channel = entry.get("channel") or entry.get("uploader") or "Unknown"
-    upload_date = entry.get("upload_date") or "00000000"
-    webpage_url = entry.get("webpage_url") or ""
 
-    sub_path = _find_subtitle_file(entry, settings, temp_dir)
-    if not sub_path:
+    files = _find_subtitle_files(entry, settings, temp_dir, index)
+    if not files:
+        requested = entry.get("requested_subtitles") or {}
+        fallback = {lang: info for lang, info in requested.items() if info.get("fallback")}
+        if fallback and ydl is not None:
+            return _fetch_tracks(ydl, {**entry, "requested_subtitles": fallback}, settings)
         logger.warning("No transcript found for: %s", title)
         return None
 
-    fmt = _detect_format(sub_path, settings)
+    raw: RawTracks = {}
+    for lang, sub_path in files.items():
+        try:
+            raw[lang] = (sub_path.read_bytes(), _detect_format(sub_path, settings))
+        except OSError as e:
+            logger.error("Failed to read %s subtitles for %s: %s", lang, title, e)
+    return raw or None
 
-    try:
-        segments = parse_subtitle_file(sub_path, fmt)
-    except Exception as e:
-        logger.error("Failed to parse subtitles for %s: %s", title, e)
+
+def _fetch_track(ydl: ExtractorSession, entry: dict, sub_info: dict) -> str | bytes:
+    """Return a subtitle track's inline data, or download it into memory."""
+    data = sub_info.get("data")
+    if data is None:
+        headers = sub_info.get("http_headers") or entry.get("http_headers") or {}
+        with ydl.urlopen(Request(sub_info["url"], headers=headers)) as response:
+            data = response.read()
+    return data
+
+
+def _fetch_tracks(
+    ydl: ExtractorSession, entry: dict, settings: Settings
+) -> RawTracks | None:
+    """Fetch an entry's selected subtitle tracks into memory.
+
+    The entry must have been resolved with ``download=False``, so
+    ``requested_subtitles`` carries track URLs (or inline data) and nothing
+    has been written to disk.
+    """
+    title = entry.get("title") or "Unknown"
+
+    # yt-dlp only applies the date filter when downloading
+    daterange = ydl.params.get("daterange")
+    upload_date = entry.get("upload_date")
+    if daterange and upload_date and upload_date not in daterange:
+        logger.debug("Outside date range, skipping: %s", title)
         return None
 
-    return TranscriptResult(
-        id=video_id,
-        title=title,
-        channel=channel,
-        upload_date=upload_date,
-        webpage_url=webpage_url,
-        transcript=segments,
-    )
+    requested_subs = entry.get("requested_subtitles") or {}
+    if not requested_subs:
+        logger.warning("No transcript found for: %s", title)
+        return None
 
+    raw: RawTracks = {}
+    for lang, sub_info in requested_subs.items():
+        try:
+            data = _fetch_track(ydl, entry, sub_info)
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
+            logger.error("Failed to capture %s subtitles for %s: %s", lang, title, e)
+            continue
+        raw[lang] = (data, _format_for_ext(sub_info.get("ext", ""), settings))
+    return raw or None
 
-def _flatten_entries(info: dict) -> list[dict]:
-    """Recursively flatten playlist/channel entries."""
+
+def _parse_tracks(entry: dict, raw: RawTracks) -> dict[str, list[TranscriptSegment]]:
+    """Parse downloaded tracks, dropping any that fail."""
+    tracks: dict[str, list[TranscriptSegment]] = {}
+    for lang, (data, fmt) in raw.items():
+        try:
+            tracks[lang] = parse_subtitle_data(data, fmt)
+        except Exception as e:
+            logger.error(
+                "Failed to parse %s subtitles for %s: %s", lang, entry.get("title"), e
+            )
+    return tracks
+
+
+def _process_entry(
+    entry: dict,
+    settings: Settings,
+    temp_dir: Path,
+    index: SubtitleIndex | None = None,
+    ydl: ExtractorSession | None = None,
+) -> TranscriptResult | None:
+    """Process a single video entry into a TranscriptResult."""
+    raw = _read_subtitle_files(entry, settings, temp_dir, index, ydl)
+    tracks = _parse_tracks(entry, raw) if raw else {}
+    return build_result(entry, tracks, settings) if tracks else None
+
+
+def _capture_entry(
+    ydl: ExtractorSession, entry: dict, settings: Settings
+) -> TranscriptResult | None:
+    """Fetch an entry's selected subtitle tracks into memory and parse them."""
+    raw = _fetch_tracks(ydl, entry, settings)
+    tracks = _parse_tracks(entry, raw) if raw else {}
+    return build_result(entry, tracks, settings) if tracks else None
+
+
+class _ParseStage:
+    """Parses downloaded subtitle tracks, optionally on a process pool.
+
+    With a ``pool``, tracks are submitted as soon as they are downloaded and
+    the thread driving the session goes straight back to the network while
+    other cores parse. Results come back in submission order; at most
+    ``max_pending`` videos are in flight before the oldest is waited for.
+    Without a pool, tracks are parsed inline.
+    """
+
+    def __init__(self, settings: Settings, pool: Executor | None = None, max_pending: int = 1):
+        self.settings = settings
+        self.pool = pool
+        self.max_pending = max(max_pending, 1)
+        self._pending: deque[tuple[dict, dict[str, Future]]] = deque()
+
+    def submit(self, entry: dict, raw: RawTracks) -> None:
+        """Queue an entry's tracks for parsing."""
+        if self.pool is None:
+            self._pending.append((entry, raw))
+            return
+        futures = {
+            lang: self.pool.submit(parse_subtitle_data, data, fmt)
+            for lang, (data, fmt) in raw.items()
+        }
+        self._pending.append((entry, futures))
+
+    def ready(self) -> Iterator[TranscriptResult]:
+        """Yield results whose tracks are parsed, keeping submission order."""
+        while self._pending and (
+            len(self._pending) > self.max_pending or self._head_done()
+        ):
+            result = self._finish(*self._pending.popleft())
+            if result:
+                yield result
+
+    def drain(self) -> Iterator[TranscriptResult]:
+        """Wait for and yield every pending result."""
+        while self._pending:
+            result = self._finish(*self._pending.popleft())
+            if result:
+                yield result
+
+    def _head_done(self) -> bool:
+        if self.pool is None:
+            return True
+        return all(future.done() for future in self._pending[0][1].values())
+
+    def _finish(self, entry: dict, pending: dict) -> TranscriptResult | None:
+        if self.pool is None:
+            tracks = _parse_tracks(entry, pending)
+        else:
+            tracks = {}
+            for lang, future in pending.items():
+                try:
+                    tracks[lang] = future.result()
+                except Exception as e:
+                    logger.error(
+                        "Failed to parse %s subtitles for %s: %s", lang, entry.get("title"), e
+                    )
+        return build_result(entry, tracks, self.settings) if tracks else None
+
+
+def _iter_entries(info: dict | None) -> Iterator[dict]:
+    """Lazily flatten playlist/channel entries, yielding leaf entries in order."""
     if info is None:
-        return []
+        return
     entries = info.get("entries")
     if entries is None:
-        return [info]
-    result = []
+        yield info
+        return
     for entry in entries:
         if entry is None:
             continue
-        result.extend(_flatten_entries(entry))
-    return result
+        yield from _iter_entries(entry)
 
 
-def extract_transcripts(
+def _flatten_entries(info: dict) -> list[dict]:
+    """Recursively flatten playlist/channel entries."""
+    return list(_iter_entries(info))
+
+
+class _KnownFilter:
+    """Listing filter that drops videos whose transcript is already extracted.
+
+    Flat listings carry the video ID, so known videos are diffed out against
+    the processing state before any per-video page is fetched.
+    """
+
+    def __init__(self, state: ProcessingStateManager):
+        self.state = state
+        self.skipped = 0
+
+    def __call__(self, entry: dict) -> bool:
+        video_id = entry.get("id")
+        if video_id and self.state.is_transcript_extracted(video_id):
+            logger.debug("Already extracted, skipping: %s", video_id)
+            self.skipped += 1
+            return False
+        return True
+
+
+class _UnavailableFilter:
+    """Listing filter that drops videos in the negative cache.
+
+    Videos known to be private, removed, region-blocked or caption-less are
+    skipped before any per-video request, until their recheck time.
+    """
+
+    def __init__(self, unavailable: NegativeCache, langs: str = ""):
+        self.unavailable = unavailable
+        self.langs = langs
+        self.skipped = 0
+
+    def __call__(self, entry: dict) -> bool:
+        video_id = entry.get("id")
+        cached = self.unavailable.get(video_id, langs=self.langs) if video_id else None
+        if cached:
+            logger.debug("Known unavailable (%s), skipping: %s", cached.reason, video_id)
+            self.skipped += 1
+            return False
+        return True
+
+
+def _all_of(filters: list[Callable[[dict], bool]]) -> Callable[[dict], bool] | None:
+    """Combine listing filters; an entry is kept only if every filter keeps it."""
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return lambda entry: all(keep(entry) for keep in filters)
+
+
+class _WatermarkWalk:
+    """Walks newest-first listings and stops each one at its watermark.
+
+    A bare channel URL lists its Videos, Shorts and Live tabs as nested
+    playlists, each sorted newest-first on its own. Every playlist therefore
+    has its own watermark, keyed by its ``webpage_url`` (the top-level
+    listing uses the requested URL), and reaching one ends only that
+    playlist. The first entry of each is remembered in ``newest`` so the
+    caller can advance the watermarks once the walk has completed.
+    """
+
+    def __init__(self, watermarks: ChannelWatermarks, url: str, force: bool = False):
+        self.watermarks = watermarks
+        self.url = url
+        self.force = force
+        self.marks: dict[str, ChannelWatermark | None] = {}
+        self.newest: dict[str, dict] = {}
+
+    def walk(self, info: dict) -> Iterator[dict]:
+        yield from self._walk(info, self.url)
+
+    def _walk(self, playlist: dict, key: str) -> Iterator[dict]:
+        entries = playlist.get("entries")
+        if entries is None:
+            yield playlist
+            return
+        if key not in self.marks:
+            self.marks[key] = None if self.force else self.watermarks.get(key)
+        mark = self.marks[key]
+        for entry in entries:
+            if entry is None:
+                continue
+            if entry.get("entries") is not None:
+                yield from self._walk(entry, entry.get("webpage_url") or key)
+                continue
+            self.newest.setdefault(key, entry)
+            if mark and _is_known(mark, entry):
+                logger.info(
+                    "Reached sync watermark at %s, stopping listing of %s",
+                    entry.get("id"), key,
+                )
+                return
+            yield entry
+
+
+def _is_known(mark: ChannelWatermark, entry: dict) -> bool:
+    """Whether a listed entry is at or below a watermark."""
+    if entry.get("id") == mark.video_id:
+        return True
+    upload_date = entry.get("upload_date")
+    return bool(upload_date and mark.upload_date and upload_date < mark.upload_date)
+
+
+class _GuardedListing:
+    """Iterates a lazy listing, ending it cleanly if a page fails to load.
+
+    ``failed`` tells the caller the walk was cut short, so a channel
+    watermark is not advanced past videos that were never listed.
+    """
+
+    def __init__(self, entries: Iterator[dict], url: str):
+        self.url = url
+        self.failed = False
+        self._entries = self._guard(entries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self
+
+    def __next__(self) -> dict:
+        return next(self._entries)
+
+    def _guard(self, entries: Iterator[dict]) -> Iterator[dict]:
+        try:
+            yield from entries
+        except Exception as e:
+            logger.error("Failed to list entries of %s: %s", self.url, e)
+            self.failed = True
+
+
+@contextlib.contextmanager
+def _workspace(settings: Settings) -> Iterator[Path | None]:
+    """Temp dir for subtitle files, or None when capturing in memory."""
+    if settings.subtitle_capture == "memory":
+        yield None
+        return
+    with tempfile.TemporaryDirectory() as temp_dir_str:
+        yield Path(temp_dir_str)
+
+
+class _Extractor:
+    """Turns listed entries into transcripts using one extractor session.
+
+    Every worker owns one of these together with its session, temp dir and
+    subtitle index; the rate limiter, listing filters and metadata cache are
+    shared. ``keep`` applies to every entry, ``entry_filter`` only to
+    entries listed by a channel or playlist, never to a video URL the user
+    passed in.
+    """
+
+    def __init__(
+        self,
+        ydl: ExtractorSession,
+        settings: Settings,
+        temp_dir: Path | None,
+        index: SubtitleIndex,
+        limiter: RateLimiter | None = None,
+        keep: Callable[[dict], bool] | None = None,
+        cache: MetadataCache | None = None,
+        refresh: bool = False,
+        retries: RetryQueue | None = None,
+        unavailable: NegativeCache | None = None,
+        parser: _ParseStage | None = None,
+        entry_filter: Callable[[dict], bool] | None = None,
+    ):
+        self.ydl = ydl
+        self.settings = settings
+        self.temp_dir = temp_dir
+        self.index = index
+        self.limiter = limiter
+        self.keep = keep
+        self.cache = cache
+        self.refresh = refresh
+        self.retries = retries
+        self.unavailable = unavailable
+        self.parser = parser or _ParseStage(settings)
+        self.entry_filter = entry_filter
+
+    def extract(
+        self, entries: Iterable[dict], listed: bool = True
+    ) -> Iterator[TranscriptResult]:
+        """Resolve entries one at a time and yield their transcripts.
+
+        ``entries`` come from an ``extract_info(..., process=False)`` listing,
+        so they are still lazy url references. Each one is resolved (and
+        nested playlists walked) only when the consumer asks for the next
+        video. Entries rejected by ``keep`` (or, when ``listed`` from a
+        channel or playlist, by ``entry_filter``) are dropped, and entries in
+        the metadata cache are served from it, before any page is fetched.
+        """
+        yield from self._extract(entries, listed)
+        yield from self.parser.drain()
+
+    def _extract(self, entries: Iterable[dict], listed: bool) -> Iterator[TranscriptResult]:
+        for entry in entries:
+            if self.keep and not self.keep(entry):
+                continue
+            if listed and self.entry_filter and not self.entry_filter(entry):
+                continue
+
+            hit, video, raw = self._from_cache(entry)
+            if hit:
+                if raw:
+                    self.parser.submit(video, raw)
+                    yield from self.parser.ready()
+                continue
+
+            if entry.get("_type") == "url":
+                try:
+                    nested = with_backoff(
+                        self.limiter,
+                        self.ydl.extract_info,
+                        entry["url"],
+                        download=False,
+                        ie_key=entry.get("ie_key"),
+                        process=False,
+                    )
+                except Exception as e:
+                    logger.error("Failed to resolve %s: %s", entry.get("url"), e)
+                    self._failed(entry, e)
+                    continue
+                # A listed entry was filtered on its listing metadata already
+                is_listing = nested is not None and nested.get("entries") is not None
+                yield from self._extract(_iter_entries(nested), is_listing)
+                continue
+
+            try:
+                resolved = with_backoff(
+                    self.limiter,
+                    self.ydl.process_ie_result,
+                    entry,
+                    download=self.temp_dir is not None,
+                )
+            except Exception as e:
+                logger.error("Failed to process %s: %s", entry.get("id", "?"), e)
+                self._failed(entry, e)
+                continue
+
+            for video in _iter_entries(resolved):
+                self._resolved(video)
+                if not video.get("requested_subtitles"):
+                    video["requested_subtitles"] = _fallback_track(video, self.settings)
+                if not video.get("requested_subtitles"):
+                    self._no_captions(video)
+                _mark_auto_captions(video)
+                if self.cache:
+                    self.cache.put(video, _subtitle_selection(self.settings))
+                try:
+                    raw = self._consume(video)
+                except Exception as e:
+                    logger.error("Failed to fetch subtitles for %s: %s", video.get("id", "?"), e)
+                    self._failed(video, e)
+                    continue
+                if raw:
+                    self.parser.submit(video, raw)
+                yield from self.parser.ready()
+
+    def _resolved(self, video: dict) -> None:
+        """Forget earlier failures of a video that resolved."""
+        video_id = video.get("id")
+        if not video_id:
+            return
+        if self.retries is not None:
+            self.retries.remove(video_id)
+        if self.unavailable is not None:
+            self.unavailable.remove(video_id)
+
+    def _failed(self, entry: dict, error: Exception) -> None:
+        """Record a failed video as unavailable, or queue it for a retry."""
+        video_id = entry.get("id")
+        if not video_id:
+            return
+        reason = classify_error(error)
+        if reason and self.unavailable is not None:
+            logger.info("Marking %s as unavailable (%s)", video_id, reason)
+            self.unavailable.add(video_id, reason)
+            if self.retries is not None:
+                self.retries.remove(video_id)
+        elif self.retries is not None:
+            self.retries.record_failure(video_id, _entry_url(entry), str(error))
+
+    def _no_captions(self, video: dict) -> None:
+        """Remember a video without captions so later runs skip it.
+
+        Auto captions can take a while to appear on fresh uploads, so those
+        are queued for a retry instead.
+        """
+        video_id = video.get("id")
+        if not video_id:
+            return
+        upload_date = video.get("upload_date") or ""
+        recent = (date.today() - timedelta(days=RECENT_UPLOAD_DAYS)).strftime("%Y%m%d")
+        if upload_date >= recent:
+            if self.retries is not None:
+                self.retries.record_failure(video_id, _entry_url(video), "no captions yet")
+        elif self.unavailable is not None:
+            self.unavailable.add(video_id, NO_CAPTIONS, _caption_langs(self.settings))
+
+    def _from_cache(self, entry: dict) -> tuple[bool, dict, RawTracks | None]:
+        """Serve an entry's metadata and subtitle tracks from the metadata cache.
+
+        Returns ``(hit, video, tracks)``. A hit with no tracks means the cache
+        already knows the video has no subtitles for the requested language.
+        """
+        video_id = entry.get("id")
+        if not self.cache or self.refresh or not video_id:
+            return False, entry, None
+        cached = self.cache.get(video_id, _subtitle_selection(self.settings))
+        if not cached or cached.get("subtitles") is None:
+            return False, entry, None
+
+        video = {**cached, "requested_subtitles": cached["subtitles"]}
+        if not video["requested_subtitles"]:
+            logger.warning("No transcript found for: %s (cached)", video.get("title"))
+            return True, video, None
+
+        try:
+            raw = with_backoff(self.limiter, _fetch_tracks, self.ydl, video, self.settings)
+        except Exception as e:
+            logger.error("Failed to fetch cached subtitles for %s: %s", video_id, e)
+            raw = None
+        if raw is None:
+            # Track URLs may have expired; resolve the video again
+            self.cache.invalidate(video_id)
+            return False, entry, None
+        logger.debug("Served from metadata cache: %s", video_id)
+        if self.retries is not None:
+            self.retries.remove(video_id)
+        return True, video, raw
+
+    def _consume(self, entry: dict) -> RawTracks | None:
+        """Download a resolved entry's tracks, then drop its subtitle files."""
+        if self.temp_dir is None:
+            return with_backoff(self.limiter, _fetch_tracks, self.ydl, entry, self.settings)
+        try:
+            return _read_subtitle_files(
+                entry, self.settings, self.temp_dir, self.index, self.ydl
+            )
+        finally:
+            for path in self.index.pop(entry.get("id", "")):
+                if path.parent == self.temp_dir:
+                    path.unlink(missing_ok=True)
+
+
+def _entry_url(entry: dict) -> str:
+    """Best URL to resolve an entry again on its own."""
+    return (
+        entry.get("webpage_url")
+        or entry.get("original_url")
+        or entry.get("url")
+        or f"https://www.youtube.com/watch?v={entry['id']}"
+    )
+
+
+def _iter_parallel(
+    entries: Iterator[dict],
+    open_extractor: Callable[[], contextlib.AbstractContextManager[_Extractor]],
+    jobs: int,
+) -> Iterator[TranscriptResult]:
+    """Shard entries across worker threads and yield results as they finish.
+
+    Each worker owns its YoutubeDL instance and temp dir and pulls the next
+    entry from the shared listing, so slow videos do not hold up the rest.
+    The result queue is bounded, keeping memory flat when the consumer is
+    slower than the workers.
+    """
+    source_lock = threading.Lock()
+    results: queue.Queue = queue.Queue(maxsize=jobs * 2)
+    stop = threading.Event()
+    done = object()
+
+    def next_entry() -> dict | None:
+        with source_lock:
+            try:
+                return next(entries, None)
+            except Exception as e:
+                logger.error("Failed to list entries: %s", e)
+                return None
+
+    def put(item: object) -> None:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def claimed() -> Iterator[dict]:
+        while not stop.is_set():
+            entry = next_entry()
+            if entry is None:
+                return
+            yield entry
+
+    def worker() -> None:
+        try:
+            with open_extractor() as extractor:
+                for result in extractor.extract(claimed()):
+                    put(result)
+        except Exception as e:
+            logger.error("Extraction worker failed: %s", e)
+        finally:
+            put(done)
+
+    threads = [
+        threading.Thread(target=worker, name=f"extract-{i}", daemon=True)
+        for i in range(jobs)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        remaining = jobs
+        while remaining:
+            item = results.get()
+            if item is done:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def _parse_pool(settings: Settings) -> ProcessPoolExecutor | None:
+    """Process pool for subtitle parsing, or None to parse inline."""
+    if settings.parse_workers <= 0:
+        return None
+    # Extraction runs threads; spawned workers avoid forking a threaded process
+    return ProcessPoolExecutor(
+        max_workers=settings.parse_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _advance_watermarks(
+    watermarks: ChannelWatermarks, walk: _WatermarkWalk, dates: dict[str, str]
+) -> None:
+    """Move every listing's watermark to its newest entry after a completed walk.
+
+    ``dates`` maps extracted video IDs to their upload dates, for flat
+    listings that do not carry one.
+    """
+    for key, newest in walk.newest.items():
+        newest_id = newest.get("id")
+        if not newest_id:
+            continue
+        mark = walk.marks.get(key)
+        upload_date = newest.get("upload_date") or dates.get(newest_id, "")
+        if not upload_date and mark and mark.video_id == newest_id:
+            upload_date = mark.upload_date
+        if upload_date == "00000000":
+            upload_date = ""
+        watermarks.set(key, newest_id, upload_date)
+        logger.debug("Sync watermark for %s is now %s", key, newest_id)
+
+
+def iter_transcripts(
     urls: list[str],
     settings: Settings,
     after_date: str | None = None,
     state: ProcessingStateManager | None = None,
     force: bool = False,
-) -> list[TranscriptResult]:
-    """Extract transcripts from a list of URLs (videos, channels, or playlists)."""
+    jobs: int | None = None,
+    watermarks: ChannelWatermarks | None = None,
+    retries: RetryQueue | None = None,
+    unavailable: NegativeCache | None = None,
+    backend: ExtractorBackend | None = None,
+) -> Iterator[TranscriptResult]:
+    """Yield transcripts from a list of URLs as soon as each video is parsed.
+
+    Unlike ``extract_transcripts``, results are produced one video at a time,
+    so callers can persist progress incrementally and memory stays flat on
+    large channels. Channels and playlists are listed flat first; videos
+    already marked as extracted in ``state`` are skipped without any
+    per-video request unless ``force`` is set. With ``jobs`` > 1 (default:
+    ``settings.extract_jobs``) videos are resolved concurrently and results
+    arrive in completion order.
+
+    When ``watermarks`` is given, each listing (and each channel tab listed
+    in it) is walked newest-first only down to its last recorded watermark,
+    and the watermarks are advanced once a walk completes. ``force`` walks
+    the full listing, and so does a run with ``after_date`` or an entry
+    filter, which leaves the watermarks untouched.
+
+    When ``retries`` is given, videos that fail to resolve are queued there
+    with backoff, and queued videos are dropped from it once they succeed.
+    When ``unavailable`` is given, permanent failures (private, removed,
+    region-blocked or caption-less videos) are recorded there instead, and
+    videos already in it are skipped without any request unless ``force``
+    is set.
+
+    Requests that are rate limited (HTTP 429, bot checks) are retried after
+    a cooldown, and the shared request rate adapts: it halves on each rate
+    limit and recovers gradually on success (see ``RateLimiter``).
+
+    Listing entries are also checked against the duration, type and title
+    filters in ``settings`` (see ``EntryFilter``) before they are resolved.
+    Single video URLs are never filtered.
+
+    Listings, metadata and subtitles come from ``backend`` (default: the one
+    selected by ``settings.extractor_backend``). With
+    ``settings.parse_workers`` > 0, subtitle parsing runs on a process pool
+    of that size while the network-bound workers keep downloading.
+    """
     if state and not force:
         _sync_archive_file(settings, state)
 
     use_archive = not force
-    results: list[TranscriptResult] = []
-
-    with tempfile.TemporaryDirectory() as temp_dir_str:
-        temp_dir = Path(temp_dir_str)
-        ydl_opts = _build_ydl_opts_with_date(
-            settings, temp_dir, after_date, use_archive=use_archive
+    backend = backend or create_extractor_backend(settings)
+    jobs = jobs or settings.extract_jobs
+    limiter = RateLimiter(settings.request_rate)
+    known = _KnownFilter(state) if state and not force else None
+    skip_unavailable = (
+        _UnavailableFilter(unavailable, _caption_langs(settings))
+        if unavailable is not None and not force
+        else None
+    )
+    entry_filter = EntryFilter.from_settings(settings)
+    if watermarks is not None and (after_date or entry_filter):
+        # A filtered walk skips videos a later unfiltered run still needs
+        logger.info("Date or entry filters set; listing without sync watermarks")
+        watermarks = None
+    keep = _all_of([f for f in (known, skip_unavailable) if f])
+    cache = None
+    if settings.metadata_cache_ttl > 0:
+        cache = MetadataCache(
+            settings.data_dir / "cache" / "metadata",
+            ttl=settings.metadata_cache_ttl,
+            max_entries=settings.metadata_cache_size,
         )
+    count = 0
+    pool = _parse_pool(settings)
+
+    @contextlib.contextmanager
+    def open_extractor() -> Iterator[_Extractor]:
+        with _workspace(settings) as temp_dir:
+            opts = _build_ydl_opts_with_date(
+                settings, temp_dir, after_date, use_archive=use_archive
+            )
+            index = SubtitleIndex()
+            with backend.open(opts, index) as ydl:
+                yield _Extractor(
+                    ydl,
+                    settings,
+                    temp_dir,
+                    index,
+                    limiter,
+                    keep,
+                    cache,
+                    refresh=force,
+                    retries=retries,
+                    unavailable=unavailable,
+                    parser=_ParseStage(settings, pool, max_pending=settings.parse_workers * 2),
+                    entry_filter=entry_filter,
+                )
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            for url in urls:
-                logger.info("Processing: %s", url)
+    with pool or contextlib.nullcontext(), open_extractor() as extractor:
+        for url in urls:
+            logger.info("Processing: %s", url)
+            video_id = backend.video_id(url)
+            if video_id:
+                # Single videos skip the listing request; the entry is only
+                # resolved if the state and metadata cache do not cover it.
+                info = {"_type": "url", "url": url, "id": video_id}
+            else:
                 try:
-                    info = ydl.extract_info(url, download=True)
+                    info = with_backoff(
+                        limiter, extractor.ydl.extract_info, url, download=False, process=False
+                    )
                 except Exception as e:
                     logger.error("Failed to process %s: %s", url, e)
                     continue
 
-                if info is None:
-                    continue
+            if info is None:
+                continue
 
-                entries = _flatten_entries(info)
-                for entry in entries:
-                    result = _process_entry(entry, settings, temp_dir)
-                    if result:
-                        results.append(result)
+            walk = None
+            if watermarks is not None:
+                walk = _WatermarkWalk(watermarks, url, force=force)
+                listing = _GuardedListing(walk.walk(info), url)
+            else:
+                listing = _GuardedListing(_iter_entries(info), url)
 
-    logger.info("Extracted %d transcript(s)", len(results))
-    return results
+            is_listing = info.get("entries") is not None
+            if jobs > 1 and is_listing:
+                results = _iter_parallel(listing, open_extractor, jobs)
+            else:
+                results = extractor.extract(listing, is_listing)
+
+            dates: dict[str, str] = {}
+            for result in results:
+                if walk and any(result.id == e.get("id") for e in walk.newest.values()):
+                    dates[result.id] = result.upload_date
+                count += 1
+                yield result
+
+            if walk and not listing.failed:
+                _advance_watermarks(watermarks, walk, dates)
+
+    if known and known.skipped:
+        logger.info("Skipped %d already-extracted video(s) from listing", known.skipped)
+    if skip_unavailable and skip_unavailable.skipped:
+        logger.info(
+            "Skipped %d known-unavailable video(s) from listing", skip_unavailable.skipped
+        )
+    if entry_filter and entry_filter.skipped:
+        logger.info(
+            "Filtered out %d video(s) by duration, type or title", entry_filter.skipped
+        )
+    if limiter.throttle_count:
+        logger.info(
+            "Rate limited %d time(s); request rate ended at %.2f requests/s",
+            limiter.throttle_count,
+            limiter.rate,
+        )
+    logger.info("Extracted %d transcript(s)", count)
+
+
+def extract_transcripts(
+    urls: list[str],
+    settings: Settings,
+    after_date: str | None = None,
+    state: ProcessingStateManager | None = None,
+    force: bool = False,
+    jobs: int | None = None,
+) -> list[TranscriptResult]:
+    """Extract transcripts from a list of URLs (videos, channels, or playlists)."""
+    return list(
+        iter_transcripts(
+            urls, settings, after_date=after_date, state=state, force=force, jobs=jobs
+        )
+    )
+
+
+def iter_channel(
+    channel_url: str,
+    settings: Settings,
+    after_date: str | None = None,
+    state: ProcessingStateManager | None = None,
+    force: bool = False,
+    jobs: int | None = None,
+    watermarks: ChannelWatermarks | None = None,
+    retries: RetryQueue | None = None,
+    unavailable: NegativeCache | None = None,
+) -> Iterator[TranscriptResult]:
+    """Yield transcripts from a YouTube channel as they are extracted."""
+    return iter_transcripts(
+        [channel_url],
+        settings,
+        after_date=after_date,
+        state=state,
+        force=force,
+        jobs=jobs,
+        watermarks=watermarks,
+        retries=retries,
+        unavailable=unavailable,
+    )
+
+
+def iter_playlist(
+    playlist_url: str,
+    settings: Settings,
+    state: ProcessingStateManager | None = None,
+    force: bool = False,
+    jobs: int | None = None,
+    retries: RetryQueue | None = None,
+    unavailable: NegativeCache | None = None,
+) -> Iterator[TranscriptResult]:
+    """Yield transcripts from a playlist as they are extracted."""
+    return iter_transcripts(
+        [playlist_url],
+        settings,
+        state=state,
+        force=force,
+        jobs=jobs,
+        retries=retries,
+        unavailable=unavailable,
+    )
 
 
 def extract_channel(
@@ -206,10 +1166,20 @@ def extract_channel(
     after_date: str | None = None,
     state: ProcessingStateManager | None = None,
     force: bool = False,
+    jobs: int | None = None,
+    watermarks: ChannelWatermarks | None = None,
 ) -> list[TranscriptResult]:
     """Extract transcripts from a YouTube channel."""
-    return extract_transcripts(
-        [channel_url], settings, after_date=after_date, state=state, force=force
+    return list(
+        iter_channel(
+            channel_url,
+            settings,
+            after_date=after_date,
+            state=state,
+            force=force,
+            jobs=jobs,
+            watermarks=watermarks,
+        )
     )
 
 
@@ -218,8 +1188,7 @@ def extract_playlist(
     settings: Settings,
     state: ProcessingStateManager | None = None,
     force: bool = False,
+    jobs: int | None = None,
 ) -> list[TranscriptResult]:
     """Extract transcripts from a playlist."""
-    return extract_transcripts(
-        [playlist_url], settings, state=state, force=force
-    )
+    return list(iter_playlist(playlist_url, settings, state=state, force=force, jobs=jobs))
@@ -0,0 +1,102 @@
+"""Listing filters on duration, video type and title, applied before any fetch."""
+
+import logging
+import re
+
+from study.core.config import Settings
+
+logger = logging.getLogger("study")
+
+LIVE_STATUSES = ("is_live", "was_live", "is_upcoming", "post_live")
+
+
+class EntryFilter:
+    """Keeps listing entries that match duration, type and title criteria.
+
+    Evaluated against the flat metadata of a channel or playlist listing
+    (``title``, ``duration``, ``live_status``, ``url``), so rejected videos
+    cost no per-video request and no AI tokens. Criteria whose metadata is
+    missing from an entry do not reject it.
+    """
+
+    def __init__(
+        self,
+        min_duration: int = 0,
+        max_duration: int = 0,
+        skip_shorts: bool = False,
+        skip_live: bool = False,
+        title_include: str = "",
+        title_exclude: str = "",
+    ):
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.skip_shorts = skip_shorts
+        self.skip_live = skip_live
+        self.title_include = re.compile(title_include, re.IGNORECASE) if title_include else None
+        self.title_exclude = re.compile(title_exclude, re.IGNORECASE) if title_exclude else None
+        self.skipped = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "EntryFilter | None":
+        """Build the filter configured in settings, or None if nothing is filtered."""
+        entry_filter = cls(
+            min_duration=settings.min_duration,
+            max_duration=settings.max_duration,
+            skip_shorts=settings.skip_shorts,
+            skip_live=settings.skip_live,
+            title_include=settings.title_include,
+            title_exclude=settings.title_exclude,
+        )
+        return entry_filter if entry_filter.active else None
+
+    @property
+    def active(self) -> bool:
+        return bool(
+            self.min_duration
+            or self.max_duration
+            or self.skip_shorts
+            or self.skip_live
+            or self.title_include
+            or self.title_exclude
+        )
+
+    def __call__(self, entry: dict) -> bool:
+        reason = self.reject_reason(entry)
+        if reason:
+            logger.debug("Filtered out (%s): %s", reason, entry.get("title") or entry.get("id"))
+            self.skipped += 1
+            return False
+        return True
+
+    def reject_reason(self, entry: dict) -> str | None:
+        """Return why an entry is filtered out, or None to keep it."""
+        if entry.get("ie_key") == "YoutubeTab" or entry.get("_type") == "playlist":
+            return self._tab_reject_reason(entry)
+        duration = entry.get("duration")
+        if self.skip_live and entry.get("live_status") in LIVE_STATUSES:
+            return "live"
+        # Shorts are told apart by their /shorts/ links, not by duration:
+        # they run up to three minutes, and short regular uploads exist
+        if self.skip_shorts and "/shorts/" in (entry.get("url") or entry.get("webpage_url") or ""):
+            return "short"
+        if duration is not None:
+            if self.min_duration and duration < self.min_duration:
+                return "too short"
+            if self.max_duration and duration > self.max_duration:
+                return "too long"
+        title = entry.get("title")
+        if title is not None:
+            if self.title_include and not self.title_include.search(title):
+                return "title not included"
+            if self.title_exclude and self.title_exclude.search(title):
+                return "title excluded"
+        return None
+
+    def _tab_reject_reason(self, entry: dict) -> str | None:
+        """Skip whole channel tabs; other nested listings are filtered per video."""
+        url = (entry.get("url") or entry.get("webpage_url") or "").rstrip("/")
+        if self.skip_shorts and url.endswith("/shorts"):
+            return "shorts tab"
+        if self.skip_live and url.endswith("/streams"):
+            return "live tab"
+        return None
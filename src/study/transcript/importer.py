@@ -0,0 +1,204 @@
+"""Bulk import of subtitle files already on disk, without going through yt-dlp."""
+
+import json
+import logging
+import os
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from study.core.config import Settings
+from study.core.models import TranscriptSegment
+from study.core.state import ProcessingStateManager
+from study.transcript.extractor import RESULT_FIELDS, build_result
+from study.transcript.parser import parse_subtitle_file
+from study.transcript.storage import TranscriptStorage
+from study.transcript.subtitle_index import SUBTITLE_SUFFIXES
+
+logger = logging.getLogger("study")
+
+BATCH_SIZE = 500
+
+_VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+_BRACKETED_ID_RE = re.compile(r"\[([A-Za-z0-9_-]{11})\]")
+_LANG_RE = re.compile(r"[A-Za-z]{2,3}(?:-[A-Za-z0-9]+)*")
+
+
+@dataclass
+class ImportItem:
+    """Subtitle files of one video found on disk, with its metadata sidecar."""
+
+    video_id: str
+    files: dict[str, Path] = field(default_factory=dict)
+    info_path: Path | None = None
+
+
+@dataclass
+class ImportStats:
+    """Counts of an import run."""
+
+    imported: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+
+def split_subtitle_name(name: str) -> tuple[str | None, str, str]:
+    """Split a subtitle filename into ``(video_id, lang, base)``.
+
+    Understands ``{id}.{lang}.{ext}``, ``{id}.{ext}`` and yt-dlp's default
+    ``{title} [{id}].{lang}.{ext}``. ``base`` is the name without language
+    and extension, which is also the stem of a ``{base}.info.json`` sidecar.
+    The video ID is None when the name does not contain one.
+    """
+    base = name.rsplit(".", 1)[0]
+    lang = ""
+    head, dot, tail = base.rpartition(".")
+    if dot and _LANG_RE.fullmatch(tail):
+        base, lang = head, tail
+    bracketed = _BRACKETED_ID_RE.findall(base)
+    if bracketed:
+        return bracketed[-1], lang, base
+    if _VIDEO_ID_RE.fullmatch(base):
+        return base, lang, base
+    return None, lang, base
+
+
+def scan_subtitle_dir(root: Path) -> list[ImportItem]:
+    """Find every subtitle file under a directory tree, grouped by video ID.
+
+    Copies of the same video in several directories are merged; the first
+    file found for each language wins.
+    """
+    items: dict[str, ImportItem] = {}
+    sidecars: dict[tuple[Path, str], Path] = {}
+    subtitles: list[tuple[str, str, str, Path]] = []
+    for dirpath, _, filenames in os.walk(root):
+        directory = Path(dirpath)
+        for name in sorted(filenames):
+            if name.endswith(".info.json"):
+                sidecars[(directory, name[: -len(".info.json")])] = directory / name
+                continue
+            if os.path.splitext(name)[1] not in SUBTITLE_SUFFIXES:
+                continue
+            video_id, lang, base = split_subtitle_name(name)
+            if video_id is None:
+                logger.warning("No video ID in subtitle filename, skipping: %s", directory / name)
+                continue
+            subtitles.append((video_id, lang, base, directory / name))
+
+    for video_id, lang, base, path in subtitles:
+        item = items.setdefault(video_id, ImportItem(video_id=video_id))
+        item.files.setdefault(lang, path)
+        if item.info_path is None:
+            item.info_path = sidecars.get((path.parent, base))
+    return list(items.values())
+
+
+def _parse_item(
+    files: dict[str, Path], info_path: Path | None
+) -> tuple[dict, dict[str, list[TranscriptSegment]], list[str]]:
+    """Read a video's sidecar and parse its subtitle files (runs in a worker).
+
+    Returns the info dict, trimmed to the fields ``build_result`` reads so
+    formats and thumbnails are not sent back to the parent process, the
+    parsed tracks and one message per file that could not be read.
+    """
+    errors: list[str] = []
+    info: dict = {}
+    if info_path is not None:
+        try:
+            full_info = json.loads(info_path.read_text(encoding="utf-8"))
+            info = {key: full_info[key] for key in RESULT_FIELDS if key in full_info}
+        except (OSError, json.JSONDecodeError) as e:
+            errors.append(f"{info_path}: {e}")
+    tracks: dict[str, list[TranscriptSegment]] = {}
+    for lang, path in files.items():
+        try:
+            segments = parse_subtitle_file(path, path.suffix.lstrip("."))
+        except Exception as e:
+            errors.append(f"{path}: {e}")
+            continue
+        if segments:
+            tracks[lang] = segments
+    return info, tracks, errors
+
+
+def _iter_parsed(
+    items: list[ImportItem], workers: int
+) -> Iterator[tuple[ImportItem, tuple[dict, dict[str, list[TranscriptSegment]], list[str]]]]:
+    """Parse items on a process pool, yielding in order with a bounded backlog."""
+    if workers <= 1:
+        for item in items:
+            yield item, _parse_item(item.files, item.info_path)
+        return
+    window = workers * 4
+    pending: deque[tuple[ImportItem, Future]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for item in items:
+            pending.append((item, pool.submit(_parse_item, item.files, item.info_path)))
+            if len(pending) >= window:
+                head, future = pending.popleft()
+                yield head, future.result()
+        while pending:
+            head, future = pending.popleft()
+            yield head, future.result()
+
+
+def import_directory(
+    root: Path,
+    settings: Settings,
+    storage: TranscriptStorage,
+    state: ProcessingStateManager,
+    force: bool = False,
+    workers: int | None = None,
+    batch_size: int = BATCH_SIZE,
+    dedupe_captions: bool = False,
+) -> ImportStats:
+    """Import every subtitle file under ``root`` into transcript storage.
+
+    Video IDs come from the filenames, metadata (title, channel, upload date)
+    from ``.info.json`` sidecars when present. Files are parsed on ``workers``
+    processes (default: one per CPU) and processing state is written once per
+    ``batch_size`` videos instead of once per video. Whether a file holds
+    auto captions is unknown, so rolling-caption repeats are only collapsed
+    with ``dedupe_captions``.
+    """
+    stats = ImportStats()
+    items = []
+    for item in scan_subtitle_dir(root):
+        if state.is_transcript_extracted(item.video_id) and not force:
+            stats.skipped += 1
+        else:
+            items.append(item)
+    logger.info("Found %d videos to import under %s", len(items), root)
+
+    batch: list[str] = []
+    try:
+        for item, (info, tracks, errors) in _iter_parsed(items, workers or os.cpu_count() or 1):
+            for error in errors:
+                logger.error("Failed to import %s: %s", item.video_id, error)
+            if not tracks:
+                stats.failed += 1
+                continue
+            entry = {
+                "webpage_url": f"https://www.youtube.com/watch?v={item.video_id}",
+                **info,
+                "id": item.video_id,
+            }
+            result = build_result(
+                entry, tracks, settings, auto_langs=tracks if dedupe_captions else ()
+            )
+            storage.save(result)
+            logger.debug("Imported: %s", result.title)
+            stats.imported += 1
+            batch.append(item.video_id)
+            if len(batch) >= batch_size:
+                state.update_many(batch, transcript_extracted=True)
+                batch = []
+    finally:
+        if batch:
+            state.update_many(batch, transcript_extracted=True)
+    return stats
@@ -0,0 +1,159 @@
+"""Negative cache for videos that are known to be permanently unavailable."""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from yt_dlp.utils import GeoRestrictedError
+
+from study.transcript.ratelimit import is_rate_limited
+
+logger = logging.getLogger("study")
+
+# Checked in order: the generic "video unavailable" message comes last
+PERMANENT_ERRORS = (
+    ("private", ("private video",)),
+    ("members_only", ("members-only", "members only", "channel's members", "join this channel")),
+    ("region_blocked", ("in your country", "geo restrict", "geo-restrict")),
+    (
+        "removed",
+        (
+            "has been removed",
+            "has been terminated",
+            "no longer available",
+            "this video is not available",
+            "video unavailable",
+        ),
+    ),
+)
+
+NO_CAPTIONS = "no_captions"
+
+RECHECK_DAYS = {NO_CAPTIONS: 14}
+DEFAULT_RECHECK_DAYS = 30
+
+
+def classify_error(error: BaseException) -> str | None:
+    """Return the permanent-failure reason for an extraction error.
+
+    Returns None for transient errors (network failures, throttling,
+    premieres that have not started), which are worth retrying soon.
+    YouTube's rate-limit reply also says "video unavailable", so throttling
+    is ruled out before the permanent patterns are checked.
+    """
+    cause = getattr(error, "exc_info", None)
+    if isinstance(error, GeoRestrictedError) or (
+        cause and isinstance(cause[1], GeoRestrictedError)
+    ):
+        return "region_blocked"
+    if is_rate_limited(error):
+        return None
+    message = str(error).lower()
+    for reason, patterns in PERMANENT_ERRORS:
+        if any(pattern in message for pattern in patterns):
+            return reason
+    return None
+
+
+@dataclass
+class NegativeEntry:
+    """A video known to be unavailable, and when to look at it again.
+
+    ``langs`` is the subtitle language list a ``no_captions`` entry was
+    recorded for.
+    """
+
+    video_id: str
+    reason: str
+    checked: str = ""
+    recheck_after: str = ""
+    langs: str = ""
+
+
+class NegativeCache:
+    """Manages permanently unavailable videos persisted as JSON, keyed by video ID.
+
+    Entries are honoured until their recheck time, after which the video is
+    tried again on the next run. A video without captions is only skipped
+    while the requested languages are the ones it was checked for.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, NegativeEntry] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load the cache from JSON file."""
+        if not self.path.exists():
+            return
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        for video_id, fields in data.items():
+            self._entries[video_id] = NegativeEntry(
+                video_id=video_id,
+                reason=fields["reason"],
+                checked=fields.get("checked", ""),
+                recheck_after=fields.get("recheck_after", ""),
+                langs=fields.get("langs", ""),
+            )
+
+    def _save(self) -> None:
+        """Persist the cache to JSON file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {}
+        for video_id, entry in self._entries.items():
+            data[video_id] = {
+                "reason": entry.reason,
+                "checked": entry.checked,
+                "recheck_after": entry.recheck_after,
+            }
+            if entry.langs:
+                data[video_id]["langs"] = entry.langs
+        self.path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, video_id: str, now: datetime | None = None, langs: str = ""
+    ) -> NegativeEntry | None:
+        """Get the entry for a video, or None if unknown or due for a recheck.
+
+        A ``no_captions`` entry only counts for the ``langs`` it was
+        recorded with.
+        """
+        entry = self._entries.get(video_id)
+        if entry is None:
+            return None
+        if entry.reason == NO_CAPTIONS and entry.langs != langs:
+            return None
+        now_str = (now or datetime.now(timezone.utc)).isoformat()
+        if entry.recheck_after and entry.recheck_after <= now_str:
+            return None
+        return entry
+
+    def add(self, video_id: str, reason: str, langs: str = "") -> None:
+        """Record a video as unavailable for the reason's recheck interval."""
+        now = datetime.now(timezone.utc)
+        days = RECHECK_DAYS.get(reason, DEFAULT_RECHECK_DAYS)
+        with self._lock:
+            self._entries[video_id] = NegativeEntry(
+                video_id=video_id,
+                reason=reason,
+                checked=now.isoformat(),
+                recheck_after=(now + timedelta(days=days)).isoformat(),
+                langs=langs,
+            )
+            self._save()
+
+    def remove(self, video_id: str) -> None:
+        """Forget a video, e.g. after it was extracted on a recheck."""
+        with self._lock:
+            if self._entries.pop(video_id, None) is not None:
+                self._save()
@@ -1,135 +1,525 @@
 """Subtitle file parsing (json3, vtt, srt) and serialization."""
 
+import codecs
+import itertools
 import json
 import re
-from dataclasses import asdict
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
 
-from study.core.models import TranscriptResult, TranscriptSegment
+from study.core.models import TranscriptResult, TranscriptSegment, intern_text
+from study.core.serialization import transcript_to_dict
+
+# Characters read per chunk when streaming a subtitle file
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_subtitle_file(filepath: Path, fmt: str) -> Iterator[TranscriptSegment]:
+    """Yield the transcript segments of a subtitle file as they are parsed.
+
+    Files are read in chunks (json3) or line by line (vtt, srt) and never
+    loaded whole, so memory stays bounded however long the video is.
+    """
+    parsers = {
+        "json3": iter_json3,
+        "vtt": iter_vtt,
+        "srt": iter_srt,
+    }
+    parser = parsers.get(fmt)
+    if parser is None:
+        raise ValueError(f"Unsupported subtitle format: {fmt}")
+    return parser(filepath)
 
 
 def parse_subtitle_file(filepath: Path, fmt: str) -> list[TranscriptSegment]:
     """Parse a subtitle file into transcript segments."""
+    return list(iter_subtitle_file(filepath, fmt))
+
+
+def parse_subtitle_data(data: str | bytes, fmt: str) -> list[TranscriptSegment]:
+    """Parse subtitle content held in memory into transcript segments."""
     parsers = {
-        "json3": parse_json3,
-        "vtt": parse_vtt,
-        "srt": parse_srt,
+        "json3": parse_json3_text,
+        "vtt": parse_vtt_text,
+        "srt": parse_srt_text,
     }
     parser = parsers.get(fmt)
     if parser is None:
         raise ValueError(f"Unsupported subtitle format: {fmt}")
-    return parser(filepath)
+    if isinstance(data, bytes):
+        if fmt == "json3":
+            return list(iter_json3_segments(_decode_chunks(data)))
+        data = data.decode("utf-8-sig")
+    return parser(data)
+
+
+def _decode_chunks(data: bytes) -> Iterator[str]:
+    """Decode UTF-8 bytes piecewise, without a full-size decoded copy."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    view = memoryview(data)
+    for offset in range(0, len(data), CHUNK_SIZE):
+        yield decoder.decode(view[offset:offset + CHUNK_SIZE])
+    yield decoder.decode(b"", final=True)
 
 
 def parse_json3(filepath: Path) -> list[TranscriptSegment]:
     """Parse YouTube json3 subtitle format."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    return list(iter_json3(filepath))
 
-    segments: list[TranscriptSegment] = []
-    for event in data.get("events", []):
-        segs = event.get("segs")
-        if not segs:
-            continue
-        text = "".join(seg.get("utf8", "") for seg in segs).strip()
-        if not text or text == "\n":
-            continue
 
-        start_ms = event.get("tStartMs", 0)
-        duration_ms = event.get("dDurationMs", 0)
+def parse_json3_text(content: str) -> list[TranscriptSegment]:
+    """Parse YouTube json3 subtitle content."""
+    return list(iter_json3_segments([content]))
 
-        segments.append(
-            TranscriptSegment(
-                text=text,
-                start=round(start_ms / 1000.0, 3),
-                duration=round(duration_ms / 1000.0, 3),
-            )
-        )
-    return segments
 
+def iter_json3(filepath: Path) -> Iterator[TranscriptSegment]:
+    """Yield the segments of a json3 file, reading it in chunks."""
+    with open(filepath, encoding="utf-8") as f:
+        yield from iter_json3_segments(iter(partial(f.read, CHUNK_SIZE), ""))
 
-def _parse_vtt_timestamp(ts: str) -> float:
-    """Convert a VTT timestamp (HH:MM:SS.mmm or MM:SS.mmm) to seconds."""
-    parts = ts.strip().split(":")
-    if len(parts) == 3:
-        h, m, s = parts
-        return int(h) * 3600 + int(m) * 60 + float(s)
-    elif len(parts) == 2:
-        m, s = parts
-        return int(m) * 60 + float(s)
-    return 0.0
 
+def iter_json3_segments(chunks: Iterable[str]) -> Iterator[TranscriptSegment]:
+    """Yield transcript segments from json3 content split into chunks."""
+    for event in iter_json3_events(chunks):
+        segment = _json3_segment(event)
+        if segment is not None:
+            yield segment
 
-def parse_vtt(filepath: Path) -> list[TranscriptSegment]:
-    """Parse WebVTT subtitle format."""
-    content = filepath.read_text(encoding="utf-8")
-    segments: list[TranscriptSegment] = []
 
-    pattern = re.compile(
-        r"(\d{1,2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{1,2}:\d{2}:\d{2}\.\d{3})[^\n]*\n((?:(?!\d{1,2}:\d{2}:\d{2}\.\d{3}\s*-->).+\n?)*)",
+def _json3_segment(event: dict) -> TranscriptSegment | None:
+    """Turn one json3 event into a segment, or None if it holds no text."""
+    segs = event.get("segs")
+    if not segs:
+        return None
+    text = "".join(seg.get("utf8", "") for seg in segs).strip()
+    if not text or text == "\n":
+        return None
+    return TranscriptSegment(
+        text=intern_text(text),
+        start=round(event.get("tStartMs", 0) / 1000.0, 3),
+        duration=round(event.get("dDurationMs", 0) / 1000.0, 3),
     )
 
-    for match in pattern.finditer(content):
-        start_ts, end_ts, text_block = match.group(1), match.group(2), match.group(3)
-        text = re.sub(r"<[^>]+>", "", text_block).strip()
-        if not text:
+
+class _JSONStream:
+    """Incremental reader over JSON text arriving in chunks.
+
+    Keeps only the unread tail of the text in memory: each value is decoded
+    with ``raw_decode`` as soon as it is complete, and more chunks are read
+    only when the buffer ends in the middle of one.
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer; False once the input is exhausted."""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at the end)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting {char!r}")
+        self._pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number may continue in the next chunk
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buf, self._pos)
+
+
+def iter_json3_events(chunks: Iterable[str]) -> Iterator[dict]:
+    """Yield the ``events`` of a json3 document one at a time.
+
+    Top-level keys other than ``events`` (pens, window styles) are decoded
+    and dropped; events are decoded one by one without building the array.
+    """
+    stream = _JSONStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key == "events" and stream.peek() == "[":
+            stream.expect("[")
+            if stream.peek() != "]":
+                while True:
+                    event = stream.value()
+                    if isinstance(event, dict):
+                        yield event
+                    if stream.peek() != ",":
+                        break
+                    stream.expect(",")
+            stream.expect("]")
+        else:
+            stream.value()
+        if stream.peek() != ",":
+            break
+        stream.expect(",")
+    stream.expect("}")
+
+
+_TAG_RE = re.compile(r"<[^<>]+>")
+# A cue timing line: start --> end, hours optional, "." (VTT) or "," (SRT)
+# before the milliseconds, then optional cue settings
+_TIMESTAMPS = (
+    r"[ \t]*(?:(\d+):)?(\d{2}):(\d{2})[.,](\d{3})[ \t]+-->[ \t]+"
+    r"(?:(\d+):)?(\d{2}):(\d{2})[.,](\d{3})"
+)
+_TIMING_RE = re.compile(_TIMESTAMPS + r"(?:[ \t]|$)")
+# A whole well-formed cue block: skipped identifier lines, the timing line, then its text
+_CUE_BLOCK_RE = re.compile(
+    r"(?:[^\n]*\n)*?" + _TIMESTAMPS + r"(?:[ \t][^\n]*)?(?:\n(.*))?",
+    re.DOTALL,
+)
+# Timestamp fields as written, so the common case skips int()
+_FIELD_VALUES = {f"{i:02d}": i for i in range(100)} | {str(i): i for i in range(10)} | {None: 0}
+_MS_VALUES = {f"{i:03d}": i for i in range(1000)}
+
+
+def _parse_timing(line: str) -> tuple[int, int] | None:
+    """Parse a ``start --> end [settings]`` cue timing line into milliseconds.
+
+    Returns None if the line is not a timing line.
+    """
+    match = _TIMING_RE.match(line)
+    if match is None:
+        return None
+    h1, m1, s1, ms1, h2, m2, s2, ms2 = match.groups()
+    start = ((int(h1 or 0) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(ms1)
+    end = ((int(h2 or 0) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(ms2)
+    return start, end
+
+
+def _iter_cues(lines: Iterable[str], strip_tags: bool) -> Iterator[TranscriptSegment]:
+    """Single-pass cue parser shared by WebVTT and SRT.
+
+    Outside a cue, every line that is not a timing line is skipped: the WebVTT
+    header, NOTE/STYLE blocks and cue identifiers (SRT counters included), so
+    numbered and unnumbered cues parse the same way. After a timing line,
+    text lines are collected until an empty line or the next timing line; a
+    numeric line directly before that timing line is its counter, not text.
+    Cue settings after the end timestamp are ignored.
+    """
+    timing: tuple[int, int] | None = None
+    text_lines: list[str] = []
+    # A numeric line inside a cue, held until we know whether a timing line follows
+    counter = ""
+    # A trailing blank line flushes the last cue
+    for line in itertools.chain(lines, ("",)):
+        line = line.rstrip("\r\n")
+        next_timing = _parse_timing(line) if "-->" in line else None
+        if timing is None:
+            timing = next_timing
+            continue
+        # Only an empty line ends a cue: auto-captions pad cues with " " lines
+        if next_timing is None and line:
+            if counter:
+                text_lines.append(counter)
+                counter = ""
+            if line.isdigit():
+                counter = line
+            else:
+                text_lines.append(line)
             continue
+        if counter:
+            # A counter right before a timing line numbers the next SRT cue
+            if next_timing is None:
+                text_lines.append(counter)
+            counter = ""
+        if text_lines:
+            text = "\n".join(text_lines) if len(text_lines) > 1 else text_lines[0]
+            if strip_tags and "<" in text:
+                text = _TAG_RE.sub("", text)
+            text = text.strip()
+            if text:
+                start, end = timing
+                yield TranscriptSegment(
+                    text=intern_text(text), start=start / 1000, duration=(end - start) / 1000
+                )
+            text_lines = []
+        timing = next_timing
+
 
-        start = _parse_vtt_timestamp(start_ts)
-        end = _parse_vtt_timestamp(end_ts)
-        duration = round(end - start, 3)
-
-        segments.append(
-            TranscriptSegment(
-                text=text,
-                start=round(start, 3),
-                duration=duration,
-            )
-        )
+def _parse_cue_text(content: str, strip_tags: bool) -> list[TranscriptSegment]:
+    """Parse in-memory WebVTT/SRT content, a cue block at a time.
+
+    Same result as ``_iter_cues`` over the lines: an empty line always ends
+    a cue, so blank-line separated blocks are independent. A block holding a
+    single timing line is matched whole by one regex; any other block with a
+    timing arrow goes through ``_iter_cues``. A cue-format change must be made
+    in both; the parser tests run every cue case through each path.
+    """
+    content = content.lstrip("\ufeff")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n")
+        if "\r" in content:
+            return list(_iter_cues(content.split("\n"), strip_tags))
+    segments: list[TranscriptSegment] = []
+    append = segments.append
+    match_block = _CUE_BLOCK_RE.fullmatch
+    fields = _FIELD_VALUES
+    millis = _MS_VALUES
+    for block in content.split("\n\n"):
+        arrows = block.count("-->")
+        if arrows != 1:
+            if arrows:
+                segments.extend(_iter_cues(block.split("\n"), strip_tags))
+            continue
+        match = match_block(block)
+        if match is None:
+            continue
+        h1, m1, s1, ms1, h2, m2, s2, ms2, text = match.groups()
+        if not text:
+            continue
+        if strip_tags and "<" in text:
+            text = _TAG_RE.sub("", text)
+        text = text.strip()
+        if not text:
+            continue
+        try:
+            start = ((fields[h1] * 60 + fields[m1]) * 60 + fields[s1]) * 1000 + millis[ms1]
+            end = ((fields[h2] * 60 + fields[m2]) * 60 + fields[s2]) * 1000 + millis[ms2]
+        except KeyError:
+            # Hours past 99 or non-ASCII digits
+            start = ((int(h1 or 0) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(ms1)
+            end = ((int(h2 or 0) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(ms2)
+        append(TranscriptSegment(intern_text(text), start / 1000, (end - start) / 1000))
     return segments
 
 
-def _parse_srt_timestamp(ts: str) -> float:
-    """Convert an SRT timestamp (HH:MM:SS,mmm) to seconds."""
-    ts = ts.strip().replace(",", ".")
-    parts = ts.split(":")
-    if len(parts) == 3:
-        h, m, s = parts
-        return int(h) * 3600 + int(m) * 60 + float(s)
-    return 0.0
+def _iter_file_cues(filepath: Path, strip_tags: bool) -> Iterator[TranscriptSegment]:
+    with open(filepath, encoding="utf-8-sig") as f:
+        yield from _iter_cues(f, strip_tags)
+
+
+def iter_vtt(filepath: Path) -> Iterator[TranscriptSegment]:
+    """Yield the cues of a WebVTT file, reading it line by line."""
+    return _iter_file_cues(filepath, strip_tags=True)
+
+
+def iter_srt(filepath: Path) -> Iterator[TranscriptSegment]:
+    """Yield the cues of an SRT file, reading it line by line."""
+    return _iter_file_cues(filepath, strip_tags=False)
+
+
+def parse_vtt(filepath: Path) -> list[TranscriptSegment]:
+    """Parse WebVTT subtitle format."""
+    return list(iter_vtt(filepath))
+
+
+def parse_vtt_text(content: str) -> list[TranscriptSegment]:
+    """Parse WebVTT subtitle content."""
+    return _parse_cue_text(content, strip_tags=True)
 
 
 def parse_srt(filepath: Path) -> list[TranscriptSegment]:
     """Parse SRT subtitle format."""
-    content = filepath.read_text(encoding="utf-8")
-    segments: list[TranscriptSegment] = []
+    return list(iter_srt(filepath))
 
-    pattern = re.compile(
-        r"\d+\s*\n(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n((?:(?!\d+\s*\n\d{2}:\d{2}:\d{2}).+\n?)*)",
-    )
 
-    for match in pattern.finditer(content):
-        start_ts, end_ts, text_block = match.group(1), match.group(2), match.group(3)
-        text = text_block.strip()
-        if not text:
+def parse_srt_text(content: str) -> list[TranscriptSegment]:
+    """Parse SRT subtitle content."""
+    return _parse_cue_text(content, strip_tags=False)
+
+
+# Cues further apart than this (seconds) are never treated as a rolling overlap
+ROLLING_MAX_GAP = 1.0
+
+
+@dataclass
+class DedupStats:
+    """What rolling-caption deduplication removed from a track."""
+
+    input_chars: int = 0
+    removed_chars: int = 0
+    removed_segments: int = 0
+
+    @property
+    def ratio(self) -> float:
+        return self.removed_chars / self.input_chars if self.input_chars else 0.0
+
+
+def _line_overlap(shown: list[str], lines: list[str]) -> int:
+    """Length of the longest tail of ``shown`` that ``lines`` starts with."""
+    for k in range(min(len(shown), len(lines)), 0, -1):
+        if shown[-k:] == lines[:k]:
+            return k
+    return 0
+
+
+def _new_lines(shown: list[str], lines: list[str]) -> list[str]:
+    """The lines of a cue that were not already on screen in the previous cue."""
+    k = _line_overlap(shown, lines)
+    if k:
+        return lines[k:]
+    # A cue that grows word by word repeats the previous line as its prefix
+    if shown and lines:
+        last = shown[-1]
+        first = lines[0]
+        if len(first) > len(last) and first.startswith(last) and first[len(last)] == " ":
+            return [first[len(last):].strip(), *lines[1:]]
+    return lines
+
+
+def iter_deduped(
+    segments: Iterable[TranscriptSegment], stats: DedupStats | None = None
+) -> Iterator[TranscriptSegment]:
+    """Collapse rolling-caption repeats into non-overlapping segments.
+
+    YouTube auto-captions scroll: each cue shows the previous line again
+    above the new one, and short "hold" cues repeat a line on its own. Lines
+    still on screen from the previous cue are dropped, so each segment keeps
+    only the words first shown in it; a cue left with no new text extends the
+    previous segment instead. Durations are then clipped at the next
+    segment's start. Cues more than ``ROLLING_MAX_GAP`` seconds apart are
+    left alone, so a line repeated later on is kept.
+    """
+    stats = stats if stats is not None else DedupStats()
+    pending: TranscriptSegment | None = None
+    shown: list[str] = []
+    last_end: float | None = None
+    for segment in segments:
+        stats.input_chars += len(segment.text)
+        lines = [line.strip() for line in segment.text.split("\n")]
+        lines = [line for line in lines if line]
+        if last_end is not None and segment.start - last_end > ROLLING_MAX_GAP:
+            shown = []
+        new_lines = _new_lines(shown, lines)
+        shown = lines
+        end = segment.start + segment.duration
+        last_end = end
+
+        if not new_lines:
+            stats.removed_chars += len(segment.text)
+            stats.removed_segments += 1
+            if pending is not None and end > pending.start + pending.duration:
+                pending = replace(pending, duration=round(end - pending.start, 3))
             continue
 
-        start = _parse_srt_timestamp(start_ts)
-        end = _parse_srt_timestamp(end_ts)
-        duration = round(end - start, 3)
-
-        segments.append(
-            TranscriptSegment(
-                text=text,
-                start=round(start, 3),
-                duration=duration,
-            )
-        )
-    return segments
+        text = "\n".join(new_lines)
+        stats.removed_chars += len(segment.text) - len(text)
+        if pending is not None:
+            yield _clipped(pending, segment.start)
+        pending = replace(segment, text=text) if text != segment.text else segment
+    if pending is not None:
+        yield pending
+
+
+def _clipped(segment: TranscriptSegment, next_start: float) -> TranscriptSegment:
+    """End a segment no later than the next one starts."""
+    if segment.start <= next_start < segment.start + segment.duration:
+        return replace(segment, duration=round(next_start - segment.start, 3))
+    return segment
+
+
+def dedupe_segments(
+    segments: Iterable[TranscriptSegment],
+) -> tuple[list[TranscriptSegment], DedupStats]:
+    """Deduplicate a track, returning the clean segments and what was removed."""
+    stats = DedupStats()
+    return list(iter_deduped(segments, stats)), stats
+
+
+SENTENCE_ENDINGS = (".", "?", "!", "…", "。", "？", "！")
+
+
+def coalesce_segments(
+    segments: Iterable[TranscriptSegment],
+    max_seconds: float = 0.0,
+    max_chars: int = 0,
+    boundaries: Iterable[float] = (),
+) -> list[TranscriptSegment]:
+    """Merge consecutive fragments into sentence- or window-sized segments.
+
+    A merged segment keeps the start of its first fragment and ends with its
+    last one. It is closed at the end of a sentence, before it would span
+    more than ``max_seconds`` or hold more than ``max_chars`` characters
+    (0 disables either limit), and before a ``boundaries`` time such as a
+    chapter start, so no segment straddles one.
+    """
+    cuts = sorted(boundaries)
+    merged: list[TranscriptSegment] = []
+    group: list[TranscriptSegment] = []
+    chars = 0
+    for segment in segments:
+        if group:
+            start = group[0].start
+            if (
+                (max_seconds and segment.start + segment.duration - start > max_seconds)
+                or (max_chars and chars + 1 + len(segment.text) > max_chars)
+                or _crosses(cuts, start, segment.start)
+            ):
+                merged.append(_merge(group))
+                group = []
+        chars = chars + 1 + len(segment.text) if group else len(segment.text)
+        group.append(segment)
+        if segment.text.endswith(SENTENCE_ENDINGS):
+            merged.append(_merge(group))
+            group = []
+    if group:
+        merged.append(_merge(group))
+    return merged
+
+
+def _crosses(cuts: list[float], start: float, next_start: float) -> bool:
+    """Whether a boundary lies after ``start`` and at or before ``next_start``."""
+    i = bisect_right(cuts, start)
+    return i < len(cuts) and cuts[i] <= next_start
+
+
+def _merge(group: list[TranscriptSegment]) -> TranscriptSegment:
+    if len(group) == 1:
+        return group[0]
+    start = group[0].start
+    end = max(seg.start + seg.duration for seg in group)
+    return TranscriptSegment(
+        text=" ".join(seg.text for seg in group),
+        start=start,
+        duration=round(end - start, 3),
+    )
 
 
 def result_to_dict(result: TranscriptResult) -> dict:
     """Convert a TranscriptResult to a plain dict for serialization."""
-    data = asdict(result)
-    data["full_text"] = result.full_text
-    return data
+    return transcript_to_dict(result)
@@ -0,0 +1,152 @@
+"""Request rate limiting shared across extraction workers."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+logger = logging.getLogger("study")
+
+T = TypeVar("T")
+
+RATE_LIMIT_PATTERNS = (
+    "http error 429",
+    "too many requests",
+    "rate-limited",
+    "rate limited",
+    "confirm you're not a bot",
+    "confirm you’re not a bot",
+    # "Video unavailable. This content isn't available, try again later."
+    "try again later",
+)
+
+# AIMD tuning: each rate-limited response halves the rate, each successful
+# request adds a little back
+INCREASE = 0.05
+DECREASE = 0.5
+MIN_RATE = 0.05
+# Rate a disabled (0) ceiling falls back to after the first rate limit
+THROTTLED_RATE = 1.0
+COOLDOWN = 30.0
+MAX_COOLDOWN = 600.0
+RATE_LIMIT_RETRIES = 3
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Whether an extraction error means the site is throttling us."""
+    message = str(error).lower()
+    return any(pattern in message for pattern in RATE_LIMIT_PATTERNS)
+
+
+class RateLimiter:
+    """Thread-safe ceiling on how many requests may start per second.
+
+    Requests are spaced at least ``1 / rate`` seconds apart across every
+    thread that shares the limiter. A rate of 0 disables the ceiling.
+
+    The rate adapts to throttling (AIMD): ``throttled()`` pauses every
+    worker for a cooldown that doubles while rate limits keep coming and
+    halves the rate; ``succeeded()`` raises it by ``increase`` requests per
+    second again, up to the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        increase: float = INCREASE,
+        decrease: float = DECREASE,
+        min_rate: float = MIN_RATE,
+        cooldown: float = COOLDOWN,
+    ):
+        self.rate = rate
+        self.ceiling = rate
+        self.increase = increase
+        self.decrease = decrease
+        self.min_rate = min_rate
+        self.cooldown = cooldown
+        self.throttle_count = 0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._strikes = 0
+
+    def acquire(self) -> None:
+        """Block until the caller may start its next request."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate <= 0:
+                slot = max(now, self._paused_until)
+            else:
+                slot = max(now, self._next_slot, self._paused_until)
+                self._next_slot = slot + 1.0 / self.rate
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def throttled(self) -> None:
+        """Back off after a rate-limited response.
+
+        Workers that hit the limit during the same pause count once, so a
+        burst of parallel failures does not collapse the rate.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return
+            self._strikes += 1
+            self.throttle_count += 1
+            self.rate = max(self.min_rate, (self.rate or THROTTLED_RATE) * self.decrease)
+            pause = min(self.cooldown * 2 ** (self._strikes - 1), MAX_COOLDOWN)
+            self._paused_until = now + pause
+            rate = self.rate
+        logger.warning(
+            "Rate limited, pausing %.0fs and slowing to %.2f requests/s", pause, rate
+        )
+
+    def succeeded(self) -> None:
+        """Recover speed after a request that was not rate limited."""
+        with self._lock:
+            self._strikes = 0
+            if self.rate <= 0 or (self.ceiling > 0 and self.rate >= self.ceiling):
+                return
+            self.rate += self.increase
+            if self.ceiling > 0 and self.rate >= self.ceiling:
+                self.rate = self.ceiling
+                recovered = True
+            else:
+                recovered = False
+            rate = self.rate
+        if recovered:
+            logger.info("Request rate back to %.2f requests/s", rate)
+        else:
+            logger.debug("Request rate now %.2f requests/s", rate)
+
+
+def with_backoff(
+    limiter: RateLimiter | None,
+    request: Callable[..., T],
+    *args,
+    retries: int = RATE_LIMIT_RETRIES,
+    **kwargs,
+) -> T:
+    """Make a rate-limited request, retrying after a backoff when throttled.
+
+    Other errors, and rate limits that outlast ``retries`` attempts, are
+    raised to the caller.
+    """
+    attempt = 0
+    while True:
+        if limiter:
+            limiter.acquire()
+        try:
+            result = request(*args, **kwargs)
+        except Exception as e:
+            if limiter is None or not is_rate_limited(e) or attempt >= retries:
+                raise
+            limiter.throttled()
+            attempt += 1
+            continue
+        if limiter:
+            limiter.succeeded()
+        return result
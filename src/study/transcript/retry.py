@@ -0,0 +1,117 @@
+"""Persistent retry queue for videos whose extraction failed."""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+logger = logging.getLogger("study")
+
+BASE_DELAY = 15 * 60
+MAX_DELAY = 24 * 60 * 60
+MAX_ATTEMPTS = 8
+
+
+@dataclass
+class RetryEntry:
+    """A failed video waiting for its next attempt."""
+
+    video_id: str
+    url: str
+    attempts: int = 0
+    next_attempt: str = ""
+    last_error: str = ""
+
+
+class RetryQueue:
+    """Manages failed extractions persisted as JSON, keyed by video ID.
+
+    Each failure doubles the wait before the next attempt (starting at
+    ``base_delay`` seconds, capped at ``max_delay``). Videos that keep
+    failing are dropped after ``max_attempts``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        self.path = path
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self._entries: dict[str, RetryEntry] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load the queue from JSON file."""
+        if not self.path.exists():
+            return
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        for video_id, fields in data.items():
+            self._entries[video_id] = RetryEntry(
+                video_id=video_id,
+                url=fields["url"],
+                attempts=fields.get("attempts", 0),
+                next_attempt=fields.get("next_attempt", ""),
+                last_error=fields.get("last_error", ""),
+            )
+
+    def _save(self) -> None:
+        """Persist the queue to JSON file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            video_id: {
+                "url": entry.url,
+                "attempts": entry.attempts,
+                "next_attempt": entry.next_attempt,
+                "last_error": entry.last_error,
+            }
+            for video_id, entry in self._entries.items()
+        }
+        self.path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, video_id: str) -> RetryEntry | None:
+        """Get the queue entry for a video."""
+        return self._entries.get(video_id)
+
+    def record_failure(self, video_id: str, url: str, error: str) -> None:
+        """Count a failed attempt and schedule the next one with backoff."""
+        with self._lock:
+            entry = self._entries.get(video_id) or RetryEntry(video_id=video_id, url=url)
+            entry.attempts += 1
+            entry.last_error = error
+            if entry.attempts >= self.max_attempts:
+                logger.warning(
+                    "Giving up on %s after %d attempts: %s", video_id, entry.attempts, error
+                )
+                self._entries.pop(video_id, None)
+            else:
+                delay = min(self.base_delay * 2 ** (entry.attempts - 1), self.max_delay)
+                next_attempt = datetime.now(timezone.utc) + timedelta(seconds=delay)
+                entry.next_attempt = next_attempt.isoformat()
+                self._entries[video_id] = entry
+            self._save()
+
+    def remove(self, video_id: str) -> None:
+        """Drop a video from the queue after it was extracted."""
+        with self._lock:
+            if self._entries.pop(video_id, None) is not None:
+                self._save()
+
+    def due(self, now: datetime | None = None) -> list[RetryEntry]:
+        """Return entries whose next attempt time has passed, oldest first."""
+        now_str = (now or datetime.now(timezone.utc)).isoformat()
+        with self._lock:
+            due = [e for e in self._entries.values() if e.next_attempt <= now_str]
+        return sorted(due, key=lambda e: e.next_attempt)
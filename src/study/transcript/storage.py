@@ -1,11 +1,11 @@
 """Transcript persistence as JSON files."""
 
-import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-from study.core.models import TranscriptResult, TranscriptSegment
+from study.core.models import TranscriptResult
+from study.core.serialization import read_json, transcript_from_dict, transcript_to_dict, write_json
 from study.core.utils import sanitize_filename
-from study.transcript.parser import result_to_dict
 
 
 class TranscriptStorage:
@@ -18,10 +18,7 @@ class TranscriptStorage:
         """Save transcript as JSON. Returns path to saved file."""
         path = self.get_path(result.channel, result.id)
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = result_to_dict(result)
-        path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_json(path, transcript_to_dict(result))
         return path
 
     def load(self, video_id: str) -> TranscriptResult | None:
@@ -31,6 +28,16 @@ class TranscriptStorage:
                 return self._load_file(json_file)
         return None
 
+    def load_many(self, video_ids: Iterable[str]) -> Iterator[TranscriptResult]:
+        """Load several transcripts in one pass over the channel dirs."""
+        wanted = set(video_ids)
+        if not wanted or not self.base_dir.exists():
+            return
+        for json_file in self.base_dir.rglob("*.json"):
+            if json_file.stem in wanted:
+                wanted.discard(json_file.stem)
+                yield self._load_file(json_file)
+
     def exists(self, video_id: str) -> bool:
         """Check if transcript already exists."""
         if not self.base_dir.exists():
@@ -53,20 +60,4 @@ class TranscriptStorage:
 
     def _load_file(self, path: Path) -> TranscriptResult:
         """Load a TranscriptResult from a JSON file."""
-        data = json.loads(path.read_text(encoding="utf-8"))
-        segments = [
-            TranscriptSegment(
-                text=seg["text"],
-                start=seg["start"],
-                duration=seg["duration"],
-            )
-            for seg in data.get("transcript", [])
-        ]
-        return TranscriptResult(
-            id=data["id"],
-            title=data["title"],
-            channel=data["channel"],
-            upload_date=data["upload_date"],
-            webpage_url=data["webpage_url"],
-            transcript=segments,
-        )
+        return transcript_from_dict(read_json(path))
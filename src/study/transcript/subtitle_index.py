@@ -0,0 +1,98 @@
+"""Index of subtitle files written by yt-dlp, keyed by video ID."""
+
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from yt_dlp.postprocessor.common import PostProcessor
+
+SUBTITLE_SUFFIXES = (".json3", ".vtt", ".srt")
+
+
+def pick_language(available: Iterable[str], langs: str | Sequence[str]) -> str | None:
+    """Choose a subtitle track language from a priority list.
+
+    For each language in ``langs`` in turn, the exact language wins, then a
+    regional or original variant of it (``en-US``, ``en-orig``). If nothing
+    matches, any other track is taken.
+    """
+    available = list(available)
+    if not available:
+        return None
+    if isinstance(langs, str):
+        langs = [langs]
+    for lang in langs:
+        if lang in available:
+            return lang
+        for track_lang in available:
+            if track_lang.startswith(f"{lang}-"):
+                return track_lang
+    return available[0]
+
+
+class SubtitleIndex:
+    """Maps video IDs to their subtitle files, one path per language.
+
+    Filled as yt-dlp writes each file (see ``SubtitleIndexPP``), so locating
+    the subtitle for an entry is a dict lookup instead of a directory scan.
+    """
+
+    def __init__(self):
+        self._files: dict[str, dict[str, Path]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, video_id: str, lang: str, path: Path) -> None:
+        """Register a subtitle file for a video and language."""
+        with self._lock:
+            self._files.setdefault(video_id, {})[lang] = path
+
+    def record(self, info: dict) -> None:
+        """Register every subtitle file yt-dlp wrote for an info dict."""
+        video_id = info.get("id")
+        if not video_id:
+            return
+        for lang, sub_info in (info.get("requested_subtitles") or {}).items():
+            filepath = (sub_info or {}).get("filepath")
+            if filepath:
+                self.add(video_id, lang, Path(filepath))
+
+    def scan(self, directory: Path) -> None:
+        """Register every subtitle file in a directory, named ``{id}.{lang}.{ext}``."""
+        for path in directory.iterdir():
+            if path.suffix not in SUBTITLE_SUFFIXES:
+                continue
+            video_id, _, rest = path.name.partition(".")
+            lang = rest[: -len(path.suffix)] if "." in rest else ""
+            self.add(video_id, lang, path)
+
+    def lookup(self, video_id: str, lang: str | Sequence[str]) -> Path | None:
+        """Return the best subtitle file for a video (see ``pick_language``)."""
+        tracks = self.tracks(video_id)
+        chosen = pick_language(tracks, lang)
+        return tracks[chosen] if chosen is not None else None
+
+    def tracks(self, video_id: str) -> dict[str, Path]:
+        """Return every subtitle file registered for a video, by language."""
+        with self._lock:
+            return dict(self._files.get(video_id, {}))
+
+    def pop(self, video_id: str) -> list[Path]:
+        """Forget a video's subtitle files and return their paths."""
+        with self._lock:
+            return list(self._files.pop(video_id, {}).values())
+
+
+class SubtitleIndexPP(PostProcessor):
+    """Records subtitle filepaths into a SubtitleIndex as yt-dlp writes them.
+
+    Registered with ``when="before_dl"``, which runs right after subtitles
+    are written and before any media download.
+    """
+
+    def __init__(self, index: SubtitleIndex, downloader=None):
+        super().__init__(downloader)
+        self.index = index
+
+    def run(self, info):
+        self.index.record(info)
+        return [], info
@@ -0,0 +1,68 @@
+"""Per-channel sync watermarks for incremental channel refreshes."""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+@dataclass
+class ChannelWatermark:
+    """Newest video seen on the last complete walk of a channel listing."""
+
+    video_id: str
+    upload_date: str = ""
+    updated: str = ""
+
+
+class ChannelWatermarks:
+    """Manages channel watermarks persisted as JSON, keyed by channel URL."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._marks: dict[str, ChannelWatermark] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load watermarks from JSON file."""
+        if not self.path.exists():
+            return
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        for key, fields in data.items():
+            self._marks[key] = ChannelWatermark(
+                video_id=fields["video_id"],
+                upload_date=fields.get("upload_date", ""),
+                updated=fields.get("updated", ""),
+            )
+
+    def _save(self) -> None:
+        """Persist watermarks to JSON file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            key: {
+                "video_id": mark.video_id,
+                "upload_date": mark.upload_date,
+                "updated": mark.updated,
+            }
+            for key, mark in self._marks.items()
+        }
+        self.path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+    @staticmethod
+    def _key(channel_url: str) -> str:
+        return channel_url.strip().rstrip("/")
+
+    def get(self, channel_url: str) -> ChannelWatermark | None:
+        """Get the watermark for a channel, if it was ever fully walked."""
+        return self._marks.get(self._key(channel_url))
+
+    def set(self, channel_url: str, video_id: str, upload_date: str = "") -> None:
+        """Record the newest video of a completed walk and persist."""
+        self._marks[self._key(channel_url)] = ChannelWatermark(
+            video_id=video_id,
+            upload_date=upload_date,
+            updated=datetime.now(timezone.utc).isoformat(),
+        )
+        self._save()
@@ -87,3 +87,29 @@ class TestAnthropicAPIBackend:
         result = backend.process_transcript("text", "title")
 
         assert isinstance(result, AIResponse)
+
+    @patch("study.ai.api_backend.anthropic")
+    def test_summarize_chapter_returns_text(self, mock_anthropic):
+        mock_client = _setup_mock_anthropic(mock_anthropic)
+        mock_client.messages.create.return_value = _make_message("  Resumo do capitulo.\n")
+
+        backend = AnthropicAPIBackend(api_key="test-key", model="test-model")
+        summary = backend.summarize_chapter("chapter text", "Video Title", "Intro")
+
+        assert summary == "Resumo do capitulo."
+        prompt = mock_client.messages.create.call_args[1]["messages"][0]["content"]
+        assert "Intro" in prompt
+        assert "chapter text" in prompt
+
+    @patch("study.ai.api_backend.anthropic")
+    def test_prompts_use_content_lang(self, mock_anthropic):
+        mock_client = _setup_mock_anthropic(mock_anthropic)
+        mock_client.messages.create.return_value = _make_message(VALID_JSON_RESPONSE)
+
+        backend = AnthropicAPIBackend(api_key="test-key", model="test-model", content_lang="en")
+        backend.process_transcript("text", "title")
+
+        call_kwargs = mock_client.messages.create.call_args[1]
+        assert "English (en)" in call_kwargs["system"]
+        assert "English (en)" in call_kwargs["messages"][0]["content"]
+        assert "Portuguese" not in call_kwargs["system"]
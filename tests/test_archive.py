@@ -0,0 +1,97 @@
+"""Tests for the append-only download archive."""
+
+from pathlib import Path
+
+from study.core.state import ProcessingStateManager
+from study.transcript.archive import DownloadArchive
+
+
+def _lines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+class TestDownloadArchive:
+    def test_first_sync_merges_existing_file(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.txt"
+        archive_path.write_text("youtube old\nyoutube old\n", encoding="utf-8")
+        state = ProcessingStateManager(tmp_path / "state.json")
+        state.update("vid1", transcript_extracted=True)
+
+        DownloadArchive(archive_path).sync(state)
+
+        assert _lines(archive_path) == ["youtube old", "youtube vid1"]
+        assert (tmp_path / "archive.txt.sync.json").exists()
+
+    def test_appends_only_new_ids(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.txt"
+        state = ProcessingStateManager(tmp_path / "state.json")
+        state.update("vid1", transcript_extracted=True)
+        DownloadArchive(archive_path).sync(state)
+
+        state.update("vid2", transcript_extracted=True)
+        state.update("vid3", transcript_extracted=False)
+        written = DownloadArchive(archive_path).sync(state)
+
+        assert written == 1
+        assert _lines(archive_path) == ["youtube vid1", "youtube vid2"]
+
+    def test_nothing_new_leaves_file_untouched(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.txt"
+        state = ProcessingStateManager(tmp_path / "state.json")
+        state.update("vid1", transcript_extracted=True)
+        DownloadArchive(archive_path).sync(state)
+        mtime = archive_path.stat().st_mtime_ns
+
+        assert DownloadArchive(archive_path).sync(state) == 0
+        assert archive_path.stat().st_mtime_ns == mtime
+
+    def test_repairs_missing_trailing_newline(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.txt"
+        state = ProcessingStateManager(tmp_path / "state.json")
+        state.update("vid1", transcript_extracted=True)
+        DownloadArchive(archive_path).sync(state)
+        archive_path.write_text("youtube vid1", encoding="utf-8")
+
+        state.update("vid2", transcript_extracted=True)
+        DownloadArchive(archive_path).sync(state)
+
+        assert _lines(archive_path) == ["youtube vid1", "youtube vid2"]
+
+    def test_compacts_past_duplicate_threshold(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.txt"
+        state = ProcessingStateManager(tmp_path / "state.json")
+        state.update("vid1", transcript_extracted=True)
+        state.update("vid2", transcript_extracted=True)
+        DownloadArchive(archive_path, compact_threshold=1).sync(state)
+
+        # Re-processing bumps last_processed, so both IDs are appended again.
+        state.update("vid1", ai_processed=True)
+        state.update("vid2", ai_processed=True)
+        DownloadArchive(archive_path, compact_threshold=1).sync(state)
+
+        assert _lines(archive_path) == ["youtube vid1", "youtube vid2"]
+
+    def test_compaction_keeps_concurrent_appends(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.txt"
+        archive_path.write_text("youtube vid1\nyoutube vid1\n")
+        state = ProcessingStateManager(tmp_path / "state.json")
+        state.update("vid1", transcript_extracted=True)
+
+        # A writer that opened the archive before compaction must not
+        # append to a file that was swapped out from under it
+        with archive_path.open("a", encoding="utf-8") as writer:
+            DownloadArchive(archive_path).compact(state)
+            writer.write("youtube vid2\n")
+
+        assert _lines(archive_path) == ["youtube vid1", "youtube vid2"]
+
+    def test_deleted_archive_is_rebuilt(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.txt"
+        state = ProcessingStateManager(tmp_path / "state.json")
+        state.update("vid1", transcript_extracted=True)
+        DownloadArchive(archive_path).sync(state)
+        archive_path.unlink()
+
+        DownloadArchive(archive_path).sync(state)
+
+        assert _lines(archive_path) == ["youtube vid1"]
@@ -0,0 +1,87 @@
+"""Tests for the on-disk metadata cache."""
+
+import json
+import time
+from pathlib import Path
+
+from study.transcript.cache import MetadataCache
+
+SAMPLE_INFO = {
+    "id": "vid1",
+    "title": "Video 1",
+    "channel": "Chan",
+    "upload_date": "20240615",
+    "webpage_url": "https://www.youtube.com/watch?v=vid1",
+    "formats": [{"url": "https://example.com/huge"}],
+    "requested_subtitles": {
+        "en": {"ext": "json3", "url": "https://example.com/subs", "filepath": "/tmp/x"},
+    },
+}
+
+
+class TestMetadataCache:
+    def test_roundtrip(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        cache.put(SAMPLE_INFO)
+        cached = cache.get("vid1")
+        assert cached["title"] == "Video 1"
+        assert cached["webpage_url"] == SAMPLE_INFO["webpage_url"]
+        assert cached["subtitles"] == {
+            "en": {"ext": "json3", "url": "https://example.com/subs"},
+        }
+        assert "formats" not in cached
+
+    def test_missing(self, tmp_path: Path):
+        assert MetadataCache(tmp_path, ttl=60, max_entries=10).get("vid1") is None
+
+    def test_expired_entry_is_dropped(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        cache.put(SAMPLE_INFO)
+        path = tmp_path / "vid1.json"
+        data = json.loads(path.read_text())
+        data["cached_at"] = time.time() - 120
+        path.write_text(json.dumps(data))
+
+        assert cache.get("vid1") is None
+        assert not path.exists()
+
+    def test_other_selection_has_unknown_tracks(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        cache.put(SAMPLE_INFO, selection="en;json3")
+        assert cache.get("vid1", selection="en;json3")["subtitles"] is not None
+        cached = cache.get("vid1", selection="pt;json3")
+        assert cached["title"] == "Video 1"
+        assert cached["subtitles"] is None
+
+    def test_auto_caption_flag_is_kept(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        auto = {"ext": "vtt", "url": "https://example.com/auto", "automatic": True}
+        cache.put({**SAMPLE_INFO, "requested_subtitles": {"en": auto}})
+        assert cache.get("vid1")["subtitles"] == {"en": auto}
+
+    def test_no_subtitles_is_cached_as_empty(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        cache.put({**SAMPLE_INFO, "requested_subtitles": None})
+        assert cache.get("vid1")["subtitles"] == {}
+
+    def test_tracks_without_url_are_unknown(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        cache.put({**SAMPLE_INFO, "requested_subtitles": {"en": {"ext": "vtt", "data": "WEBVTT"}}})
+        assert cache.get("vid1")["subtitles"] is None
+
+    def test_evicts_oldest_beyond_limit(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        for i in range(11):
+            cache.put({**SAMPLE_INFO, "id": f"vid{i}"})
+            time.sleep(0.002)
+        remaining = sorted(p.stem for p in tmp_path.glob("*.json"))
+        assert len(remaining) == 9
+        assert "vid0" not in remaining
+        assert "vid10" in remaining
+
+    def test_invalidate(self, tmp_path: Path):
+        cache = MetadataCache(tmp_path, ttl=60, max_entries=10)
+        cache.put(SAMPLE_INFO)
+        cache.invalidate("vid1")
+        cache.invalidate("vid1")
+        assert cache.get("vid1") is None
@@ -0,0 +1,78 @@
+"""Tests for parallel chapter summaries."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from study.ai.chapters import summarize_chapters
+from study.core.config import Settings
+from study.core.models import Chapter, TranscriptResult, TranscriptSegment
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> Settings:
+    return Settings(
+        vault_path=tmp_path,
+        claude_backend="api",
+        anthropic_api_key="test-key",
+        claude_model="test-model",
+        transcript_lang="en",
+        subtitle_format="json3",
+        content_lang="pt-BR",
+        data_dir=tmp_path / "data",
+        archive_file=tmp_path / "data" / "archive.txt",
+        verbose=False,
+        chapter_summary_min_duration=3600,
+    )
+
+
+def _lecture() -> TranscriptResult:
+    return TranscriptResult(
+        id="vid1",
+        title="Lecture",
+        channel="Channel",
+        upload_date="20240101",
+        webpage_url="https://youtube.com/watch?v=vid1",
+        transcript=[
+            TranscriptSegment(text="one", start=10.0, duration=1.0),
+            TranscriptSegment(text="two", start=20.0, duration=1.0),
+            TranscriptSegment(text="three", start=4000.0, duration=1.0),
+        ],
+        chapters=[
+            Chapter(title="Part 1", start=0.0, end=1800.0),
+            Chapter(title="Break", start=1800.0, end=3600.0),
+            Chapter(title="Part 2", start=3600.0, end=10800.0),
+        ],
+    )
+
+
+class TestSummarizeChapters:
+    def test_one_request_per_chapter_in_order(self, settings):
+        backend = MagicMock()
+        backend.summarize_chapter.side_effect = lambda text, title, chapter: f"{chapter}: {text}"
+
+        summaries = summarize_chapters(backend, _lecture(), settings)
+
+        assert summaries == ["Part 1: one two", "", "Part 2: three"]
+        assert backend.summarize_chapter.call_count == 2
+
+    def test_failed_chapter_left_empty(self, settings):
+        backend = MagicMock()
+        backend.summarize_chapter.side_effect = ["ok", RuntimeError("API error")]
+        settings.ai_workers = 1
+
+        assert summarize_chapters(backend, _lecture(), settings) == ["ok", "", ""]
+
+    def test_short_videos_skipped(self, settings):
+        backend = MagicMock()
+        settings.chapter_summary_min_duration = 4 * 3600
+
+        assert summarize_chapters(backend, _lecture(), settings) == []
+        backend.summarize_chapter.assert_not_called()
+
+    def test_disabled_by_default(self, settings):
+        backend = MagicMock()
+        settings.chapter_summary_min_duration = 0
+
+        assert summarize_chapters(backend, _lecture(), settings) == []
@@ -65,6 +65,27 @@ class TestTranscriptCLI:
         assert result.exit_code == 0
         assert "url" in result.output.lower() or "URL" in result.output
 
+    def test_retry_with_empty_queue(self, tmp_path):
+        result = runner.invoke(app, ["transcript", "retry"], env={
+            "VAULT_PATH": str(tmp_path),
+            "DATA_DIR": str(tmp_path / "data"),
+        })
+        assert result.exit_code == 0
+        assert "Nothing due" in result.output
+
+    def test_import_directory(self, tmp_path):
+        scrape = tmp_path / "scrape"
+        scrape.mkdir()
+        (scrape / "dQw4w9WgXcQ.en.srt").write_text(
+            "1\n00:00:01,000 --> 00:00:02,000\nHello\n", encoding="utf-8"
+        )
+        result = runner.invoke(app, ["transcript", "import", str(scrape), "--workers", "1"], env={
+            "VAULT_PATH": str(tmp_path),
+            "DATA_DIR": str(tmp_path / "data"),
+        })
+        assert result.exit_code == 0
+        assert "1 imported" in result.output
+
 
 class TestProcessCLI:
     def test_help(self):
@@ -22,6 +22,10 @@ class TestLoadSettings:
         assert settings.subtitle_format == "json3"
         assert settings.content_lang == "pt-BR"
         assert settings.verbose is False
+        assert settings.extract_jobs == 1
+        assert settings.request_rate == 2.0
+        assert settings.metadata_cache_ttl == 21600
+        assert settings.dedupe_captions is True
 
     def test_overrides(self, tmp_path: Path, monkeypatch):
         vault = tmp_path / "vault"
@@ -49,6 +53,80 @@ class TestLoadSettings:
         assert settings.claude_backend == "cli"
         assert settings.transcript_lang == "pt"
 
+    def test_dedupe_captions_can_be_disabled(self, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+        monkeypatch.setenv("DEDUPE_CAPTIONS", "false")
+        assert load_settings(vault_path="").dedupe_captions is False
+
+    def test_negative_coalesce_window_raises(self, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+        with pytest.raises(ValueError, match="coalesce_seconds"):
+            load_settings(vault_path="", coalesce_seconds="-1")
+
+    def test_transcript_lang_priority_list(self, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+        settings = load_settings(vault_path="", transcript_lang="en, en-orig,pt,*")
+        assert settings.transcript_langs == ["en", "en-orig", "pt", "*"]
+
+    def test_invalid_extractor_backend_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="extractor_backend"):
+            load_settings(extractor_backend="youtube-dl")
+
+    def test_negative_parse_workers_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="parse_workers"):
+            load_settings(parse_workers=-1)
+
+    def test_invalid_title_regex_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="title_exclude"):
+            load_settings(title_exclude="(unclosed")
+
+    def test_min_above_max_duration_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="min_duration"):
+            load_settings(min_duration=600, max_duration=60)
+
+    def test_vault_targets(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+        (tmp_path / "pt").mkdir()
+        (tmp_path / "en").mkdir()
+
+        settings = load_settings(vault_targets=f"pt-BR={tmp_path / 'pt'}; en={tmp_path / 'en'}")
+        assert [(t.content_lang, t.vault_path) for t in settings.vault_targets] == [
+            ("pt-BR", tmp_path / "pt"),
+            ("en", tmp_path / "en"),
+        ]
+
+    def test_malformed_vault_target_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="LANG=PATH"):
+            load_settings(vault_targets=str(tmp_path))
+
+    def test_missing_vault_target_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="vault target"):
+            load_settings(vault_targets=f"en={tmp_path / 'missing'}")
+
+    def test_invalid_jobs_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="extract_jobs"):
+            load_settings(extract_jobs=0)
+
+    def test_invalid_subtitle_capture_raises(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VAULT_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="subtitle_capture"):
+            load_settings(subtitle_capture="tape")
+
     def test_invalid_backend_raises(self, tmp_path: Path, monkeypatch):
         vault = tmp_path / "vault"
         vault.mkdir()
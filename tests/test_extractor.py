@@ -1,6 +1,7 @@
 """Tests for transcript extractor with mocked yt-dlp."""
 
 import json
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -9,11 +10,21 @@ import pytest
 from study.core.config import Settings
 from study.core.models import TranscriptResult
 from study.core.state import ProcessingStateManager
+from study.transcript.negative_cache import NegativeCache
+from study.transcript.retry import RetryQueue
+from study.transcript.subtitle_index import SubtitleIndex, SubtitleIndexPP
+from study.transcript.watermarks import ChannelWatermarks
 from study.transcript.extractor import (
     extract_transcripts,
+    iter_transcripts,
     _flatten_entries,
+    _iter_entries,
+    _ParseStage,
+    _build_ydl_opts,
     _detect_format,
+    _fallback_track,
     _find_subtitle_file,
+    _mark_auto_captions,
     _process_entry,
     _sync_archive_file,
 )
@@ -50,6 +61,7 @@ def settings(tmp_path):
         data_dir=tmp_path / "data",
         archive_file=tmp_path / "data" / "archive.txt",
         verbose=False,
+        request_rate=0.0,
     )
 
 
@@ -92,6 +104,20 @@ class TestFlattenEntries:
         assert _flatten_entries(None) == []
 
 
+class TestIterEntries:
+    def test_is_lazy(self):
+        consumed = []
+
+        def entries():
+            for vid in ("vid1", "vid2"):
+                consumed.append(vid)
+                yield {"id": vid}
+
+        it = _iter_entries({"entries": entries()})
+        assert next(it)["id"] == "vid1"
+        assert consumed == ["vid1"]
+
+
 class TestDetectFormat:
     def test_json3_extension(self, settings):
         assert _detect_format(Path("test.json3"), settings) == "json3"
@@ -205,7 +231,7 @@ class TestSyncArchiveFile:
 
 
 class TestExtractTranscripts:
-    @patch("study.transcript.extractor.yt_dlp.YoutubeDL")
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
     def test_extracts_from_url(self, mock_ydl_class, settings, tmp_path):
         sub_file = tmp_path / "abc123.json3"
         sub_file.write_text(json.dumps(SAMPLE_JSON3))
@@ -223,12 +249,13 @@ class TestExtractTranscripts:
                 "en": {"filepath": str(sub_file)}
             },
         }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
 
         results = extract_transcripts(["https://example.com"], settings)
         assert len(results) == 1
         assert results[0].id == "abc123"
 
-    @patch("study.transcript.extractor.yt_dlp.YoutubeDL")
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
     def test_handles_extract_error(self, mock_ydl_class, settings):
         mock_ydl = MagicMock()
         mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
@@ -238,7 +265,7 @@ class TestExtractTranscripts:
         results = extract_transcripts(["https://example.com"], settings)
         assert results == []
 
-    @patch("study.transcript.extractor.yt_dlp.YoutubeDL")
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
     def test_handles_none_info(self, mock_ydl_class, settings):
         mock_ydl = MagicMock()
         mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
@@ -247,3 +274,986 @@ class TestExtractTranscripts:
 
         results = extract_transcripts(["https://example.com"], settings)
         assert results == []
+
+
+class TestIterTranscripts:
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_yields_before_listing_is_exhausted(self, mock_ydl_class, settings, tmp_path):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+
+        resolved = []
+
+        def process(entry, download):
+            resolved.append(entry["id"])
+            sub_file = tmp_path / f"{entry['id']}.json3"
+            sub_file.write_text(json.dumps(SAMPLE_JSON3))
+            return {
+                **entry,
+                "title": entry["id"],
+                "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+            }
+
+        mock_ydl.extract_info.return_value = {
+            "_type": "playlist",
+            "entries": iter([{"id": "vid1"}, {"id": "vid2"}]),
+        }
+        mock_ydl.process_ie_result.side_effect = process
+
+        it = iter_transcripts(["https://example.com/channel"], settings)
+        first = next(it)
+        assert first.id == "vid1"
+        assert resolved == ["vid1"]
+        assert [r.id for r in it] == ["vid2"]
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_resolves_url_entries(self, mock_ydl_class, settings, tmp_path):
+        sub_file = tmp_path / "vid1.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+        video = {
+            "id": "vid1",
+            "title": "Video 1",
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+        mock_ydl.extract_info.side_effect = [
+            {"_type": "playlist", "entries": [
+                {"_type": "url", "url": "https://example.com/watch?v=vid1", "ie_key": "Youtube"},
+            ]},
+            video,
+        ]
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+
+        results = list(iter_transcripts(["https://example.com/channel"], settings))
+        assert [r.id for r in results] == ["vid1"]
+        _, kwargs = mock_ydl.extract_info.call_args
+        assert kwargs["process"] is False
+
+
+class TestListingDiff:
+    def _listing(self):
+        return {"_type": "playlist", "entries": [
+            {"_type": "url", "id": vid, "url": f"https://example.com/watch?v={vid}"}
+            for vid in ("vid1", "vid2")
+        ]}
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_skips_known_ids_before_fetching(self, mock_ydl_class, settings, tmp_path):
+        state = ProcessingStateManager(tmp_path / "data" / "processing_state.json")
+        state.update("vid1", transcript_extracted=True)
+
+        sub_file = tmp_path / "vid2.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_ydl.extract_info.side_effect = [
+            self._listing(),
+            {"id": "vid2", "requested_subtitles": {"en": {"filepath": str(sub_file)}}},
+        ]
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+
+        results = list(iter_transcripts(["https://example.com/channel"], settings, state=state))
+        assert [r.id for r in results] == ["vid2"]
+        fetched = [c.args[0] for c in mock_ydl.extract_info.call_args_list]
+        assert fetched == ["https://example.com/channel", "https://example.com/watch?v=vid2"]
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_force_fetches_known_ids(self, mock_ydl_class, settings, tmp_path):
+        state = ProcessingStateManager(tmp_path / "data" / "processing_state.json")
+        state.update("vid1", transcript_extracted=True)
+
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_ydl.extract_info.side_effect = [self._listing(), None, None]
+
+        list(iter_transcripts(["https://example.com/channel"], settings, state=state, force=True))
+        assert mock_ydl.extract_info.call_count == 3
+
+
+class TestWatermarks:
+    URL = "https://example.com/channel"
+
+    def _run(
+        self, mock_ydl_class, settings, tmp_path, ids, watermarks, force=False, after_date=None
+    ):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+        listed = []
+
+        def entries():
+            for vid in ids:
+                listed.append(vid)
+                yield {"id": vid, "title": vid}
+
+        def process(entry, download):
+            sub_file = tmp_path / f"{entry['id']}.json3"
+            sub_file.write_text(json.dumps(SAMPLE_JSON3))
+            return {
+                **entry,
+                "upload_date": "20240601",
+                "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+            }
+
+        mock_ydl.extract_info.return_value = {"_type": "playlist", "entries": entries()}
+        mock_ydl.process_ie_result.side_effect = process
+        results = list(iter_transcripts(
+            [self.URL], settings, watermarks=watermarks, force=force, after_date=after_date
+        ))
+        return [r.id for r in results], listed
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_first_walk_sets_watermark(self, mock_ydl_class, settings, tmp_path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        extracted, _ = self._run(mock_ydl_class, settings, tmp_path, ["new", "old"], marks)
+        assert extracted == ["new", "old"]
+        mark = marks.get(self.URL)
+        assert mark.video_id == "new"
+        assert mark.upload_date == "20240601"
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_stops_at_watermark(self, mock_ydl_class, settings, tmp_path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        marks.set(self.URL, "old1", "20240101")
+        extracted, listed = self._run(
+            mock_ydl_class, settings, tmp_path, ["new2", "new1", "old1", "old0"], marks
+        )
+        assert extracted == ["new2", "new1"]
+        assert "old0" not in listed
+        assert marks.get(self.URL).video_id == "new2"
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_force_ignores_watermark(self, mock_ydl_class, settings, tmp_path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        marks.set(self.URL, "old1")
+        extracted, _ = self._run(
+            mock_ydl_class, settings, tmp_path, ["new1", "old1", "old0"], marks, force=True
+        )
+        assert extracted == ["new1", "old1", "old0"]
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_filtered_walk_leaves_watermark(self, mock_ydl_class, settings, tmp_path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        marks.set(self.URL, "old1", "20240101")
+        filtered = replace(settings, title_exclude="new2")
+        extracted, listed = self._run(
+            mock_ydl_class, filtered, tmp_path, ["new2", "new1", "old1", "old0"], marks
+        )
+        assert extracted == ["new1", "old1", "old0"]
+        assert listed == ["new2", "new1", "old1", "old0"]
+        assert marks.get(self.URL).video_id == "old1"
+
+        # The unfiltered run still stops at the untouched watermark and gets new2
+        extracted, _ = self._run(
+            mock_ydl_class, settings, tmp_path, ["new2", "new1", "old1", "old0"], marks
+        )
+        assert extracted == ["new2", "new1"]
+        assert marks.get(self.URL).video_id == "new2"
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_after_date_leaves_watermark(self, mock_ydl_class, settings, tmp_path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        marks.set(self.URL, "old1", "20240101")
+        _, listed = self._run(
+            mock_ydl_class, settings, tmp_path, ["new1", "old1", "old0"], marks,
+            after_date="20240215",
+        )
+        assert listed == ["new1", "old1", "old0"]
+        assert marks.get(self.URL).video_id == "old1"
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_channel_tabs_have_own_watermarks(self, mock_ydl_class, settings, tmp_path):
+        videos_url = f"{self.URL}/videos"
+        streams_url = f"{self.URL}/streams"
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        marks.set(videos_url, "v2")
+        marks.set(streams_url, "s1")
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+        sub_file = tmp_path / "shared.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+
+        def tab(url, ids):
+            return {"_type": "playlist", "webpage_url": url,
+                    "entries": [{"id": vid, "title": vid} for vid in ids]}
+
+        mock_ydl.extract_info.return_value = {"_type": "playlist", "entries": [
+            tab(videos_url, ["v3", "v2", "v1"]),
+            tab(streams_url, ["s2", "s1"]),
+        ]}
+        mock_ydl.process_ie_result.side_effect = lambda entry, download: {
+            **entry,
+            "upload_date": "20240601",
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+
+        results = list(iter_transcripts([self.URL], settings, watermarks=marks))
+
+        assert [r.id for r in results] == ["v3", "s2"]
+        assert marks.get(videos_url).video_id == "v3"
+        assert marks.get(streams_url).video_id == "s2"
+        assert marks.get(self.URL) is None
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_interrupted_walk_keeps_watermark(self, mock_ydl_class, settings, tmp_path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+        sub_file = tmp_path / "shared.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl.extract_info.return_value = {
+            "_type": "playlist",
+            "entries": [{"id": "new"}, {"id": "old"}],
+        }
+        mock_ydl.process_ie_result.side_effect = lambda entry, download: {
+            **entry,
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+
+        it = iter_transcripts([self.URL], settings, watermarks=marks)
+        next(it)
+        it.close()
+        assert marks.get(self.URL) is None
+
+
+class TestParallelExtraction:
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_workers_extract_every_entry(self, mock_ydl_class, settings, tmp_path):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+
+        def process(entry, download):
+            sub_file = tmp_path / f"{entry['id']}.json3"
+            sub_file.write_text(json.dumps(SAMPLE_JSON3))
+            return {
+                **entry,
+                "title": entry["id"],
+                "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+            }
+
+        ids = [f"vid{i}" for i in range(10)]
+        mock_ydl.extract_info.return_value = {
+            "_type": "playlist",
+            "entries": iter([{"id": vid} for vid in ids]),
+        }
+        mock_ydl.process_ie_result.side_effect = process
+
+        results = list(iter_transcripts(["https://example.com/channel"], settings, jobs=3))
+        assert sorted(r.id for r in results) == sorted(ids)
+        # One instance for listing plus one per worker
+        assert mock_ydl_class.call_count == 4
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_early_close_stops_workers(self, mock_ydl_class, settings, tmp_path):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl_class.return_value.__exit__ = MagicMock(return_value=False)
+
+        sub_file = tmp_path / "shared.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl.extract_info.return_value = {
+            "_type": "playlist",
+            "entries": iter([{"id": f"vid{i}"} for i in range(100)]),
+        }
+        mock_ydl.process_ie_result.side_effect = lambda entry, download: {
+            **entry,
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+
+        it = iter_transcripts(["https://example.com/channel"], settings, jobs=2)
+        assert next(it) is not None
+        it.close()
+
+
+class TestSubtitleIndexLookup:
+    def test_uses_index_without_scanning(self, settings, tmp_path):
+        sub_file = tmp_path / "abc123.en.json3"
+        sub_file.write_text("{}")
+        index = SubtitleIndex()
+        index.add("abc123", "en", sub_file)
+        entry = {"id": "abc123", "requested_subtitles": {}}
+
+        with patch.object(Path, "iterdir", side_effect=AssertionError("scanned")):
+            assert _find_subtitle_file(entry, settings, tmp_path, index) == sub_file
+
+    def test_index_miss_returns_none(self, settings, tmp_path):
+        (tmp_path / "abc123.en.json3").write_text("{}")
+        entry = {"id": "abc123", "requested_subtitles": {}}
+        assert _find_subtitle_file(entry, settings, tmp_path, SubtitleIndex()) is None
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_registers_index_hook(self, mock_ydl_class, settings):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.extract_info.return_value = None
+
+        list(iter_transcripts(["https://example.com"], settings))
+        pp, = mock_ydl.add_post_processor.call_args.args
+        assert isinstance(pp, SubtitleIndexPP)
+        assert mock_ydl.add_post_processor.call_args.kwargs == {"when": "before_dl"}
+
+
+class TestMemoryCapture:
+    @pytest.fixture
+    def memory_settings(self, settings):
+        settings.subtitle_capture = "memory"
+        return settings
+
+    def _mock_ydl(self, mock_ydl_class, info):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        mock_ydl.extract_info.return_value = info
+        mock_ydl.process_ie_result.side_effect = lambda entry, download: entry
+        response = MagicMock()
+        response.__enter__ = MagicMock(return_value=response)
+        response.__exit__ = MagicMock(return_value=False)
+        response.read.return_value = json.dumps(SAMPLE_JSON3).encode("utf-8")
+        mock_ydl.urlopen.return_value = response
+        return mock_ydl
+
+    @patch("study.transcript.extractor.tempfile.TemporaryDirectory")
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_fetches_track_without_disk(self, mock_ydl_class, mock_tempdir, memory_settings):
+        mock_ydl = self._mock_ydl(mock_ydl_class, {
+            "id": "abc123",
+            "title": "Test Video",
+            "requested_subtitles": {
+                "en": {"ext": "json3", "url": "https://example.com/subs.json3"},
+            },
+        })
+
+        results = extract_transcripts(["https://example.com"], memory_settings)
+        assert [r.id for r in results] == ["abc123"]
+        assert len(results[0].transcript) == 2
+        assert mock_ydl.process_ie_result.call_args.kwargs == {"download": False}
+        assert "outtmpl" not in mock_ydl_class.call_args.args[0]
+        mock_tempdir.assert_not_called()
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_uses_inline_data(self, mock_ydl_class, memory_settings):
+        mock_ydl = self._mock_ydl(mock_ydl_class, {
+            "id": "abc123",
+            "requested_subtitles": {
+                "en": {"ext": "vtt", "data": "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHi\n"},
+            },
+        })
+
+        results = extract_transcripts(["https://example.com"], memory_settings)
+        assert [s.text for s in results[0].transcript] == ["Hi"]
+        mock_ydl.urlopen.assert_not_called()
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_no_tracks(self, mock_ydl_class, memory_settings):
+        self._mock_ydl(mock_ydl_class, {"id": "abc123", "requested_subtitles": None})
+        assert extract_transcripts(["https://example.com"], memory_settings) == []
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_applies_date_range(self, mock_ydl_class, memory_settings):
+        from yt_dlp.utils import DateRange
+
+        mock_ydl = self._mock_ydl(mock_ydl_class, {
+            "id": "abc123",
+            "upload_date": "20230101",
+            "requested_subtitles": {"en": {"ext": "json3", "url": "https://example.com/s"}},
+        })
+        mock_ydl.params = {"daterange": DateRange(start="20240101")}
+
+        assert extract_transcripts(["https://example.com"], memory_settings) == []
+        mock_ydl.urlopen.assert_not_called()
+
+
+class TestMetadataCacheIntegration:
+    def _mock_ydl(self, mock_ydl_class):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        response = MagicMock()
+        response.__enter__ = MagicMock(return_value=response)
+        response.__exit__ = MagicMock(return_value=False)
+        response.read.return_value = json.dumps(SAMPLE_JSON3).encode("utf-8")
+        mock_ydl.urlopen.return_value = response
+        return mock_ydl
+
+    def _seed(self, settings, selection="en;json3", **overrides):
+        from study.transcript.cache import MetadataCache
+
+        cache = MetadataCache(settings.data_dir / "cache" / "metadata", ttl=60, max_entries=10)
+        cache.put({
+            "id": "dQw4w9WgXcQ",
+            "title": "Cached Video",
+            "channel": "Chan",
+            "upload_date": "20240615",
+            "webpage_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "requested_subtitles": {"en": {"ext": "json3", "url": "https://example.com/s"}},
+            **overrides,
+        }, selection)
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_cached_video_skips_resolution(self, mock_ydl_class, settings):
+        self._seed(settings)
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+
+        results = extract_transcripts(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], settings
+        )
+        assert [r.title for r in results] == ["Cached Video"]
+        mock_ydl.extract_info.assert_not_called()
+        mock_ydl.process_ie_result.assert_not_called()
+        mock_ydl.urlopen.assert_called_once()
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_cached_no_subtitles_skips_network(self, mock_ydl_class, settings):
+        self._seed(settings, requested_subtitles=None)
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+
+        results = extract_transcripts(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], settings
+        )
+        assert results == []
+        mock_ydl.extract_info.assert_not_called()
+        mock_ydl.urlopen.assert_not_called()
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_other_languages_resolve_again(self, mock_ydl_class, settings, tmp_path):
+        self._seed(settings, requested_subtitles=None)
+        settings.transcript_lang = "pt"
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+        sub_file = tmp_path / "dQw4w9WgXcQ.pt.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl.extract_info.return_value = {
+            "id": "dQw4w9WgXcQ",
+            "title": "Fresh Video",
+            "requested_subtitles": {"pt": {"filepath": str(sub_file)}},
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+
+        results = extract_transcripts(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], settings
+        )
+        assert [r.language for r in results] == ["pt"]
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_failed_cached_fetch_falls_back_to_resolution(self, mock_ydl_class, settings, tmp_path):
+        self._seed(settings)
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+        mock_ydl.urlopen.side_effect = Exception("HTTP Error 403: expired")
+        sub_file = tmp_path / "dQw4w9WgXcQ.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl.extract_info.return_value = {
+            "id": "dQw4w9WgXcQ",
+            "title": "Fresh Video",
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+
+        results = extract_transcripts(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], settings
+        )
+        assert [r.title for r in results] == ["Fresh Video"]
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_resolved_videos_are_cached(self, mock_ydl_class, settings, tmp_path):
+        from study.transcript.cache import MetadataCache
+
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+        sub_file = tmp_path / "abc123.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl.extract_info.return_value = {
+            "id": "abc123",
+            "title": "Test Video",
+            "requested_subtitles": {
+                "en": {"ext": "json3", "url": "https://example.com/s", "filepath": str(sub_file)},
+            },
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+
+        extract_transcripts(["https://example.com"], settings)
+        cache = MetadataCache(settings.data_dir / "cache" / "metadata", ttl=60, max_entries=10)
+        assert cache.get("abc123")["title"] == "Test Video"
+
+
+class TestLanguagePriority:
+    @pytest.fixture
+    def multi_settings(self, settings):
+        settings.transcript_lang = "en,en-orig,pt,*"
+        return settings
+
+    def test_ydl_requests_listed_languages(self, multi_settings, tmp_path):
+        opts = _build_ydl_opts(multi_settings, tmp_path)
+        assert opts["subtitleslangs"] == ["en", "en-orig", "pt"]
+
+    def test_process_entry_keeps_all_tracks(self, multi_settings, tmp_path):
+        en_file = tmp_path / "abc123.en-orig.json3"
+        pt_file = tmp_path / "abc123.pt.json3"
+        en_file.write_text(json.dumps(SAMPLE_JSON3))
+        pt_file.write_text(json.dumps({
+            "events": [{"tStartMs": 0, "dDurationMs": 1000, "segs": [{"utf8": "Olá"}]}],
+        }))
+        entry = {
+            "id": "abc123",
+            "title": "Test",
+            "requested_subtitles": {
+                "pt": {"filepath": str(pt_file)},
+                "en-orig": {"filepath": str(en_file)},
+            },
+        }
+
+        result = _process_entry(entry, multi_settings, tmp_path)
+        assert result.language == "en-orig"
+        assert result.full_text == "Hello world Second line"
+        assert list(result.alt_transcripts) == ["pt"]
+        assert result.alt_transcripts["pt"][0].text == "Olá"
+
+    def test_fallback_prefers_manual_then_original(self, multi_settings):
+        entry = {
+            "subtitles": {
+                "live_chat": [{"ext": "json", "url": "https://example.com/chat"}],
+            },
+            "automatic_captions": {
+                "de": [{"ext": "json3", "url": "https://example.com/de"}],
+                "fr-orig": [
+                    {"ext": "json3", "url": "https://example.com/fr.json3"},
+                    {"ext": "vtt", "url": "https://example.com/fr.vtt"},
+                ],
+            },
+        }
+        track = _fallback_track(entry, multi_settings)
+        assert list(track) == ["fr-orig"]
+        assert track["fr-orig"]["url"] == "https://example.com/fr.json3"
+
+        entry["subtitles"]["es"] = [{"ext": "vtt", "url": "https://example.com/es"}]
+        assert list(_fallback_track(entry, multi_settings)) == ["es"]
+
+    def test_fallback_skips_unparseable_formats(self, multi_settings):
+        multi_settings.subtitle_format = "ttml"
+        entry = {
+            "subtitles": {"es": [{"ext": "srv3", "url": "https://example.com/es.srv3"}]},
+            "automatic_captions": {
+                "de-orig": [
+                    {"ext": "vtt", "url": "https://example.com/de.vtt"},
+                    {"ext": "ttml", "url": "https://example.com/de.ttml"},
+                ],
+            },
+        }
+        track = _fallback_track(entry, multi_settings)
+        assert track["de-orig"]["ext"] == "vtt"
+
+        entry["automatic_captions"]["de-orig"].pop(0)
+        assert _fallback_track(entry, multi_settings) is None
+
+    def test_no_fallback_without_wildcard(self, settings):
+        entry = {"automatic_captions": {"de": [{"ext": "json3", "url": "https://x"}]}}
+        assert _fallback_track(entry, settings) is None
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_fallback_track_captured_in_file_mode(self, mock_ydl_class, multi_settings):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        mock_ydl.extract_info.return_value = {
+            "id": "abc123",
+            "title": "Test Video",
+            "requested_subtitles": {},
+            "automatic_captions": {
+                "de-orig": [{"ext": "json3", "url": "https://example.com/de"}],
+            },
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+        response = MagicMock()
+        response.__enter__ = MagicMock(return_value=response)
+        response.__exit__ = MagicMock(return_value=False)
+        response.read.return_value = json.dumps(SAMPLE_JSON3).encode("utf-8")
+        mock_ydl.urlopen.return_value = response
+
+        results = extract_transcripts(["https://example.com"], multi_settings)
+        assert [r.language for r in results] == ["de-orig"]
+        assert mock_ydl.urlopen.call_args.args[0].url == "https://example.com/de"
+
+
+class TestRetryQueueing:
+    def _mock_ydl(self, mock_ydl_class):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        return mock_ydl
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_failed_video_is_queued(self, mock_ydl_class, settings, tmp_path):
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+        mock_ydl.extract_info.return_value = {
+            "entries": [
+                {"_type": "url", "id": "vid1", "url": "https://www.youtube.com/watch?v=vid1"},
+            ],
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+        retries = RetryQueue(tmp_path / "retry_queue.json")
+
+        def resolve(url, download=False, ie_key=None, process=False):
+            if url == "https://example.com/list":
+                return mock_ydl.extract_info.return_value
+            raise Exception("HTTP Error 503: Service Unavailable")
+
+        mock_ydl.extract_info.side_effect = resolve
+        results = list(iter_transcripts(["https://example.com/list"], settings, retries=retries))
+
+        assert results == []
+        entry = retries.get("vid1")
+        assert entry.attempts == 1
+        assert entry.url == "https://www.youtube.com/watch?v=vid1"
+        assert "503" in entry.last_error
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_success_removes_from_queue(self, mock_ydl_class, settings, tmp_path):
+        sub_file = tmp_path / "vid1.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+        mock_ydl.extract_info.return_value = {
+            "id": "vid1",
+            "title": "Video 1",
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+        retries = RetryQueue(tmp_path / "retry_queue.json")
+        retries.record_failure("vid1", "https://example.com", "timeout")
+
+        results = list(iter_transcripts(["https://example.com"], settings, retries=retries))
+
+        assert [r.id for r in results] == ["vid1"]
+        assert retries.get("vid1") is None
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_listing_failure_keeps_watermark(self, mock_ydl_class, settings, tmp_path):
+        def entries():
+            yield {"id": "new1", "title": "New"}
+            raise Exception("HTTP Error 500 while paging")
+
+        mock_ydl = self._mock_ydl(mock_ydl_class)
+        mock_ydl.extract_info.return_value = {"entries": entries()}
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+        watermarks = ChannelWatermarks(tmp_path / "channel_watermarks.json")
+
+        list(iter_transcripts(["https://example.com/c"], settings, watermarks=watermarks))
+
+        assert watermarks.get("https://example.com/c") is None
+
+
+class TestNegativeCacheIntegration:
+    def _mock_ydl(self, mock_ydl_class, info):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        mock_ydl.extract_info.return_value = info
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+        return mock_ydl
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_known_unavailable_skipped_before_request(self, mock_ydl_class, settings, tmp_path):
+        mock_ydl = self._mock_ydl(mock_ydl_class, {
+            "entries": [{"_type": "url", "id": "gone1", "url": "https://x/gone1"}],
+        })
+        unavailable = NegativeCache(tmp_path / "negative_cache.json")
+        unavailable.add("gone1", "removed")
+
+        results = list(
+            iter_transcripts(["https://example.com/c"], settings, unavailable=unavailable)
+        )
+
+        assert results == []
+        assert mock_ydl.extract_info.call_count == 1
+        mock_ydl.process_ie_result.assert_not_called()
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_permanent_error_goes_to_negative_cache(self, mock_ydl_class, settings, tmp_path):
+        mock_ydl = self._mock_ydl(mock_ydl_class, {"id": "priv1", "title": "Secret"})
+        mock_ydl.process_ie_result.side_effect = Exception("ERROR: [youtube] priv1: Private video")
+        unavailable = NegativeCache(tmp_path / "negative_cache.json")
+        retries = RetryQueue(tmp_path / "retry_queue.json")
+
+        list(iter_transcripts(
+            ["https://example.com"], settings, retries=retries, unavailable=unavailable
+        ))
+
+        assert unavailable.get("priv1").reason == "private"
+        assert retries.get("priv1") is None
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_old_video_without_captions_is_cached(self, mock_ydl_class, settings, tmp_path):
+        self._mock_ydl(mock_ydl_class, {
+            "id": "short1", "upload_date": "20200101", "requested_subtitles": None,
+        })
+        unavailable = NegativeCache(tmp_path / "negative_cache.json")
+        retries = RetryQueue(tmp_path / "retry_queue.json")
+
+        list(iter_transcripts(
+            ["https://example.com"], settings, retries=retries, unavailable=unavailable
+        ))
+
+        assert unavailable.get("short1", langs="en").reason == "no_captions"
+        assert unavailable.get("short1", langs="pt") is None
+        assert retries.get("short1") is None
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_fresh_video_without_captions_is_retried(self, mock_ydl_class, settings, tmp_path):
+        from datetime import date
+
+        self._mock_ydl(mock_ydl_class, {
+            "id": "new1",
+            "upload_date": date.today().strftime("%Y%m%d"),
+            "requested_subtitles": None,
+        })
+        unavailable = NegativeCache(tmp_path / "negative_cache.json")
+        retries = RetryQueue(tmp_path / "retry_queue.json")
+
+        list(iter_transcripts(
+            ["https://example.com"], settings, retries=retries, unavailable=unavailable
+        ))
+
+        assert unavailable.get("new1") is None
+        assert retries.get("new1").last_error == "no captions yet"
+
+
+class TestRateLimitBackoff:
+    @patch("study.transcript.extractor.RateLimiter")
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_rate_limited_video_retried(self, mock_ydl_class, mock_limiter_class, settings, tmp_path):
+        from study.transcript.ratelimit import RateLimiter
+
+        limiter = RateLimiter(100, cooldown=0.01)
+        mock_limiter_class.return_value = limiter
+        sub_file = tmp_path / "vid1.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        mock_ydl.extract_info.return_value = {"id": "vid1", "title": "Video"}
+        mock_ydl.process_ie_result.side_effect = [
+            Exception("ERROR: HTTP Error 429: Too Many Requests"),
+            {"id": "vid1", "title": "Video", "requested_subtitles": {
+                "en": {"filepath": str(sub_file)},
+            }},
+        ]
+        retries = RetryQueue(tmp_path / "retry_queue.json")
+
+        results = list(iter_transcripts(["https://example.com"], settings, retries=retries))
+
+        assert [r.id for r in results] == ["vid1"]
+        assert limiter.throttle_count == 1
+        assert len(retries) == 0
+
+
+class TestChapters:
+    def test_chapters_kept_with_transcript(self, settings, tmp_path):
+        sub_file = tmp_path / "abc123.en.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        entry = {
+            "id": "abc123",
+            "title": "Lecture",
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+            "chapters": [
+                {"start_time": 0.0, "end_time": 7.0, "title": "Intro"},
+                {"start_time": 7.0, "end_time": 20.0, "title": "Main"},
+                {"title": "Broken"},
+            ],
+        }
+
+        result = _process_entry(entry, settings, tmp_path)
+
+        assert [c.title for c in result.chapters] == ["Intro", "Main"]
+        sections = result.chapter_segments()
+        assert [seg.text for seg in sections[1][1]] == ["Second line"]
+
+
+class TestCaptionDedup:
+    ROLLING = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:03.000\n \nfirst line\n\n"
+        "00:00:03.000 --> 00:00:05.000\nfirst line\nsecond line\n"
+    )
+
+    def _entry(self, tmp_path, content=ROLLING, automatic=True):
+        sub_file = tmp_path / "abc123.en.vtt"
+        sub_file.write_text(content)
+        sub_info = {"filepath": str(sub_file), "ext": "vtt"}
+        if automatic:
+            sub_info["automatic"] = True
+        return {"id": "abc123", "title": "Lecture", "requested_subtitles": {"en": sub_info}}
+
+    def test_rolling_captions_deduplicated(self, settings, tmp_path):
+        result = _process_entry(self._entry(tmp_path), settings, tmp_path)
+        assert result.full_text == "first line second line"
+
+    def test_manual_subtitles_untouched(self, settings, tmp_path):
+        content = "WEBVTT\n\n" + "".join(
+            f"00:00:0{i}.000 --> 00:00:0{i + 1}.000\n{text}\n\n"
+            for i, text in enumerate(["No.", "No.", "So", "So what?"])
+        )
+        entry = self._entry(tmp_path, content, automatic=False)
+        result = _process_entry(entry, settings, tmp_path)
+        assert [s.text for s in result.transcript] == ["No.", "No.", "So", "So what?"]
+
+    def test_marks_auto_caption_tracks(self):
+        video = {
+            "subtitles": {"en": [{"ext": "vtt"}]},
+            "automatic_captions": {"en": [{"ext": "vtt"}], "pt": [{"ext": "vtt"}]},
+            "requested_subtitles": {"en": {"ext": "vtt"}, "pt": {"ext": "vtt"}},
+        }
+        _mark_auto_captions(video)
+        assert "automatic" not in video["requested_subtitles"]["en"]
+        assert video["requested_subtitles"]["pt"]["automatic"] is True
+
+    def test_disabled_keeps_every_cue(self, settings, tmp_path):
+        settings.dedupe_captions = False
+        result = _process_entry(self._entry(tmp_path), settings, tmp_path)
+        assert result.full_text == "first line first line\nsecond line"
+
+
+class TestCoalescing:
+    def test_fragments_merged_within_chapters(self, settings, tmp_path):
+        events = [
+            {"tStartMs": i * 1000, "dDurationMs": 1000, "segs": [{"utf8": f"w{i}"}]}
+            for i in range(12)
+        ]
+        sub_file = tmp_path / "abc123.en.json3"
+        sub_file.write_text(json.dumps({"events": events}))
+        entry = {
+            "id": "abc123",
+            "title": "Lecture",
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+            "chapters": [
+                {"start_time": 0.0, "end_time": 5.0, "title": "Intro"},
+                {"start_time": 5.0, "end_time": 12.0, "title": "Main"},
+            ],
+        }
+        settings.coalesce_seconds = 4
+
+        result = _process_entry(entry, settings, tmp_path)
+
+        assert [seg.start for seg in result.transcript] == [0.0, 4.0, 5.0, 9.0]
+        sections = result.chapter_segments()
+        assert [seg.text for seg in sections[0][1]] == ["w0 w1 w2 w3", "w4"]
+
+
+class TestEntryFilterIntegration:
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_filtered_entries_never_resolved(self, mock_ydl_class, settings):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        mock_ydl.extract_info.side_effect = [
+            {"entries": [
+                {"_type": "url", "id": "short1", "url": "https://www.youtube.com/shorts/short1",
+                 "duration": 30},
+                {"_type": "url", "id": "long1", "url": "https://x/long1", "duration": 28800},
+                {"_type": "url", "id": "ok1", "url": "https://x/ok1", "duration": 900},
+            ]},
+            {"id": "ok1", "requested_subtitles": None},
+        ]
+        settings.skip_shorts = True
+        settings.max_duration = 4 * 3600
+
+        list(iter_transcripts(["https://example.com/c"], settings))
+
+        resolved = [c.args[0] for c in mock_ydl.extract_info.call_args_list[1:]]
+        assert resolved == ["https://x/ok1"]
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_single_video_url_never_filtered(self, mock_ydl_class, settings, tmp_path):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.params = {}
+        sub_file = tmp_path / "dQw4w9WgXcQ.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl.extract_info.return_value = {
+            "id": "dQw4w9WgXcQ",
+            "title": "Short talk",
+            "duration": 120,
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+        settings.min_duration = 300
+
+        results = list(iter_transcripts(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], settings
+        ))
+
+        assert [r.id for r in results] == ["dQw4w9WgXcQ"]
+
+
+class TestParseStage:
+    def test_inline_results_keep_order(self, settings):
+        stage = _ParseStage(settings)
+        stage.submit({"id": "vid1", "title": "A"}, {"en": (json.dumps(SAMPLE_JSON3), "json3")})
+        assert [r.id for r in stage.ready()] == ["vid1"]
+        assert list(stage.drain()) == []
+
+    def test_pool_results_keep_order(self, settings):
+        from concurrent.futures import ThreadPoolExecutor
+
+        data = json.dumps(SAMPLE_JSON3)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            stage = _ParseStage(settings, pool, max_pending=10)
+            for vid in ("vid1", "vid2", "vid3"):
+                stage.submit({"id": vid}, {"en": (data, "json3")})
+            results = list(stage.ready()) + list(stage.drain())
+        assert [r.id for r in results] == ["vid1", "vid2", "vid3"]
+        assert results[0].full_text == "Hello world Second line"
+
+    def test_parse_failure_drops_track(self, settings):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stage = _ParseStage(settings, pool)
+            stage.submit({"id": "vid1"}, {
+                "en": ("not json", "json3"),
+                "pt": (json.dumps(SAMPLE_JSON3), "json3"),
+            })
+            results = list(stage.drain())
+        assert results[0].language == "pt"
+
+    @patch("study.transcript.backends.ytdlp_backend.yt_dlp.YoutubeDL")
+    def test_process_pool_end_to_end(self, mock_ydl_class, settings, tmp_path):
+        sub_file = tmp_path / "abc123.json3"
+        sub_file.write_text(json.dumps(SAMPLE_JSON3))
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.__enter__ = MagicMock(return_value=mock_ydl)
+        mock_ydl.__exit__ = MagicMock(return_value=False)
+        mock_ydl.extract_info.return_value = {
+            "id": "abc123",
+            "title": "Test Video",
+            "requested_subtitles": {"en": {"filepath": str(sub_file)}},
+        }
+        mock_ydl.process_ie_result.side_effect = lambda info, download: info
+        settings.parse_workers = 1
+
+        results = extract_transcripts(["https://example.com"], settings)
+
+        assert [r.full_text for r in results] == ["Hello world Second line"]
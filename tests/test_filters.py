@@ -0,0 +1,48 @@
+"""Tests for duration, type and title listing filters."""
+
+from study.transcript.filters import EntryFilter
+
+
+def _entry(**fields) -> dict:
+    return {"_type": "url", "ie_key": "Youtube", "id": "vid1", "url": "https://x/vid1", **fields}
+
+
+class TestEntryFilter:
+    def test_inactive_by_default(self):
+        assert not EntryFilter().active
+
+    def test_duration_bounds(self):
+        keep = EntryFilter(min_duration=120, max_duration=3600)
+        assert keep(_entry(duration=600))
+        assert not keep(_entry(duration=60))
+        assert not keep(_entry(duration=8 * 3600))
+        assert keep.skipped == 2
+
+    def test_missing_metadata_is_kept(self):
+        keep = EntryFilter(min_duration=120, title_include="python")
+        assert keep(_entry())
+
+    def test_shorts_by_url_only(self):
+        keep = EntryFilter(skip_shorts=True)
+        assert not keep(_entry(url="https://www.youtube.com/shorts/vid1", duration=170))
+        assert keep(_entry(url="https://www.youtube.com/watch?v=vid2", duration=45))
+        assert keep(_entry(duration=300))
+
+    def test_live_statuses(self):
+        keep = EntryFilter(skip_live=True)
+        assert not keep(_entry(live_status="was_live"))
+        assert not keep(_entry(live_status="is_upcoming"))
+        assert keep(_entry(live_status="not_live"))
+
+    def test_title_regexes_ignore_case(self):
+        keep = EntryFilter(title_include=r"python|rust", title_exclude=r"\bpodcast\b")
+        assert keep(_entry(title="Learning Python"))
+        assert not keep(_entry(title="Cooking pasta"))
+        assert not keep(_entry(title="Rust Podcast #12"))
+
+    def test_skips_channel_tabs(self):
+        keep = EntryFilter(skip_shorts=True, skip_live=True)
+        tab = {"_type": "url", "ie_key": "YoutubeTab"}
+        assert not keep({**tab, "url": "https://www.youtube.com/@c/shorts"})
+        assert not keep({**tab, "url": "https://www.youtube.com/@c/streams"})
+        assert keep({**tab, "url": "https://www.youtube.com/@c/videos", "title": "c - Videos"})
@@ -0,0 +1,186 @@
+"""Tests for bulk import of subtitle directories."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from study.core.config import Settings
+from study.core.state import ProcessingStateManager
+from study.transcript.importer import (
+    _parse_item,
+    import_directory,
+    scan_subtitle_dir,
+    split_subtitle_name,
+)
+from study.transcript.storage import TranscriptStorage
+
+SAMPLE_JSON3 = {
+    "events": [
+        {"tStartMs": 5000, "dDurationMs": 3000, "segs": [{"utf8": "Hello world"}]},
+    ],
+}
+
+SAMPLE_VTT = """\
+WEBVTT
+
+00:00:05.000 --> 00:00:08.000
+Olá mundo
+"""
+
+SAMPLE_SRT = """\
+1
+00:00:05,000 --> 00:00:08,000
+Hello world
+"""
+
+VID1 = "dQw4w9WgXcQ"
+VID2 = "9bZkp7q19f0"
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> Settings:
+    return Settings(
+        vault_path=tmp_path,
+        claude_backend="api",
+        anthropic_api_key="test-key",
+        claude_model="test-model",
+        transcript_lang="en,pt",
+        subtitle_format="json3",
+        content_lang="pt-BR",
+        data_dir=tmp_path / "data",
+        archive_file=tmp_path / "data" / "archive.txt",
+        verbose=False,
+    )
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "scrape"
+    channel = root / "Some Channel"
+    channel.mkdir(parents=True)
+    (channel / f"{VID1}.en.json3").write_text(json.dumps(SAMPLE_JSON3))
+    (channel / f"{VID1}.pt.vtt").write_text(SAMPLE_VTT)
+    (channel / f"{VID1}.info.json").write_text(json.dumps({
+        "id": VID1,
+        "title": "Never Gonna",
+        "channel": "Rick",
+        "upload_date": "20091025",
+    }))
+    (root / f"Gangnam. Style [{VID2}].srt").write_text(SAMPLE_SRT)
+    (root / "notes.vtt").write_text(SAMPLE_VTT)
+    return root
+
+
+class TestSplitSubtitleName:
+    def test_id_lang_ext(self):
+        assert split_subtitle_name(f"{VID1}.en-US.vtt") == (VID1, "en-US", VID1)
+
+    def test_id_ext(self):
+        assert split_subtitle_name(f"{VID1}.json3") == (VID1, "", VID1)
+
+    def test_ytdlp_default_template(self):
+        name = f"Mr. Foo [{VID1}].pt.srt"
+        assert split_subtitle_name(name) == (VID1, "pt", f"Mr. Foo [{VID1}]")
+
+    def test_no_id(self):
+        assert split_subtitle_name("notes.vtt")[0] is None
+
+
+class TestScanSubtitleDir:
+    def test_groups_by_video(self, corpus: Path):
+        items = {item.video_id: item for item in scan_subtitle_dir(corpus)}
+
+        assert set(items) == {VID1, VID2}
+        assert set(items[VID1].files) == {"en", "pt"}
+        assert items[VID1].info_path.name == f"{VID1}.info.json"
+        assert items[VID2].info_path is None
+
+
+class TestImportDirectory:
+    def test_imports_with_metadata(self, corpus: Path, settings: Settings):
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "state.json")
+
+        stats = import_directory(corpus, settings, storage, state, workers=1)
+
+        assert (stats.imported, stats.skipped, stats.failed) == (2, 0, 0)
+        result = storage.load(VID1)
+        assert result.title == "Never Gonna"
+        assert result.channel == "Rick"
+        assert result.language == "en"
+        assert set(result.alt_transcripts) == {"pt"}
+        bare = storage.load(VID2)
+        assert bare.title == "Unknown"
+        assert bare.webpage_url == f"https://www.youtube.com/watch?v={VID2}"
+        assert state.is_transcript_extracted(VID1)
+        assert state.is_transcript_extracted(VID2)
+
+    def test_worker_returns_only_result_fields(self, tmp_path: Path):
+        info_path = tmp_path / f"{VID1}.info.json"
+        info_path.write_text(json.dumps({
+            "id": VID1,
+            "title": "Never Gonna",
+            "formats": [{"url": "https://example.com/f"}] * 100,
+            "thumbnails": [{"url": "https://example.com/t"}],
+        }))
+        sub_path = tmp_path / f"{VID1}.en.srt"
+        sub_path.write_text(SAMPLE_SRT)
+
+        info, tracks, errors = _parse_item({"en": sub_path}, info_path)
+
+        assert info == {"id": VID1, "title": "Never Gonna"}
+        assert list(tracks) == ["en"]
+        assert errors == []
+
+    def test_skips_already_extracted(self, corpus: Path, settings: Settings):
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "state.json")
+        state.update(VID1, transcript_extracted=True)
+
+        stats = import_directory(corpus, settings, storage, state, workers=1)
+
+        assert (stats.imported, stats.skipped) == (1, 1)
+        assert not storage.exists(VID1)
+
+    def test_unparseable_file_counts_as_failed(self, tmp_path: Path, settings: Settings):
+        root = tmp_path / "bad"
+        root.mkdir()
+        (root / f"{VID1}.en.json3").write_text("not json")
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "state.json")
+
+        stats = import_directory(root, settings, storage, state, workers=1)
+
+        assert stats.failed == 1
+        assert not state.is_transcript_extracted(VID1)
+
+    def test_captions_deduplicated_only_on_request(self, tmp_path: Path, settings: Settings):
+        root = tmp_path / "manual"
+        root.mkdir()
+        (root / f"{VID1}.en.srt").write_text("".join(
+            f"{i + 1}\n00:00:0{i},000 --> 00:00:0{i + 1},000\n{text}\n\n"
+            for i, text in enumerate(["No.", "No.", "So", "So what?"])
+        ))
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "state.json")
+
+        import_directory(root, settings, storage, state, workers=1)
+        texts = [s.text for s in storage.load(VID1).transcript]
+        assert texts == ["No.", "No.", "So", "So what?"]
+
+        import_directory(root, settings, storage, state, force=True, workers=1, dedupe_captions=True)
+        texts = [s.text for s in storage.load(VID1).transcript]
+        assert texts == ["No.", "So", "what?"]
+
+    def test_process_pool_and_batches(self, corpus: Path, settings: Settings):
+        storage = TranscriptStorage(settings.data_dir)
+        state_file = settings.data_dir / "state.json"
+        state = ProcessingStateManager(state_file)
+
+        stats = import_directory(corpus, settings, storage, state, workers=2, batch_size=1)
+
+        assert stats.imported == 2
+        reloaded = ProcessingStateManager(state_file)
+        assert reloaded.is_transcript_extracted(VID1)
+        assert reloaded.is_transcript_extracted(VID2)
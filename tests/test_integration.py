@@ -7,7 +7,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from study.cli.ingest import _run_pipeline, _save_ai_response, _load_ai_response
-from study.core.config import Settings
+from study.core.config import Settings, Target
 from study.core.models import AIResponse, Concept, TranscriptResult, TranscriptSegment
 from study.core.state import ProcessingStateManager
 from study.obsidian.frontmatter import parse_frontmatter
@@ -297,3 +297,143 @@ class TestConfigCommand:
         })
         assert result.exit_code == 0
         assert "****" in result.output
+
+
+class TestVaultTargets:
+    @patch("study.cli.ingest.create_backend")
+    def test_one_extraction_fans_out_to_targets(self, mock_create_backend, tmp_path):
+        mock_backend = MagicMock()
+        mock_backend.process_transcript.side_effect = lambda text, title: _make_ai_response()
+        mock_create_backend.return_value = mock_backend
+
+        settings = _make_settings(tmp_path)
+        vaults = {name: tmp_path / name for name in ("estudos", "notes", "arquivo")}
+        for path in vaults.values():
+            path.mkdir()
+        settings.vault_targets = [
+            Target(vaults["estudos"], "pt-BR"),
+            Target(vaults["notes"], "en"),
+            Target(vaults["arquivo"], "pt-BR"),
+        ]
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "processing_state.json")
+
+        counts = _run_pipeline([_make_transcript()], settings, storage, state, False, False)
+
+        assert counts["transcripts_saved"] == 1
+        assert counts["ai_processed"] == 2
+        assert counts["notes_generated"] == 3
+        langs = [c.args[0].content_lang for c in mock_create_backend.call_args_list]
+        assert langs == ["pt-BR", "en"]
+        assert (settings.data_dir / "ai_responses" / "pt-BR" / "abc123.json").exists()
+        assert (settings.data_dir / "ai_responses" / "en" / "abc123.json").exists()
+        for target in settings.vault_targets:
+            assert Vault(target.vault_path).video_note_exists("abc123")
+            assert state.is_notes_generated("abc123", target.key)
+        # Every target is done, so the top-level stages are too
+        assert state.is_notes_generated("abc123")
+
+        # A second run has nothing left to do for any target
+        counts = _run_pipeline([_make_transcript()], settings, storage, state, False, False)
+        assert counts["ai_processed"] == 0
+        assert counts["notes_generated"] == 0
+        assert mock_backend.process_transcript.call_count == 2
+
+    @patch("study.cli.ingest.create_backend")
+    def test_finished_targets_are_not_pending(self, mock_create_backend, tmp_path):
+        from typer.testing import CliRunner
+        from study.cli.main import app
+
+        mock_create_backend.return_value.process_transcript.return_value = _make_ai_response()
+        settings = _make_settings(tmp_path)
+        pt_vault, en_vault = tmp_path / "estudos", tmp_path / "notes"
+        pt_vault.mkdir()
+        en_vault.mkdir()
+        settings.vault_targets = [Target(pt_vault, "pt-BR"), Target(en_vault, "en")]
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "processing_state.json")
+
+        _run_pipeline([_make_transcript()], settings, storage, state, False, False)
+
+        assert state.pending_ai_processing() == []
+        assert state.is_notes_generated("abc123")
+        env = {"VAULT_PATH": str(settings.vault_path), "DATA_DIR": str(settings.data_dir)}
+        result = CliRunner().invoke(app, ["status"], env=env)
+        assert "1 completed, 0 pending" in result.output
+        with patch("study.cli.process.create_backend") as process_backend:
+            result = CliRunner().invoke(app, ["process", "run", "--all"], env=env)
+        assert "No pending transcripts" in result.output
+        process_backend.assert_not_called()
+
+    VIDEO_ID = "dQw4w9WgXcQ"
+    URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+
+    def _invoke(self, tmp_path, args, *targets):
+        from typer.testing import CliRunner
+        from study.cli.main import app
+
+        for lang, path in targets:
+            args += ["--target", f"{lang}={path}"]
+        return CliRunner().invoke(app, args, env={
+            "VAULT_PATH": str(tmp_path / "vault"),
+            "DATA_DIR": str(tmp_path / "data"),
+            "CLAUDE_BACKEND": "api",
+            "ANTHROPIC_API_KEY": "sk-test-key",
+            "CONTENT_LANG": "pt-BR",
+        })
+
+    @patch("study.cli.ingest.create_backend")
+    def test_new_target_reuses_saved_response(self, mock_create_backend, tmp_path):
+        mock_backend = MagicMock()
+        mock_backend.process_transcript.return_value = _make_ai_response()
+        mock_create_backend.return_value = mock_backend
+
+        settings = _make_settings(tmp_path)
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "processing_state.json")
+        settings.vault_targets = [Target(first, "pt-BR")]
+        _run_pipeline([_make_transcript(self.VIDEO_ID)], settings, storage, state, False, False)
+
+        # The video is already extracted, so it never comes out of the listing
+        targets = (("pt-BR", first), ("pt-BR", second))
+        result = self._invoke(tmp_path, ["ingest", "video", self.URL], *targets)
+        assert result.exit_code == 0, result.output
+        assert not Vault(second).video_note_exists(self.VIDEO_ID)
+
+        result = self._invoke(tmp_path, ["process", "run", "--all"], *targets)
+
+        assert result.exit_code == 0, result.output
+        assert mock_backend.process_transcript.call_count == 1
+        assert Vault(second).video_note_exists(self.VIDEO_ID)
+        reloaded = ProcessingStateManager(settings.data_dir / "processing_state.json")
+        assert reloaded.is_notes_generated(self.VIDEO_ID, Target(second, "pt-BR").key)
+
+    @patch("study.cli.ingest.create_backend")
+    def test_targets_reuse_responses_from_before_targets(self, mock_create_backend, tmp_path):
+        mock_backend = MagicMock()
+        mock_backend.process_transcript.return_value = _make_ai_response()
+        mock_create_backend.return_value = mock_backend
+
+        settings = _make_settings(tmp_path)
+        storage = TranscriptStorage(settings.data_dir)
+        state = ProcessingStateManager(settings.data_dir / "processing_state.json")
+        _run_pipeline([_make_transcript(self.VIDEO_ID)], settings, storage, state, False, False)
+        assert (settings.data_dir / "ai_responses" / f"{self.VIDEO_ID}.json").exists()
+        pt_vault, en_vault = tmp_path / "estudos", tmp_path / "notes"
+        pt_vault.mkdir()
+        en_vault.mkdir()
+
+        result = self._invoke(
+            tmp_path, ["process", "run", "--all"], ("pt-BR", pt_vault), ("en", en_vault)
+        )
+
+        assert result.exit_code == 0, result.output
+        # Only the new language is paid for; pt-BR reuses the old response
+        langs = [c.args[0].content_lang for c in mock_create_backend.call_args_list]
+        assert langs == ["pt-BR", "en"]
+        assert mock_backend.process_transcript.call_count == 2
+        assert Vault(pt_vault).video_note_exists(self.VIDEO_ID)
+        assert Vault(en_vault).video_note_exists(self.VIDEO_ID)
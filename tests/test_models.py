@@ -1,14 +1,66 @@
 """Tests for domain models."""
 
+import pickle
+
+import pytest
+
 from study.core.models import (
     AIResponse,
+    Chapter,
     Concept,
     ProcessingState,
+    SegmentTable,
     TranscriptResult,
     TranscriptSegment,
 )
 
 
+def _segments(*texts):
+    return [
+        TranscriptSegment(text=text, start=float(i), duration=1.0)
+        for i, text in enumerate(texts)
+    ]
+
+
+class TestSegmentTable:
+    def test_sequence_of_segments(self):
+        segments = _segments("one", "two words", "", "three")
+        table = SegmentTable.from_segments(segments)
+        assert len(table) == 4
+        assert list(table) == segments
+        assert table == segments
+        assert table[1] == segments[1]
+        assert table[-1].text == "three"
+        with pytest.raises(IndexError):
+            table[4]
+
+    def test_full_text_is_the_buffer(self):
+        table = SegmentTable.from_segments(_segments("Hello", "world"))
+        assert table.full_text == "Hello world"
+        assert table.full_text is table.full_text
+
+    def test_slices_are_tables(self):
+        table = SegmentTable.from_segments(_segments("a", "bb", "ccc", "dddd"))
+        part = table[1:3]
+        assert isinstance(part, SegmentTable)
+        assert part == table[1:3] == _segments("a", "bb", "ccc", "dddd")[1:3]
+        assert part.full_text == "bb ccc"
+        assert table[3:1].full_text == ""
+        assert [seg.text for seg in table[::2]] == ["a", "ccc"]
+
+    def test_annotations_interned(self):
+        table = SegmentTable.from_segments(_segments("[Music]", "talk", "[Music]"))
+        assert table[0].text is table[2].text
+
+    def test_dicts_roundtrip_and_pickle(self):
+        table = SegmentTable.from_segments(_segments("x", "y"))
+        assert SegmentTable.from_dicts(table.to_dicts()) == table
+        assert pickle.loads(pickle.dumps(table)) == table
+
+    def test_segments_use_slots(self):
+        assert not hasattr(TranscriptSegment(text="x", start=0.0, duration=1.0), "__dict__")
+
+
 class TestTranscriptResult:
     def test_full_text_concatenates(self):
         result = TranscriptResult(
@@ -46,6 +98,42 @@ class TestTranscriptResult:
         )
         assert result.id == "vid1"
         assert len(result.transcript) == 1
+        assert isinstance(result.transcript, SegmentTable)
+
+    def test_list_assigned_later_still_works(self):
+        result = TranscriptResult(
+            id="vid1",
+            title="Title",
+            channel="Channel",
+            upload_date="20240101",
+            webpage_url="https://example.com",
+        )
+        result.transcript = _segments("late", "list")
+        assert result.full_text == "late list"
+
+    def test_chapter_segments(self):
+        segments = [
+            TranscriptSegment(text=str(i), start=float(start), duration=1.0)
+            for i, start in enumerate([0, 5, 10, 60, 61, 125])
+        ]
+        result = TranscriptResult(
+            id="vid1",
+            title="Title",
+            channel="Channel",
+            upload_date="20240101",
+            webpage_url="https://example.com",
+            transcript=segments,
+            chapters=[
+                Chapter(title="Intro", start=0.0, end=60.0),
+                Chapter(title="Middle", start=60.0, end=120.0),
+                Chapter(title="Empty", start=120.0, end=125.0),
+                Chapter(title="End", start=125.0, end=200.0),
+            ],
+        )
+        sections = result.chapter_segments()
+        assert [[seg.text for seg in segs] for _, segs in sections] == [
+            ["0", "1", "2"], ["3", "4"], [], ["5"],
+        ]
 
 
 class TestAIResponse:
@@ -0,0 +1,63 @@
+"""Tests for the negative cache of unavailable videos."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from yt_dlp.utils import DownloadError, ExtractorError, GeoRestrictedError
+
+from study.transcript.negative_cache import NO_CAPTIONS, NegativeCache, classify_error
+
+
+class TestClassifyError:
+    def test_permanent_errors(self):
+        assert classify_error(Exception("ERROR: [youtube] x: Private video")) == "private"
+        assert classify_error(
+            Exception("Join this channel to get access to members-only content")
+        ) == "members_only"
+        assert classify_error(
+            Exception("The uploader has not made this video available in your country")
+        ) == "region_blocked"
+        assert classify_error(Exception("ERROR: [youtube] x: Video unavailable")) == "removed"
+
+    def test_geo_restricted_cause(self):
+        cause = GeoRestrictedError("blocked")
+        error = DownloadError("ERROR: blocked", exc_info=(type(cause), cause, None))
+        assert classify_error(error) == "region_blocked"
+
+    def test_transient_errors(self):
+        assert classify_error(Exception("HTTP Error 503: Service Unavailable")) is None
+        assert classify_error(ExtractorError("This live event will begin in 3 hours")) is None
+        assert classify_error(ExtractorError(
+            "Video unavailable. This content isn't available, try again later.", expected=True
+        )) is None
+
+
+class TestNegativeCache:
+    def test_add_persists(self, tmp_path: Path):
+        path = tmp_path / "negative_cache.json"
+        NegativeCache(path).add("vid1", "private")
+        entry = NegativeCache(path).get("vid1")
+        assert entry.reason == "private"
+
+    def test_expires_at_recheck_time(self, tmp_path: Path):
+        cache = NegativeCache(tmp_path / "n.json")
+        cache.add("vid1", NO_CAPTIONS)
+        later = datetime.now(timezone.utc) + timedelta(days=15)
+        assert cache.get("vid1") is not None
+        assert cache.get("vid1", now=later) is None
+
+    def test_no_captions_only_for_same_languages(self, tmp_path: Path):
+        path = tmp_path / "n.json"
+        NegativeCache(path).add("vid1", NO_CAPTIONS, langs="en,en-orig")
+        NegativeCache(path).add("vid2", "private")
+        cache = NegativeCache(path)
+        assert cache.get("vid1", langs="en,en-orig") is not None
+        assert cache.get("vid1", langs="pt") is None
+        assert cache.get("vid2", langs="pt") is not None
+
+    def test_remove(self, tmp_path: Path):
+        cache = NegativeCache(tmp_path / "n.json")
+        cache.add("vid1", "removed")
+        cache.remove("vid1")
+        assert cache.get("vid1") is None
+        assert len(cache) == 0
@@ -7,9 +7,17 @@ import pytest
 
 from study.core.models import TranscriptSegment, TranscriptResult
 from study.transcript.parser import (
+    ROLLING_MAX_GAP,
+    coalesce_segments,
+    dedupe_segments,
+    iter_json3_events,
+    iter_json3_segments,
+    iter_subtitle_file,
     parse_json3,
+    parse_json3_text,
     parse_vtt,
     parse_srt,
+    parse_subtitle_data,
     parse_subtitle_file,
     result_to_dict,
 )
@@ -39,6 +47,66 @@ class TestParseJson3:
         assert segments[1].duration == 2.5
 
 
+class TestStreamingJson3:
+    DOC = {
+        "wireMagic": "pb3",
+        "pens": [{}],
+        "wsWinStyles": [{"mhModeHint": 2}],
+        "events": [
+            {"tStartMs": 1234567, "dDurationMs": 8, "segs": [{"utf8": "caf\u00e9 \"ok\""}]},
+            {"tStartMs": 0, "wWinId": 1},
+            {"tStartMs": 2000, "dDurationMs": 10, "segs": [{"utf8": "a, b"}, {"utf8": "]}"}]},
+        ],
+        "trailing": {"events": [{"segs": [{"utf8": "nested"}]}]},
+    }
+
+    @staticmethod
+    def _chunks(text, size):
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    def test_any_chunk_size_matches_whole_parse(self):
+        text = json.dumps(self.DOC, indent=1)
+        expected = parse_json3_text(text)
+        assert [s.text for s in expected] == ['café "ok"', "a, b]}"]
+        assert expected[0].start == 1234.567
+        for size in (1, 2, 3, 7, 64):
+            assert list(iter_json3_segments(self._chunks(text, size))) == expected
+
+    def test_yields_before_reading_everything(self):
+        text = json.dumps(SAMPLE_JSON3_LONG)
+        chunks = iter(self._chunks(text, 16))
+        segments = iter_json3_segments(chunks)
+        assert next(segments).text == "line 0"
+        assert next(chunks, None) is not None
+
+    def test_document_without_events(self):
+        assert list(iter_json3_events(['{"wireMagic": "pb3"}'])) == []
+        assert list(iter_json3_events(["{ }"])) == []
+
+    def test_malformed_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json3_events(['{"events": [{"segs": []}, ']))
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json3_events(["[]"]))
+
+    def test_iter_subtitle_file_is_lazy(self, json3_file):
+        segments = iter_subtitle_file(json3_file, "json3")
+        assert not isinstance(segments, list)
+        assert list(segments) == parse_json3(json3_file)
+
+    def test_iter_subtitle_file_unsupported_format_raises(self, json3_file):
+        with pytest.raises(ValueError, match="Unsupported subtitle format"):
+            iter_subtitle_file(json3_file, "ass")
+
+
+SAMPLE_JSON3_LONG = {
+    "events": [
+        {"tStartMs": i * 1000, "dDurationMs": 1000, "segs": [{"utf8": f"line {i}"}]}
+        for i in range(1000)
+    ],
+}
+
+
 class TestParseVtt:
     def test_parses_valid_segments(self, vtt_file):
         segments = parse_vtt(vtt_file)
@@ -56,6 +124,190 @@ class TestParseVtt:
         assert segments[0].duration == 3.0
 
 
+@pytest.fixture(params=["memory", "file"])
+def parse_cues(request, tmp_path):
+    """Parse VTT/SRT content in memory (block parser) or from a file (line parser).
+
+    The two paths must agree, so every cue-format case runs through both.
+    """
+    def parse(content: str, fmt: str) -> list[TranscriptSegment]:
+        if request.param == "memory":
+            return parse_subtitle_data(content, fmt)
+        path = tmp_path / f"cues.{fmt}"
+        path.write_text(content, encoding="utf-8")
+        return parse_subtitle_file(path, fmt)
+
+    return parse
+
+
+class TestCueParsing:
+    def test_vtt_cue_settings_and_short_timestamps(self, parse_cues):
+        content = (
+            "WEBVTT\n\nNOTE a comment --> not a cue\n\n"
+            "intro\n01:02.500 --> 01:04.000 align:start position:0%\n<c.colorE5E5E5>Hi</c>\n"
+        )
+        segments = parse_cues(content, "vtt")
+        assert len(segments) == 1
+        assert segments[0].text == "Hi"
+        assert segments[0].start == 62.5
+        assert segments[0].duration == 1.5
+
+    def test_crlf_and_bom(self, vtt_file, srt_file):
+        for path, fmt in ((vtt_file, "vtt"), (srt_file, "srt")):
+            crlf = b"\xef\xbb\xbf" + path.read_bytes().replace(b"\n", b"\r\n")
+            assert parse_subtitle_data(crlf, fmt) == parse_subtitle_file(path, fmt)
+            path.write_bytes(crlf)
+            assert parse_subtitle_data(crlf, fmt) == parse_subtitle_file(path, fmt)
+
+    def test_unnumbered_srt_and_multiline_text(self, parse_cues):
+        content = "00:00:01,000 --> 00:00:02,000\nfirst\nsecond\n\n00:00:02,000 --> 00:00:03,000\nthird"
+        segments = parse_cues(content, "srt")
+        assert [s.text for s in segments] == ["first\nsecond", "third"]
+
+    def test_cue_without_blank_line_before_next_timing(self, parse_cues):
+        content = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\none\n00:00:02.000 --> 00:00:03.000\ntwo\n"
+        assert [s.text for s in parse_cues(content, "vtt")] == ["one", "two"]
+
+    def test_srt_counter_without_blank_line_is_not_text(self, parse_cues):
+        content = (
+            "1\n00:00:01,000 --> 00:00:02,000\nHello\n2\n00:00:02,000 --> 00:00:03,000\nWorld\n"
+            "3\n00:00:03,000 --> 00:00:04,000\n42\n"
+        )
+        assert [s.text for s in parse_cues(content, "srt")] == ["Hello", "World", "42"]
+
+    def test_hours_past_99(self, parse_cues):
+        content = "1\n123:00:00,000 --> 123:00:01,500\nlong\n"
+        [segment] = parse_cues(content, "srt")
+        assert (segment.start, segment.duration) == (442800.0, 1.5)
+
+    def test_malformed_input_is_skipped(self, parse_cues):
+        content = "WEBVTT\n\n" + "99:99 --> garbage\n" * 20000 + "00:00:01.000 --> 00:00:02.000\nok\n"
+        assert [s.text for s in parse_cues(content, "vtt")] == ["ok"]
+
+    def test_whitespace_only_line_does_not_end_cue(self, parse_cues):
+        content = "WEBVTT\n\n00:00:00.160 --> 00:00:02.550 align:start position:0%\n \nhello\n"
+        assert [s.text for s in parse_cues(content, "vtt")] == ["hello"]
+
+    def test_rolling_auto_captions(self, parse_cues):
+        assert [s.text for s in parse_cues(ROLLING_VTT, "vtt")] == [
+            "hello everyone and welcome",
+            "hello everyone and welcome",
+            "hello everyone and welcome\nto the course",
+            "to the course",
+            "to the course\nwe talk about graphs",
+        ]
+
+    def test_iter_subtitle_file_is_lazy(self, srt_file):
+        segments = iter_subtitle_file(srt_file, "srt")
+        assert next(segments).text == "Hello world"
+
+
+ROLLING_VTT = """\
+WEBVTT
+Kind: captions
+Language: en
+
+00:00:00.160 --> 00:00:02.550 align:start position:0%
+ 
+hello<00:00:00.480><c> everyone</c><00:00:00.800><c> and</c><00:00:01.120><c> welcome</c>
+
+00:00:02.550 --> 00:00:02.560 align:start position:0%
+hello everyone and welcome
+ 
+
+00:00:02.560 --> 00:00:05.030 align:start position:0%
+hello everyone and welcome
+to<00:00:02.800><c> the</c><00:00:03.000><c> course</c>
+
+00:00:05.030 --> 00:00:05.040 align:start position:0%
+to the course
+ 
+
+00:00:05.040 --> 00:00:07.000 align:start position:0%
+to the course
+we<00:00:05.300><c> talk</c><00:00:05.600><c> about</c><00:00:06.000><c> graphs</c>
+"""
+
+
+def _seg(text, start, duration):
+    return TranscriptSegment(text=text, start=start, duration=duration)
+
+
+class TestDedupeSegments:
+    def test_collapses_rolling_auto_captions(self):
+        segments, stats = dedupe_segments(parse_subtitle_data(ROLLING_VTT, "vtt"))
+        assert [s.text for s in segments] == [
+            "hello everyone and welcome",
+            "to the course",
+            "we talk about graphs",
+        ]
+        # Hold cues extend the line they repeat; segments no longer overlap
+        assert segments[0].start == 0.16
+        assert segments[0].duration == 2.4
+        assert segments[1].start == 2.56
+        assert segments[1].duration == 2.48
+        assert stats.removed_segments == 2
+        assert stats.removed_chars == stats.input_chars - sum(len(s.text) for s in segments)
+        assert stats.ratio > 0.5
+
+    def test_growing_cue_keeps_only_new_words(self):
+        segments, _ = dedupe_segments([
+            _seg("so today", 0.0, 1.0),
+            _seg("so today we start", 1.0, 1.0),
+            _seg("so today we start with graphs", 2.0, 1.0),
+        ])
+        assert [s.text for s in segments] == ["so today", "we start", "with graphs"]
+
+    def test_clips_overlapping_durations(self):
+        segments, stats = dedupe_segments([_seg("one", 0.0, 5.0), _seg("two", 2.0, 5.0)])
+        assert [(s.start, s.duration) for s in segments] == [(0.0, 2.0), (2.0, 5.0)]
+        assert stats.removed_chars == 0
+
+    def test_repeat_after_gap_is_kept(self):
+        segments, stats = dedupe_segments([
+            _seg("chorus", 0.0, 1.0),
+            _seg("chorus", 1.0 + ROLLING_MAX_GAP + 0.5, 1.0),
+        ])
+        assert [s.text for s in segments] == ["chorus", "chorus"]
+        assert stats.removed_segments == 0
+
+    def test_distinct_captions_untouched(self, srt_file):
+        segments = parse_srt(srt_file)
+        deduped, stats = dedupe_segments(segments)
+        assert deduped == segments
+        assert stats.removed_chars == 0
+
+
+class TestCoalesceSegments:
+    FRAGMENTS = [_seg(f"w{i}", i * 1.0, 1.0) for i in range(10)]
+
+    def test_time_window(self):
+        merged = coalesce_segments(self.FRAGMENTS, max_seconds=3)
+        assert [s.text for s in merged] == ["w0 w1 w2", "w3 w4 w5", "w6 w7 w8", "w9"]
+        assert [(s.start, s.duration) for s in merged[:2]] == [(0.0, 3.0), (3.0, 3.0)]
+
+    def test_char_limit(self):
+        merged = coalesce_segments(self.FRAGMENTS, max_chars=8)
+        assert [s.text for s in merged][:2] == ["w0 w1 w2", "w3 w4 w5"]
+
+    def test_sentence_end_closes_segment(self):
+        merged = coalesce_segments(
+            [_seg("So.", 0.0, 1.0), _seg("Next one", 1.0, 1.0), _seg("ends here?", 2.0, 1.0),
+             _seg("tail", 3.0, 1.0)],
+            max_seconds=60,
+        )
+        assert [s.text for s in merged] == ["So.", "Next one ends here?", "tail"]
+
+    def test_never_crosses_boundary(self):
+        merged = coalesce_segments(self.FRAGMENTS, max_seconds=60, boundaries=[4.0])
+        assert [s.start for s in merged] == [0.0, 4.0]
+        assert merged[0].duration == 4.0
+
+    def test_oversized_fragment_kept_alone(self):
+        merged = coalesce_segments([_seg("a" * 20, 0.0, 1.0), _seg("b", 1.0, 1.0)], max_chars=5)
+        assert [s.text for s in merged] == ["a" * 20, "b"]
+
+
 class TestParseSrt:
     def test_parses_valid_segments(self, srt_file):
         segments = parse_srt(srt_file)
@@ -87,6 +339,36 @@ class TestParseSubtitleFile:
             parse_subtitle_file(json3_file, "ass")
 
 
+class TestParseSubtitleData:
+    def test_json3_bytes(self, json3_file):
+        segments = parse_subtitle_data(json3_file.read_bytes(), "json3")
+        assert [s.text for s in segments] == ["Hello world", "Second line"]
+
+    def test_json3_bytes_split_inside_multibyte_char(self, monkeypatch):
+        monkeypatch.setattr("study.transcript.parser.CHUNK_SIZE", 3)
+        data = b"\xef\xbb\xbf" + json.dumps(
+            {"events": [{"tStartMs": 0, "segs": [{"utf8": "ação"}]}]}, ensure_ascii=False
+        ).encode("utf-8")
+        assert [s.text for s in parse_subtitle_data(data, "json3")] == ["ação"]
+
+    def test_vtt_str(self, vtt_file):
+        segments = parse_subtitle_data(vtt_file.read_text(encoding="utf-8"), "vtt")
+        assert len(segments) == 3
+        assert segments[2].text == "Third with tags"
+
+    def test_srt_bytes_with_bom(self, srt_file):
+        segments = parse_subtitle_data(b"\xef\xbb\xbf" + srt_file.read_bytes(), "srt")
+        assert len(segments) == 3
+        assert segments[0].start == 5.0
+
+    def test_matches_file_parser(self, vtt_file):
+        assert parse_subtitle_data(vtt_file.read_bytes(), "vtt") == parse_vtt(vtt_file)
+
+    def test_unsupported_format_raises(self):
+        with pytest.raises(ValueError, match="Unsupported subtitle format"):
+            parse_subtitle_data("", "ass")
+
+
 class TestResultToDict:
     def test_includes_full_text(self):
         result = TranscriptResult(
@@ -0,0 +1,114 @@
+"""Tests for the shared request rate limiter."""
+
+import threading
+import time
+
+import pytest
+
+from study.transcript.ratelimit import RateLimiter, is_rate_limited, with_backoff
+
+
+class TestRateLimiter:
+    def test_disabled_does_not_wait(self):
+        limiter = RateLimiter(0)
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+    def test_spaces_requests(self):
+        limiter = RateLimiter(20)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        # First request is immediate, the next four are 50ms apart
+        assert time.monotonic() - start >= 0.19
+
+    def test_ceiling_is_global_across_threads(self):
+        limiter = RateLimiter(20)
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - start >= 0.19
+
+    def test_throttled_halves_rate_and_pauses(self):
+        limiter = RateLimiter(2.0, cooldown=0.1)
+        limiter.throttled()
+        assert limiter.rate == 1.0
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_throttles_during_pause_count_once(self):
+        limiter = RateLimiter(2.0, cooldown=10)
+        limiter.throttled()
+        limiter.throttled()
+        assert limiter.rate == 1.0
+        assert limiter.throttle_count == 1
+
+    def test_success_recovers_up_to_ceiling(self):
+        limiter = RateLimiter(2.0, increase=0.5, cooldown=0)
+        limiter.throttled()
+        limiter.succeeded()
+        assert limiter.rate == 1.5
+        for _ in range(5):
+            limiter.succeeded()
+        assert limiter.rate == 2.0
+
+    def test_disabled_ceiling_throttles_from_fallback(self):
+        limiter = RateLimiter(0, cooldown=0)
+        limiter.succeeded()
+        assert limiter.rate == 0
+        limiter.throttled()
+        assert limiter.rate == 0.5
+
+
+class TestWithBackoff:
+    def test_retries_rate_limited_requests(self):
+        limiter = RateLimiter(100, cooldown=0.01)
+        calls = []
+
+        def request():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("ERROR: HTTP Error 429: Too Many Requests")
+            return "ok"
+
+        assert with_backoff(limiter, request) == "ok"
+        assert len(calls) == 3
+        assert limiter.throttle_count == 2
+
+    def test_other_errors_not_retried(self):
+        limiter = RateLimiter(0)
+        calls = []
+
+        def request():
+            calls.append(1)
+            raise RuntimeError("Video unavailable")
+
+        with pytest.raises(RuntimeError, match="unavailable"):
+            with_backoff(limiter, request)
+        assert len(calls) == 1
+
+    def test_gives_up_after_retries(self):
+        limiter = RateLimiter(100, cooldown=0.001)
+
+        def request():
+            raise RuntimeError("HTTP Error 429")
+
+        with pytest.raises(RuntimeError, match="429"):
+            with_backoff(limiter, request, retries=2)
+        assert limiter.throttle_count == 2
+
+
+class TestIsRateLimited:
+    def test_detects_throttling_messages(self):
+        assert is_rate_limited(Exception("ERROR: HTTP Error 429: Too Many Requests"))
+        assert is_rate_limited(Exception("Sign in to confirm you're not a bot"))
+        assert is_rate_limited(Exception(
+            "Video unavailable. This content isn't available, try again later."
+        ))
+        assert not is_rate_limited(Exception("HTTP Error 503: Service Unavailable"))
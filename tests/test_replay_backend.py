@@ -0,0 +1,164 @@
+"""Tests for the record/replay extractor backends."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from study.core.config import Settings
+from study.transcript.backends import (
+    RecordingBackend,
+    ReplayBackend,
+    YtDlpBackend,
+    create_extractor_backend,
+)
+from study.transcript.extractor import iter_transcripts
+from study.transcript.negative_cache import NegativeCache
+from study.transcript.retry import RetryQueue
+
+SAMPLE_JSON3 = {
+    "events": [
+        {"tStartMs": 0, "dDurationMs": 2000, "segs": [{"utf8": "Hello"}]},
+        {"tStartMs": 2000, "dDurationMs": 2000, "segs": [{"utf8": "world"}]},
+    ],
+}
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return Settings(
+        vault_path=tmp_path,
+        claude_backend="api",
+        anthropic_api_key="test-key",
+        claude_model="test-model",
+        transcript_lang="en",
+        subtitle_format="json3",
+        content_lang="pt-BR",
+        data_dir=tmp_path / "data",
+        archive_file=tmp_path / "data" / "archive.txt",
+        verbose=False,
+        request_rate=0.0,
+        metadata_cache_ttl=0,
+    )
+
+
+@pytest.fixture
+def recording(tmp_path) -> Path:
+    directory = tmp_path / "replay"
+    directory.mkdir()
+    for video_id, upload_date in (("vid00000001", "20240101"), ("vid00000002", "20240201")):
+        info = {
+            "id": video_id,
+            "title": f"Video {video_id[-1]}",
+            "channel": "Replay Channel",
+            "upload_date": upload_date,
+            "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+        }
+        (directory / f"{video_id}.info.json").write_text(json.dumps(info))
+        (directory / f"{video_id}.en.json3").write_text(json.dumps(SAMPLE_JSON3))
+    return directory
+
+
+class TestReplayBackend:
+    @pytest.mark.parametrize("capture", ["file", "memory"])
+    def test_replays_channel_listing(self, settings, recording, capture):
+        settings.subtitle_capture = capture
+        backend = ReplayBackend(recording)
+
+        results = list(iter_transcripts(
+            ["https://www.youtube.com/@replay"], settings, backend=backend
+        ))
+
+        assert [r.id for r in results] == ["vid00000002", "vid00000001"]
+        assert results[0].full_text == "Hello world"
+        assert results[0].language == "en"
+
+    def test_recorded_listing_order(self, settings, recording):
+        (recording / "listings.json").write_text(json.dumps({
+            "https://www.youtube.com/@replay": ["vid00000001"],
+        }))
+        results = list(iter_transcripts(
+            ["https://www.youtube.com/@replay/"], settings, backend=ReplayBackend(recording)
+        ))
+        assert [r.id for r in results] == ["vid00000001"]
+
+    def test_single_video_url(self, settings, recording):
+        results = list(iter_transcripts(
+            ["https://www.youtube.com/watch?v=vid00000001"],
+            settings,
+            backend=ReplayBackend(recording),
+        ))
+        assert [r.title for r in results] == ["Video 1"]
+
+    def test_recorded_failures(self, settings, recording, tmp_path):
+        (recording / "failures.json").write_text(json.dumps({"vid00000002": "Private video"}))
+        unavailable = NegativeCache(tmp_path / "negative_cache.json")
+
+        results = list(iter_transcripts(
+            ["https://www.youtube.com/@replay"],
+            settings,
+            backend=ReplayBackend(recording),
+            unavailable=unavailable,
+        ))
+
+        assert [r.id for r in results] == ["vid00000001"]
+        assert unavailable.get("vid00000002").reason == "private"
+
+    def test_injected_failures_are_transient(self, settings, recording, tmp_path):
+        retries = RetryQueue(tmp_path / "retry_queue.json")
+        backend = ReplayBackend(recording, failure_rate=1.0, seed=1)
+
+        results = list(iter_transcripts(
+            ["https://www.youtube.com/watch?v=vid00000001"],
+            settings,
+            backend=backend,
+            retries=retries,
+        ))
+
+        assert results == []
+        assert "503" in retries.get("vid00000001").last_error
+
+
+class TestRecordingBackend:
+    def test_record_then_replay(self, settings, recording, tmp_path):
+        out = tmp_path / "recorded"
+        recorder = RecordingBackend(out, ReplayBackend(recording))
+        list(iter_transcripts(["https://www.youtube.com/@replay"], settings, backend=recorder))
+
+        assert json.loads((out / "listings.json").read_text()) == {
+            "https://www.youtube.com/@replay": ["vid00000002", "vid00000001"],
+        }
+        assert (out / "vid00000001.info.json").exists()
+        assert (out / "vid00000001.en.json3").exists()
+
+        replayed = list(iter_transcripts(
+            ["https://www.youtube.com/@replay"], settings, backend=ReplayBackend(out)
+        ))
+        assert [r.id for r in replayed] == ["vid00000002", "vid00000001"]
+
+    def test_records_memory_captured_tracks(self, settings, recording, tmp_path):
+        settings.subtitle_capture = "memory"
+        out = tmp_path / "recorded"
+        recorder = RecordingBackend(out, ReplayBackend(recording))
+        list(iter_transcripts(
+            ["https://www.youtube.com/watch?v=vid00000001"], settings, backend=recorder
+        ))
+        assert json.loads((out / "vid00000001.en.json3").read_text()) == SAMPLE_JSON3
+
+
+class TestCreateExtractorBackend:
+    def test_default_is_yt_dlp(self, settings):
+        assert isinstance(create_extractor_backend(settings), YtDlpBackend)
+
+    def test_replay(self, settings, tmp_path):
+        settings.extractor_backend = "replay"
+        settings.replay_dir = tmp_path
+        settings.replay_latency = 0.5
+        backend = create_extractor_backend(settings)
+        assert isinstance(backend, ReplayBackend)
+        assert backend.latency == 0.5
+
+    def test_unknown_raises(self, settings):
+        settings.extractor_backend = "bogus"
+        with pytest.raises(ValueError, match="Unknown extractor backend"):
+            create_extractor_backend(settings)
@@ -0,0 +1,63 @@
+"""Tests for the persistent retry queue."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from study.transcript.retry import RetryQueue
+
+
+class TestRetryQueue:
+    def test_record_failure_persists(self, tmp_path: Path):
+        path = tmp_path / "retry_queue.json"
+        queue = RetryQueue(path)
+        queue.record_failure("vid1", "https://youtu.be/vid1", "HTTP Error 503")
+
+        reloaded = RetryQueue(path)
+        entry = reloaded.get("vid1")
+        assert entry.url == "https://youtu.be/vid1"
+        assert entry.attempts == 1
+        assert entry.last_error == "HTTP Error 503"
+
+    def test_backoff_doubles(self, tmp_path: Path):
+        queue = RetryQueue(tmp_path / "q.json", base_delay=60, max_delay=3600)
+        before = datetime.now(timezone.utc)
+        queue.record_failure("vid1", "u", "err")
+        first = datetime.fromisoformat(queue.get("vid1").next_attempt) - before
+        queue.record_failure("vid1", "u", "err")
+        second = datetime.fromisoformat(queue.get("vid1").next_attempt) - before
+
+        assert timedelta(seconds=60) <= first < timedelta(seconds=62)
+        assert timedelta(seconds=120) <= second < timedelta(seconds=122)
+
+    def test_backoff_is_capped(self, tmp_path: Path):
+        queue = RetryQueue(tmp_path / "q.json", base_delay=60, max_delay=100)
+        before = datetime.now(timezone.utc)
+        for _ in range(4):
+            queue.record_failure("vid1", "u", "err")
+        delay = datetime.fromisoformat(queue.get("vid1").next_attempt) - before
+        assert delay < timedelta(seconds=102)
+
+    def test_due_only_returns_expired_entries(self, tmp_path: Path):
+        queue = RetryQueue(tmp_path / "q.json", base_delay=60)
+        queue.record_failure("vid1", "u1", "err")
+        queue.record_failure("vid2", "u2", "err")
+        queue.record_failure("vid2", "u2", "err")
+
+        assert queue.due() == []
+        later = datetime.now(timezone.utc) + timedelta(seconds=90)
+        assert [e.video_id for e in queue.due(later)] == ["vid1"]
+
+    def test_gives_up_after_max_attempts(self, tmp_path: Path):
+        queue = RetryQueue(tmp_path / "q.json", max_attempts=2)
+        queue.record_failure("vid1", "u", "err")
+        queue.record_failure("vid1", "u", "err")
+        assert queue.get("vid1") is None
+        assert len(queue) == 0
+
+    def test_remove(self, tmp_path: Path):
+        path = tmp_path / "q.json"
+        queue = RetryQueue(path)
+        queue.record_failure("vid1", "u", "err")
+        queue.remove("vid1")
+        queue.remove("missing")
+        assert RetryQueue(path).get("vid1") is None
@@ -0,0 +1,102 @@
+"""Tests for the shared JSON serialization layer."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from study.core import serialization
+from study.core.models import (
+    AIResponse,
+    Chapter,
+    Concept,
+    ProcessingState,
+    TranscriptResult,
+    TranscriptSegment,
+)
+from study.core.serialization import (
+    ai_response_from_dict,
+    ai_response_to_dict,
+    dumps,
+    loads,
+    read_json,
+    state_from_dict,
+    state_to_dict,
+    transcript_from_dict,
+    transcript_to_dict,
+    write_json,
+)
+
+
+@pytest.fixture
+def result():
+    return TranscriptResult(
+        id="abc123",
+        title="Aula de Grafos — Introdução",
+        channel="Canal",
+        upload_date="20240615",
+        webpage_url="https://www.youtube.com/watch?v=abc123",
+        transcript=[
+            TranscriptSegment(text="Olá, pessoal", start=0.0, duration=1.5),
+            TranscriptSegment(text="[Música]", start=1.5, duration=2.0),
+        ],
+        language="pt",
+        alt_transcripts={"en": [TranscriptSegment(text="Hi all", start=0.0, duration=1.5)]},
+        chapters=[Chapter(title="Início", start=0.0, end=3.5)],
+    )
+
+
+class TestRoundTrip:
+    def test_transcript(self, result):
+        data = loads(dumps(transcript_to_dict(result)))
+        assert data["full_text"] == "Olá, pessoal [Música]"
+        assert transcript_from_dict(data) == result
+
+    def test_ai_response(self):
+        response = AIResponse(
+            tldr="Resumo",
+            summary="Texto",
+            concepts=[Concept(name="Grafo", definition="Vértices e arestas")],
+            chapter_summaries=[{"title": "Início", "summary": "..."}],
+        )
+        assert ai_response_from_dict(loads(dumps(ai_response_to_dict(response)))) == response
+
+    def test_state(self):
+        state = ProcessingState(video_id="vid1", transcript_extracted=True,
+                                last_processed="2024-06-15T10:00:00")
+        data = state_to_dict(state)
+        assert "targets" not in data
+        assert state_from_dict("vid1", loads(dumps(data))) == state
+
+    def test_state_with_targets(self):
+        targets = {"main:pt": {"ai_processed": True, "notes_generated": False}}
+        state = ProcessingState(video_id="vid1", targets=targets)
+        assert state_to_dict(state)["targets"] == targets
+
+    def test_file(self, tmp_path: Path, result):
+        path = tmp_path / "abc123.json"
+        write_json(path, transcript_to_dict(result))
+        assert transcript_from_dict(read_json(path)) == result
+
+
+class TestFileFormat:
+    def test_indented_utf8(self, result):
+        text = dumps(transcript_to_dict(result)).decode("utf-8")
+        assert "Introdução" in text
+        assert '\n  "id": "abc123"' in text
+
+    def test_compact(self):
+        assert dumps({"a": [1, 2]}, indent=False) == b'{"a":[1,2]}'
+
+    def test_readable_by_stdlib(self, tmp_path: Path, result):
+        path = tmp_path / "abc123.json"
+        write_json(path, transcript_to_dict(result))
+        assert json.loads(path.read_text(encoding="utf-8"))["title"] == result.title
+
+    def test_stdlib_fallback_matches(self, monkeypatch, result):
+        data = transcript_to_dict(result)
+        encoded = dumps(data)
+        monkeypatch.setattr(serialization, "CODEC", "json")
+        fallback = dumps(data)
+        assert loads(fallback) == loads(encoded) == data
+        assert loads(encoded) == json.loads(encoded)
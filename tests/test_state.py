@@ -77,3 +77,48 @@ class TestProcessingStateManager:
         mgr = ProcessingStateManager(state_file)
         mgr.update("vid1", transcript_extracted=True)
         assert state_file.exists()
+
+    def test_update_many_saves_once(self, tmp_path: Path):
+        state_file = tmp_path / "state.json"
+        mgr = ProcessingStateManager(state_file)
+        mgr.update_many(["vid1", "vid2"], transcript_extracted=True)
+
+        data = json.loads(state_file.read_text())
+        assert data["vid1"]["transcript_extracted"] is True
+        assert data["vid2"]["transcript_extracted"] is True
+        assert data["vid1"]["last_processed"] == data["vid2"]["last_processed"]
+
+    def test_target_stages_tracked_separately(self, tmp_path: Path):
+        state_file = tmp_path / "state.json"
+        mgr = ProcessingStateManager(state_file)
+        mgr.update("vid1", transcript_extracted=True)
+        mgr.update("vid1", target="en:/vaults/notes", ai_processed=True, notes_generated=True)
+
+        reloaded = ProcessingStateManager(state_file)
+        assert reloaded.is_ai_processed("vid1", "en:/vaults/notes")
+        assert reloaded.is_notes_generated("vid1", "en:/vaults/notes")
+        assert not reloaded.is_ai_processed("vid1", "pt-BR:/vaults/estudos")
+        assert not reloaded.is_ai_processed("vid1")
+        assert reloaded.pending_ai_processing("pt-BR:/vaults/estudos") == ["vid1"]
+        assert reloaded.pending_ai_processing("en:/vaults/notes") == []
+
+    def test_pending_for_target_includes_missing_notes(self, tmp_path: Path):
+        mgr = ProcessingStateManager(tmp_path / "state.json")
+        mgr.update("vid1", transcript_extracted=True)
+        mgr.update("vid2", transcript_extracted=True)
+        mgr.update("vid1", target="en:/notes", ai_processed=True, notes_generated=True)
+        mgr.update("vid2", target="en:/notes", ai_processed=True)
+
+        assert mgr.pending_for_target("en:/notes") == ["vid2"]
+        assert mgr.pending_for_target("pt-BR:/estudos") == ["vid1", "vid2"]
+
+    def test_complete_targets_sets_top_level_stages(self, tmp_path: Path):
+        mgr = ProcessingStateManager(tmp_path / "state.json")
+        mgr.update("vid1", transcript_extracted=True)
+        mgr.update("vid1", target="en:/notes", ai_processed=True, notes_generated=True)
+        mgr.update("vid1", target="pt-BR:/estudos", ai_processed=True)
+
+        mgr.complete_targets("vid1", ["en:/notes", "pt-BR:/estudos"])
+        assert mgr.is_ai_processed("vid1")
+        assert not mgr.is_notes_generated("vid1")
+        assert mgr.pending_ai_processing() == []
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from study.core.models import TranscriptResult, TranscriptSegment
+from study.core.models import Chapter, TranscriptResult, TranscriptSegment
 from study.transcript.storage import TranscriptStorage
 
 
@@ -55,6 +55,22 @@ class TestTranscriptStorage:
         assert len(loaded.transcript) == 2
         assert loaded.full_text == "Hello world"
 
+    def test_alt_transcripts_roundtrip(self, storage, sample_result):
+        sample_result.language = "en"
+        sample_result.alt_transcripts = {
+            "pt": [TranscriptSegment(text="Olá", start=0.0, duration=1.0)],
+        }
+        storage.save(sample_result)
+        loaded = storage.load("abc123")
+        assert loaded.language == "en"
+        assert loaded.alt_transcripts["pt"][0].text == "Olá"
+
+    def test_chapters_roundtrip(self, storage, sample_result):
+        sample_result.chapters = [Chapter(title="Intro", start=0.0, end=30.0)]
+        storage.save(sample_result)
+        loaded = storage.load("abc123")
+        assert loaded.chapters == [Chapter(title="Intro", start=0.0, end=30.0)]
+
     def test_load_nonexistent_returns_none(self, storage):
         assert storage.load("nonexistent") is None
 
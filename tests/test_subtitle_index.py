@@ -0,0 +1,71 @@
+"""Tests for the subtitle file index."""
+
+from pathlib import Path
+
+from study.transcript.subtitle_index import SubtitleIndex, SubtitleIndexPP, pick_language
+
+
+class TestSubtitleIndex:
+    def test_record_from_requested_subtitles(self, tmp_path: Path):
+        index = SubtitleIndex()
+        index.record({
+            "id": "vid1",
+            "requested_subtitles": {
+                "en": {"filepath": str(tmp_path / "vid1.en.json3")},
+                "pt": {"filepath": str(tmp_path / "vid1.pt.json3")},
+            },
+        })
+        assert index.lookup("vid1", "pt") == tmp_path / "vid1.pt.json3"
+
+    def test_prefers_language_variant_over_other_tracks(self, tmp_path: Path):
+        index = SubtitleIndex()
+        index.add("vid1", "pt", tmp_path / "vid1.pt.vtt")
+        index.add("vid1", "en-orig", tmp_path / "vid1.en-orig.vtt")
+        assert index.lookup("vid1", "en") == tmp_path / "vid1.en-orig.vtt"
+
+    def test_falls_back_to_any_track(self, tmp_path: Path):
+        index = SubtitleIndex()
+        index.add("vid1", "pt", tmp_path / "vid1.pt.vtt")
+        assert index.lookup("vid1", "en") == tmp_path / "vid1.pt.vtt"
+
+    def test_lookup_missing(self):
+        assert SubtitleIndex().lookup("vid1", "en") is None
+
+    def test_scan(self, tmp_path: Path):
+        (tmp_path / "vid1.en.json3").write_text("{}")
+        (tmp_path / "vid2.pt.srt").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+        index = SubtitleIndex()
+        index.scan(tmp_path)
+        assert index.lookup("vid1", "en") == tmp_path / "vid1.en.json3"
+        assert index.lookup("vid2", "en") == tmp_path / "vid2.pt.srt"
+        assert index.lookup("notes", "en") is None
+
+    def test_pop(self, tmp_path: Path):
+        index = SubtitleIndex()
+        index.add("vid1", "en", tmp_path / "vid1.en.vtt")
+        assert index.pop("vid1") == [tmp_path / "vid1.en.vtt"]
+        assert index.lookup("vid1", "en") is None
+
+    def test_post_processor_records(self, tmp_path: Path):
+        index = SubtitleIndex()
+        info = {
+            "id": "vid1",
+            "requested_subtitles": {"en": {"filepath": str(tmp_path / "vid1.en.vtt")}},
+        }
+        files, returned = SubtitleIndexPP(index).run(info)
+        assert files == []
+        assert returned is info
+        assert index.lookup("vid1", "en") == tmp_path / "vid1.en.vtt"
+
+
+class TestPickLanguage:
+    def test_follows_priority_list(self):
+        assert pick_language(["pt", "en-orig"], ["en", "pt"]) == "en-orig"
+        assert pick_language(["pt", "es"], ["en", "es"]) == "es"
+
+    def test_falls_back_to_first(self):
+        assert pick_language(["de", "fr"], ["en", "*"]) == "de"
+
+    def test_empty(self):
+        assert pick_language([], ["en"]) is None
@@ -1,4 +1,4 @@
-from study.core.models import AIResponse, Concept, TranscriptResult
+from study.core.models import AIResponse, Chapter, Concept, TranscriptResult
 from study.obsidian.frontmatter import parse_frontmatter
 from study.obsidian.vault import Vault
 from study.obsidian.video_note import create_video_note
@@ -67,3 +67,27 @@ class TestCreateVideoNote:
         path1 = create_video_note(vault, _make_transcript(), _make_ai_response())
         path2 = create_video_note(vault, _make_transcript(), _make_ai_response())
         assert path1 == path2
+
+    def test_chapter_sections_with_timestamp_links(self, tmp_path):
+        vault = Vault(tmp_path)
+        vault.ensure_structure()
+        transcript = _make_transcript()
+        transcript.chapters = [
+            Chapter(title="Intro", start=0.0, end=95.0),
+            Chapter(title="Deep dive", start=3725.0, end=7200.0),
+        ]
+        response = _make_ai_response()
+        response.chapter_summaries = ["", "Chapter two summary."]
+        path = create_video_note(vault, transcript, response)
+        _, body = parse_frontmatter(path.read_text(encoding="utf-8"))
+        assert "## Capitulos" in body
+        assert "### [0:00](https://youtube.com/watch?v=abc123&t=0s) Intro" in body
+        assert "### [1:02:05](https://youtube.com/watch?v=abc123&t=3725s) Deep dive" in body
+        assert "Chapter two summary." in body
+        assert body.index("## Capitulos") < body.index("## Conceitos")
+
+    def test_no_chapter_section_without_chapters(self, tmp_path):
+        vault = Vault(tmp_path)
+        vault.ensure_structure()
+        path = create_video_note(vault, _make_transcript(), _make_ai_response())
+        assert "## Capitulos" not in path.read_text(encoding="utf-8")
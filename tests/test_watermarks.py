@@ -0,0 +1,33 @@
+"""Tests for per-channel sync watermarks."""
+
+import json
+from pathlib import Path
+
+from study.transcript.watermarks import ChannelWatermarks
+
+
+class TestChannelWatermarks:
+    def test_get_missing(self, tmp_path: Path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        assert marks.get("https://youtube.com/@chan") is None
+
+    def test_set_and_get(self, tmp_path: Path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        marks.set("https://youtube.com/@chan", "vid9", "20240601")
+        mark = marks.get("https://youtube.com/@chan")
+        assert mark.video_id == "vid9"
+        assert mark.upload_date == "20240601"
+        assert mark.updated
+
+    def test_key_ignores_trailing_slash(self, tmp_path: Path):
+        marks = ChannelWatermarks(tmp_path / "marks.json")
+        marks.set("https://youtube.com/@chan/", "vid9")
+        assert marks.get("https://youtube.com/@chan").video_id == "vid9"
+
+    def test_survives_restart(self, tmp_path: Path):
+        path = tmp_path / "nested" / "marks.json"
+        ChannelWatermarks(path).set("https://youtube.com/@chan", "vid9", "20240601")
+
+        data = json.loads(path.read_text())
+        assert data["https://youtube.com/@chan"]["video_id"] == "vid9"
+        assert ChannelWatermarks(path).get("https://youtube.com/@chan").upload_date == "20240601"